@@ -0,0 +1,242 @@
+"""
+Ordenação externa (external merge sort) de arquivos binários de registros
+numéricos de largura fixa, maiores que a memória disponível.
+
+O limite de memória vale para o total das duas fases (memória alocada pelos
+buffers; as páginas do `mmap` da entrada pertencem ao cache de arquivos).
+
+Fase 1 (runs): o arquivo de entrada é aberto com `mmap` (via `np.memmap`) e
+dividido em trechos de cerca de `memory_limit / workers` bytes, já que cada
+processo do pool mantém um trecho em memória por vez. Cada trecho é copiado
+para a RAM, ordenado no lugar com `np.sort` e gravado em um arquivo
+temporário (run).
+
+Fase 2 (intercalação): os runs são intercalados (k-way merge) em uma ou mais
+passadas de no máximo MAX_FAN_IN runs, para que os blocos lidos de cada run
+continuem grandes. Cada run é lido sequencialmente em blocos, e os blocos de
+todos os runs, a intercalação de cada passo e o buffer de escrita somam no
+máximo o limite de memória (ver `merge_plan`). Um heap guarda os runs pelo
+último valor do bloco carregado: o menor deles é o limite até o qual todos os
+valores já estão em memória. Um segundo heap guarda os runs pelo primeiro
+valor ainda não emitido, de modo que cada passo só toca os runs que têm
+valores até o limite; os runs cujo bloco acabou leem o próximo. A saída é
+gravada sequencialmente, com buffer.
+"""
+
+import heapq
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Memória total usada pelas fases de ordenação e intercalação (em bytes)
+DEFAULT_MEMORY_LIMIT = 256 * 1024 * 1024
+
+# Tamanho máximo do buffer de escrita do arquivo de saída (em bytes)
+WRITE_BUFFER = 8 * 1024 * 1024
+
+# Número máximo de runs intercalados por passada e tamanho mínimo desejado dos
+# blocos lidos de cada run (em bytes); com pouca memória o fan-in é reduzido
+MAX_FAN_IN = 64
+MIN_BLOCK_BYTES = 1024 * 1024
+
+
+def _sort_run(input_path, dtype, start, stop, run_path):
+    """
+    Ordena os registros [start, stop) do arquivo de entrada em um run.
+
+    Executado nos processos do pool: cada worker abre o próprio mapeamento
+    do arquivo, de modo que apenas os índices e caminhos são serializados.
+    """
+    data = np.memmap(input_path, dtype=dtype, mode="r")
+    run = np.array(data[start:stop])  # cópia para a RAM, leitura sequencial
+    del data
+    run.sort()
+    run.tofile(run_path)
+    return run_path
+
+
+class _RunReader:
+    """
+    Leitura sequencial de um run em blocos de tamanho fixo.
+    """
+
+    def __init__(self, path, dtype, block_records):
+        self.file = open(path, "rb", buffering=0)
+        self.itemsize = np.dtype(dtype).itemsize
+        # Um único buffer por run, reutilizado a cada bloco
+        self.buffer = np.empty(block_records, dtype=dtype)
+        self.block = None
+        self.pos = 0
+        self.next_block()
+
+    def next_block(self):
+        nbytes = self.file.readinto(memoryview(self.buffer).cast("B"))
+        self.block = self.buffer[: nbytes // self.itemsize]
+        self.pos = 0
+        return self.block.size > 0
+
+    def close(self):
+        self.file.close()
+
+
+def merge_runs(run_paths, output_path, dtype, block_records, write_buffer=WRITE_BUFFER):
+    """
+    Intercala runs ordenados em um único arquivo de saída.
+
+    Args:
+        run_paths (list): Arquivos dos runs ordenados
+        output_path (str): Arquivo de saída
+        dtype (str): Tipo NumPy dos registros
+        block_records (int): Registros lidos por bloco de cada run
+        write_buffer (int): Tamanho do buffer de escrita (em bytes)
+    """
+    readers = [_RunReader(path, dtype, block_records) for path in run_paths]
+    # (último valor do bloco carregado, run) e (primeiro valor não emitido, run)
+    last_heap = [(reader.block[-1], i) for i, reader in enumerate(readers) if reader.block.size]
+    head_heap = [(reader.block[0], i) for i, reader in enumerate(readers) if reader.block.size]
+    heapq.heapify(last_heap)
+    heapq.heapify(head_heap)
+
+    with open(output_path, "wb", buffering=write_buffer) as out:
+        while last_heap:
+            # Nenhum bloco ainda não lido tem valor menor que `limit`
+            limit = last_heap[0][0]
+            active = []
+            pieces = []
+            while head_heap and head_heap[0][0] <= limit:
+                _, i = heapq.heappop(head_heap)
+                reader = readers[i]
+                end = reader.pos + int(
+                    np.searchsorted(reader.block[reader.pos :], limit, side="right")
+                )
+                pieces.append(reader.block[reader.pos : end])
+                reader.pos = end
+                active.append(i)
+            if len(pieces) == 1:
+                pieces[0].tofile(out)
+            else:
+                merged = np.concatenate(pieces)
+                merged.sort(kind="stable")
+                merged.tofile(out)
+                del merged
+            del pieces  # o buffer de cada run é reutilizado pelo próximo bloco
+
+            # Os blocos com último valor <= limit foram consumidos por inteiro
+            exhausted = []
+            while last_heap and last_heap[0][0] <= limit:
+                exhausted.append(heapq.heappop(last_heap)[1])
+            for i in exhausted:
+                if readers[i].next_block():
+                    heapq.heappush(last_heap, (readers[i].block[-1], i))
+            for i in active:
+                reader = readers[i]
+                if reader.pos < reader.block.size:
+                    heapq.heappush(head_heap, (reader.block[reader.pos], i))
+
+    for reader in readers:
+        reader.close()
+
+
+def merge_plan(runs, memory_limit, itemsize):
+    """
+    Fan-in, registros por bloco e buffer de escrita da intercalação.
+
+    Em cada passo, os valores até o limite são concatenados (no máximo o total
+    dos blocos) e ordenados com o sort estável, cujo buffer auxiliar não passa
+    desse mesmo tamanho. Por isso os blocos de entrada ocupam um terço do que
+    sobra do limite depois do buffer de escrita.
+
+    Returns:
+        tuple: (runs intercalados por passada, registros por bloco, bytes do
+            buffer de escrita)
+    """
+    write_buffer = min(WRITE_BUFFER, memory_limit // 16)
+    blocks_bytes = (memory_limit - write_buffer) // 3
+    fan_in = max(2, min(MAX_FAN_IN, blocks_bytes // MIN_BLOCK_BYTES, runs))
+    block_records = max(blocks_bytes // (fan_in * itemsize), 1)
+    return fan_in, block_records, write_buffer
+
+
+def external_sort(input_path, output_path, dtype="<i8", memory_limit=DEFAULT_MEMORY_LIMIT,
+                  workers=None, tmp_dir=None):
+    """
+    Ordena um arquivo binário de registros numéricos de largura fixa.
+
+    Args:
+        input_path (str): Arquivo de entrada
+        output_path (str): Arquivo de saída (pode ser o mesmo da entrada)
+        dtype (str): Tipo NumPy dos registros (ex.: "<i8", "<i4", "<f8")
+        memory_limit (int): Memória total, em bytes, de todos os processos na
+            fase 1 e dos blocos de leitura e da intercalação na fase 2
+        workers (int): Número de processos (padrão: os.cpu_count())
+        tmp_dir (str): Diretório dos runs temporários
+
+    Returns:
+        dict: Número de registros, de runs, de passadas de intercalação e
+            tempo (em segundos) de cada fase
+    """
+    dtype = np.dtype(dtype)
+    workers = workers or os.cpu_count()
+    total = os.path.getsize(input_path) // dtype.itemsize
+
+    # Os `workers` processos mantêm um run cada ao mesmo tempo (a ordenação é
+    # feita no lugar), então cada run ocupa uma fração do limite; 1/16 fica
+    # para os demais objetos de cada processo (mapeamento, fatias, resultados)
+    run_bytes = (memory_limit - memory_limit // 16) // workers
+    run_records = max(run_bytes // dtype.itemsize, 1)
+    bounds = [(lo, min(lo + run_records, total)) for lo in range(0, total, run_records)]
+
+    work_dir = tempfile.mkdtemp(prefix="external_sort_", dir=tmp_dir)
+    try:
+        start = time.perf_counter()
+        run_paths = [os.path.join(work_dir, f"run_{i:06d}.bin") for i in range(len(bounds))]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(
+                _sort_run,
+                [input_path] * len(bounds), [dtype.str] * len(bounds),
+                [lo for lo, _ in bounds], [hi for _, hi in bounds], run_paths,
+            ))
+        run_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        passes = 0
+        fan_in, block_records, write_buffer = merge_plan(
+            len(run_paths), memory_limit, dtype.itemsize
+        )
+        while len(run_paths) > fan_in:
+            # Passada intermediária: grupos de `fan_in` runs viram um run cada
+            merged_paths = []
+            for g in range(0, len(run_paths), fan_in):
+                group = run_paths[g : g + fan_in]
+                path = os.path.join(work_dir, f"pass{passes}_{g // fan_in:06d}.bin")
+                if len(group) == 1:
+                    os.replace(group[0], path)
+                else:
+                    merge_runs(group, path, dtype, block_records, write_buffer)
+                    for used in group:
+                        os.remove(used)
+                merged_paths.append(path)
+            run_paths = merged_paths
+            passes += 1
+        if len(run_paths) == 1:
+            shutil.copyfile(run_paths[0], output_path)
+        elif run_paths:
+            merge_runs(run_paths, output_path, dtype, block_records, write_buffer)
+            passes += 1
+        else:
+            open(output_path, "wb").close()
+        merge_time = time.perf_counter() - start
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return {
+        "records": total,
+        "runs": len(bounds),
+        "merge_passes": passes,
+        "run_time": run_time,
+        "merge_time": merge_time,
+    }
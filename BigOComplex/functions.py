@@ -70,10 +70,110 @@ def merge_sort(arr):
     return arr
 
 
+# Tamanho mínimo de um run do natural_merge_sort; runs menores são estendidos com insertion sort
+MIN_RUN = 32
+
+
+def _insertion_sort(arr, lo, hi, start):
+    # Ordena arr[lo:hi] sabendo que arr[lo:start] já está ordenado
+    for i in range(start, hi):
+        value = arr[i]
+        j = i - 1
+        while j >= lo and arr[j] > value:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = value
+
+
+def _find_runs(arr):
+    # Divide a lista em runs ordenados, retornando os limites [0, ..., n] de cada um
+    n = len(arr)
+    bounds = [0]
+    lo = 0
+    while lo < n:
+        hi = lo + 1
+        if hi < n and arr[hi] < arr[lo]:
+            # Run estritamente decrescente: inverte no lugar (mantém a estabilidade)
+            while hi < n and arr[hi] < arr[hi - 1]:
+                hi += 1
+            i, j = lo, hi - 1
+            while i < j:
+                arr[i], arr[j] = arr[j], arr[i]
+                i += 1
+                j -= 1
+        else:
+            while hi < n and arr[hi] >= arr[hi - 1]:
+                hi += 1
+        if hi - lo < MIN_RUN and hi < n:
+            # Run curto: estende até MIN_RUN elementos com insertion sort
+            end = min(n, lo + MIN_RUN)
+            _insertion_sort(arr, lo, end, hi)
+            hi = end
+        bounds.append(hi)
+        lo = hi
+    return bounds
+
+
+def _merge(src, dst, lo, mid, hi):
+    # Mescla src[lo:mid] e src[mid:hi] em dst[lo:hi]
+    if src[mid - 1] <= src[mid]:  # Runs já em ordem: apenas copia
+        for k in range(lo, hi):
+            dst[k] = src[k]
+        return
+    i, j, k = lo, mid, lo
+    while i < mid and j < hi:
+        if src[j] < src[i]:
+            dst[k] = src[j]
+            j += 1
+        else:
+            dst[k] = src[i]
+            i += 1
+        k += 1
+    while i < mid:
+        dst[k] = src[i]
+        i += 1
+        k += 1
+    while j < hi:
+        dst[k] = src[j]
+        j += 1
+        k += 1
+
+
+# O(n log n): Merge Sort bottom-up com detecção de sequências já ordenadas (runs naturais)
+# Usa um único buffer auxiliar alocado uma vez e alterna entre ele e a lista original
+# a cada passada, evitando as fatias `arr[:mid]` / `arr[mid:]` do merge_sort recursivo
+# Best : O(n) Time | O(n) Space (entrada já ordenada ou em ordem decrescente)
+# Average : O(n log n) Time | O(n) Space
+# Worst : O(n log n) Time | O(n) Space
+def natural_merge_sort(arr):
+    bounds = _find_runs(arr)
+    if len(bounds) <= 2:  # Um único run: a lista já está ordenada
+        return arr
+    src, dst = arr, [None] * len(arr)  # Buffer auxiliar alocado uma única vez
+    while len(bounds) > 2:
+        merged = [0]
+        for r in range(0, len(bounds) - 1, 2):
+            lo, mid = bounds[r], bounds[r + 1]
+            if r + 2 < len(bounds):
+                hi = bounds[r + 2]
+                _merge(src, dst, lo, mid, hi)
+            else:
+                hi = mid  # Run sem par nesta passada: copiado como está
+                for k in range(lo, hi):
+                    dst[k] = src[k]
+            merged.append(hi)
+        bounds = merged
+        src, dst = dst, src
+    if src is not arr:  # O resultado final ficou no buffer auxiliar
+        for k in range(len(arr)):
+            arr[k] = src[k]
+    return arr
+
+
 # O(n log n): Ordenação Quick Sort, usa um pivô para dividir e conquistar
-# Best : O(n log n) Time | O(log n) Space
-# Average : O(n log n) Time | O(log n) Space
-# Worst : O(n²) Time | O(log n) Space
+# Best : O(n log n) Time | O(n) Space (as listas left/right copiam a entrada)
+# Average : O(n log n) Time | O(n) Space
+# Worst : O(n²) Time | O(n²) Space
 def quick_sort(arr):
     if len(arr) <= 1:  # Caso base: lista de tamanho 0 ou 1
         return arr
@@ -83,6 +183,97 @@ def quick_sort(arr):
     return quick_sort(left) + [pivot] + quick_sort(right)  # Ordena recursivamente
 
 
+def _median_of_three(arr, i, j, k):
+    # Retorna o índice do valor mediano entre arr[i], arr[j] e arr[k]
+    if arr[i] < arr[j]:
+        if arr[j] < arr[k]:
+            return j
+        return k if arr[i] < arr[k] else i
+    if arr[i] < arr[k]:
+        return i
+    return k if arr[j] < arr[k] else j
+
+
+def _choose_pivot(arr, lo, hi):
+    # Mediana de três para intervalos pequenos e "ninther" (mediana de medianas) para grandes
+    mid = (lo + hi) // 2
+    if hi - lo < 128:
+        return arr[_median_of_three(arr, lo, mid, hi)]
+    step = (hi - lo) // 8
+    return arr[_median_of_three(
+        arr,
+        _median_of_three(arr, lo, lo + step, lo + 2 * step),
+        _median_of_three(arr, mid - step, mid, mid + step),
+        _median_of_three(arr, hi - 2 * step, hi - step, hi),
+    )]
+
+
+def _sift_down(arr, lo, root, end):
+    # Restaura a propriedade de heap máximo em arr[lo:end] a partir de `root` (relativo a lo)
+    value = arr[lo + root]
+    child = 2 * root + 1
+    while child < end:
+        if child + 1 < end and arr[lo + child] < arr[lo + child + 1]:
+            child += 1
+        if not value < arr[lo + child]:
+            break
+        arr[lo + root] = arr[lo + child]
+        root = child
+        child = 2 * root + 1
+    arr[lo + root] = value
+
+
+def _heap_sort(arr, lo, hi):
+    # Heapsort em arr[lo:hi + 1], usado quando a recursão do introsort fica profunda demais
+    n = hi - lo + 1
+    for root in range(n // 2 - 1, -1, -1):
+        _sift_down(arr, lo, root, n)
+    for end in range(n - 1, 0, -1):
+        arr[lo], arr[lo + end] = arr[lo + end], arr[lo]
+        _sift_down(arr, lo, 0, end)
+
+
+def _intro_sort(arr, lo, hi, depth):
+    while hi - lo >= 16:
+        if depth == 0:  # Profundidade limite atingida: garante O(n log n) com heapsort
+            _heap_sort(arr, lo, hi)
+            return
+        depth -= 1
+        pivot = _choose_pivot(arr, lo, hi)
+        # Particionamento em três vias (bandeira holandesa): < pivô | == pivô | > pivô
+        lt, i, gt = lo, lo, hi
+        while i <= gt:
+            value = arr[i]
+            if value < pivot:
+                arr[lt], arr[i] = value, arr[lt]
+                lt += 1
+                i += 1
+            elif pivot < value:
+                arr[gt], arr[i] = value, arr[gt]
+                gt -= 1
+            else:
+                i += 1
+        # Recursão no lado menor e iteração no maior: pilha limitada a O(log n)
+        if lt - lo < hi - gt:
+            _intro_sort(arr, lo, lt - 1, depth)
+            lo = gt + 1
+        else:
+            _intro_sort(arr, gt + 1, hi, depth)
+            hi = lt - 1
+    _insertion_sort(arr, lo, hi + 1, lo + 1)  # Intervalos pequenos
+
+
+# O(n log n): Quick Sort in-place (introsort) com pivô por mediana de três / ninther,
+# particionamento em três vias e fallback para heapsort ao atingir a profundidade limite
+# Best : O(n) Time | O(log n) Space (todos os elementos iguais)
+# Average : O(n log n) Time | O(log n) Space
+# Worst : O(n log n) Time | O(log n) Space
+def intro_sort(arr):
+    if len(arr) > 1:
+        _intro_sort(arr, 0, len(arr) - 1, 2 * len(arr).bit_length())
+    return arr
+
+
 # O(n²): Ordenação Bubble Sort, compara todos os pares de elementos
 # Best : O(n²) Time | O(1) Space
 # Average : O(n²) Time | O(1) Space
@@ -1,6 +1,12 @@
+import argparse
+
+import bigO
 from bigO import BigO
 from wrapper import *  # Importa os wrappers
 from functions import *  # Importa os wrappers
+from radix_sort import radix_sort
+from result_cache import ResultCache
+from space_complexity import SPACE_SIZES, SPACE_TIME_LIMIT, measure_space
 
 # Inicializa o analisador de complexidade
 tester = BigO()
@@ -11,32 +17,113 @@ functions = [
     linear_search_wrapper,      # Wrapper para O(n)
     sum_list_wrapper,           # Wrapper para O(n)
     merge_sort,                 # O(n log n)
+    natural_merge_sort,         # O(n log n), O(n) em entradas já ordenadas
     quick_sort,                 # O(n log n)
+    intro_sort,                 # O(n log n), inclusive em entradas ordenadas
+    radix_sort,                 # O(n), chaves inteiras (NumPy)
     bubble_sort,                # O(n²)
 ]
 
+# Tipos de entrada usados para verificar o intro_sort fora do caso aleatório
+adversarial_inputs = ["sorted", "reversed", "equal", "almost_equal"]
+
 # Função auxiliar para medir a complexidade
-def measure_complexity(func):
+def measure_complexity(func, array='random', cache=None):
     """
     Mede a complexidade de tempo de uma função usando o BigO Calculator.
     A função executa o teste de complexidade sobre a função fornecida com entradas aleatórias.
     
     Args:
         func (Callable): A função cuja complexidade será medida.
+        array (str): Tipo de entrada gerada pelo BigO Calculator ("random", "sorted",
+            "reversed", "equal", "almost_equal", ...).
+        cache (ResultCache): Se informado, reaproveita o resultado enquanto o
+            bytecode da função (e das funções que ela chama) não mudar.
         
     Returns:
         str: A complexidade assintótica estimada (e.g., "O(n)", "O(log n)", "O(n^2)") para a função fornecida.
     """
-    result = tester.test(func, 'random')  # Gera entradas aleatórias e mede a complexidade
+    if cache is None:
+        return tester.test(func, array)  # Gera as entradas e mede a complexidade
+    result, cached = cache.measure(
+        func, lambda: tester.test(func, array), "time",
+        array=array, bigO=bigO.__version__,
+    )
+    if cached:
+        print(f"↷ {func.__name__} ({array}): resultado em cache (use --force para medir)")
     return result
 
+# Função auxiliar para medir a complexidade de espaço
+def measure_space_complexity(func, array='random', cache=None):
+    """
+    Mede o pico de memória e a profundidade de recursão (ver `measure_space`),
+    reaproveitando o resultado em cache como `measure_complexity`.
+    """
+    if cache is None:
+        return measure_space(func, array)
+    result, cached = cache.measure(
+        func, lambda: measure_space(func, array), "space",
+        array=array, sizes=SPACE_SIZES, time_limit=SPACE_TIME_LIMIT,
+    )
+    if cached:
+        print(f"↷ {func.__name__} (espaço): resultado em cache (use --force para medir)")
+    return result
+
+# Função auxiliar para imprimir tempo e espaço em uma única tabela
+def print_complexity_table(rows):
+    """
+    Imprime a complexidade de tempo e de espaço de cada função.
+
+    Args:
+        rows (list): Tuplas (nome da função, complexidade de tempo, resultado
+            de `measure_space`).
+    """
+    header = f"{'Função':<24}{'Tempo':<14}{'Espaço':<14}{'Pico (maior n)':<26}{'Recursão':<14}{'Prof. máx.':>10}"
+    print("\n" + header)
+    print("-" * len(header))
+    for name, time_complexity, space in rows:
+        peak = f"{space['peaks'][-1]:,} B (n={space['sizes'][-1]:,})"
+        print(
+            f"{name:<24}{time_complexity:<14}{space['space']:<14}{peak:<26}"
+            f"{space['depth']:<14}{space['depths'][-1]:>10}"
+        )
+
 # Testando o Código
 if __name__ == "__main__":
-    for func in functions:
-        print(f"\nAnalisando a função: {func.__name__}")
-        # Mede a complexidade da função
-        complexity = measure_complexity(func)
-        print(f"Big O '{func.__name__}': {complexity}")
+    parser = argparse.ArgumentParser(description="Análise de complexidade Big-O")
+    parser.add_argument(
+        "--space", action="store_true",
+        help="mede também o pico de memória e a profundidade de recursão",
+    )
+    parser.add_argument(
+        "--force", action="store_true",
+        help="ignora o cache e mede todas as funções novamente",
+    )
+    args = parser.parse_args()
+    cache = ResultCache(force=args.force)
+
+    if args.space:
+        rows = []
+        for func in functions:
+            print(f"\nAnalisando a função: {func.__name__}")
+            rows.append((
+                func.__name__,
+                str(measure_complexity(func, cache=cache)),
+                measure_space_complexity(func, cache=cache),
+            ))
+        print_complexity_table(rows)
+    else:
+        for func in functions:
+            print(f"\nAnalisando a função: {func.__name__}")
+            # Mede a complexidade da função
+            complexity = measure_complexity(func, cache=cache)
+            print(f"Big O '{func.__name__}': {complexity}")
+
+        # Entradas que degradam o quick_sort ingênuo (pivô fixo) para O(n²)
+        for array in adversarial_inputs:
+            print(f"\nAnalisando a função: intro_sort (entrada '{array}')")
+            complexity = measure_complexity(intro_sort, array, cache)
+            print(f"Big O 'intro_sort' ({array}): {complexity}")
 
 
 # pip install big-O-calculator
\ No newline at end of file
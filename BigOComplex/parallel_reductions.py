@@ -0,0 +1,246 @@
+"""
+Versões paralelas e vetorizadas de `sum_list` e `linear_search`.
+
+Os dados são copiados uma única vez para um bloco de `multiprocessing.shared_memory`;
+cada processo do pool anexa esse bloco como um array NumPy e processa apenas os
+trechos (chunks) que recebe, sem que a lista seja serializada para os workers.
+"""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import Value, shared_memory
+
+import numpy as np
+
+from functions import linear_search, sum_list
+
+# Tipos NumPy que podem ser copiados para a memória compartilhada: booleanos,
+# inteiros, números sem sinal e de ponto flutuante (arrays de objetos guardam
+# ponteiros, que não são válidos em outros processos)
+SHAREABLE_KINDS = "biuf"
+
+# Número de elementos processados por tarefa enviada ao pool
+DEFAULT_CHUNK_SIZE = 1 << 22
+
+# Número de elementos comparados entre duas verificações do sinal de
+# cancelamento da busca linear
+SCAN_BLOCK_SIZE = 1 << 18
+
+# Estado de cada processo worker, preenchido por `_attach`
+_worker = {}
+
+
+def _attach(name, shape, dtype, found):
+    """
+    Inicializador dos workers: anexa o bloco de memória compartilhada.
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    _worker["shm"] = shm
+    _worker["data"] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    _worker["found"] = found
+
+
+class SharedArray:
+    """
+    Copia um array para a memória compartilhada e cria pools que o enxergam.
+
+    Deve ser usado como gerenciador de contexto; o bloco é liberado ao sair.
+    """
+
+    def __init__(self, arr):
+        values = np.asarray(arr)
+        if values.dtype.kind not in SHAREABLE_KINDS:
+            raise TypeError(
+                f"tipo não suportado em memória compartilhada: {values.dtype}"
+            )
+        self.shape = values.shape
+        self.dtype = values.dtype
+        self.size = values.size
+        self.shm = shared_memory.SharedMemory(
+            create=True, size=max(values.nbytes, 1)
+        )
+        self.data = np.ndarray(self.shape, dtype=self.dtype, buffer=self.shm.buf)
+        self.data[...] = values
+
+    def pool(self, workers=None, found=None):
+        """
+        Cria um ProcessPoolExecutor cujos workers acessam este array.
+        """
+        return ProcessPoolExecutor(
+            max_workers=workers or os.cpu_count(),
+            initializer=_attach,
+            initargs=(self.shm.name, self.shape, self.dtype, found),
+        )
+
+    def chunks(self, chunk_size):
+        return [
+            (lo, min(lo + chunk_size, self.size))
+            for lo in range(0, self.size, chunk_size)
+        ]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        del self.data
+        self.shm.close()
+        self.shm.unlink()
+
+
+def _block_sum(block):
+    """
+    Soma um trecho do array sem perder precisão.
+
+    Floats usam `np.sum`, que faz soma em pares (pairwise) com erro O(log n)
+    em vez de O(n). Inteiros são somados em int64 apenas quando não há risco
+    de overflow; caso contrário a soma é feita com inteiros do Python.
+    """
+    if block.size == 0:
+        return 0
+    if block.dtype.kind == "f":
+        return float(np.sum(block))
+    bound = max(abs(int(block.max())), abs(int(block.min())))
+    if bound * block.size < 2**63:
+        return int(block.sum(dtype=np.int64))
+    return sum(block.tolist())
+
+
+def shareable(values):
+    """
+    Indica se o array pode ser processado pelos workers (ver SHAREABLE_KINDS).
+    """
+    return values.dtype.kind in SHAREABLE_KINDS
+
+
+def _combine_sums(partials):
+    # math.fsum combina as somas parciais sem erro de arredondamento
+    if any(isinstance(p, float) for p in partials):
+        return math.fsum(partials)
+    return sum(partials)
+
+
+def _first_match(data, start, stop, target, found=None):
+    """
+    Retorna o primeiro índice em data[start:stop] igual a `target` (ou -1).
+
+    Se `found` for informado, a busca é interrompida assim que outro worker
+    encontrar uma ocorrência anterior a `start` do bloco atual.
+    """
+    for lo in range(start, stop, SCAN_BLOCK_SIZE):
+        if found is not None and -1 < found.value < lo:
+            return -1
+        hits = np.flatnonzero(data[lo : min(lo + SCAN_BLOCK_SIZE, stop)] == target)
+        if hits.size:
+            index = lo + int(hits[0])
+            if found is not None:
+                with found.get_lock():
+                    if found.value == -1 or index < found.value:
+                        found.value = index
+            return index
+    return -1
+
+
+def _chunk_sum(start, stop):
+    return _block_sum(_worker["data"][start:stop])
+
+
+def _chunk_search(start, stop, target):
+    return _first_match(_worker["data"], start, stop, target, _worker["found"])
+
+
+def vectorized_sum(arr):
+    """
+    Soma os elementos de uma lista em um único processo, com NumPy.
+
+    Args:
+        arr (list | np.ndarray): Números a serem somados
+
+    Returns:
+        int | float: Soma dos elementos
+    """
+    values = np.asarray(arr)
+    partials = [
+        _block_sum(values[lo : lo + DEFAULT_CHUNK_SIZE])
+        for lo in range(0, values.size, DEFAULT_CHUNK_SIZE)
+    ]
+    return _combine_sums(partials)
+
+
+def vectorized_linear_search(arr, target):
+    """
+    Busca linear vetorizada em um único processo.
+
+    Compara blocos de SCAN_BLOCK_SIZE elementos por vez, parando no primeiro
+    bloco que contém o alvo.
+
+    Returns:
+        int: Índice da primeira ocorrência de `target`, ou -1
+    """
+    values = np.asarray(arr)
+    return _first_match(values, 0, values.size, target)
+
+
+def parallel_sum(arr, workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Soma os elementos de uma lista em paralelo.
+
+    Cada worker soma um chunk do array em memória compartilhada e as somas
+    parciais são combinadas com `math.fsum` (floats) ou soma exata (inteiros).
+
+    Args:
+        arr (list | np.ndarray): Números a serem somados
+        workers (int): Número de processos (padrão: os.cpu_count())
+        chunk_size (int): Número de elementos por tarefa
+
+    Returns:
+        int | float: Soma dos elementos
+    """
+    values = np.asarray(arr)
+    if not shareable(values):
+        # Ex.: inteiros maiores que 64 bits viram um array de objetos
+        return sum_list(arr)
+    with SharedArray(values) as shared, shared.pool(workers) as pool:
+        futures = [
+            pool.submit(_chunk_sum, lo, hi) for lo, hi in shared.chunks(chunk_size)
+        ]
+        return _combine_sums([future.result() for future in futures])
+
+
+def parallel_linear_search(arr, target, workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Busca linear em paralelo, com cancelamento antecipado.
+
+    Assim que uma ocorrência é encontrada, os chunks posteriores ainda não
+    iniciados são cancelados e os que estão em execução param no próximo
+    bloco, por meio de um valor compartilhado com o menor índice encontrado.
+
+    Args:
+        arr (list | np.ndarray): Lista onde buscar
+        target: Valor buscado
+        workers (int): Número de processos (padrão: os.cpu_count())
+        chunk_size (int): Número de elementos por tarefa
+
+    Returns:
+        int: Índice da primeira ocorrência de `target`, ou -1
+    """
+    values = np.asarray(arr)
+    if not shareable(values):
+        return linear_search(arr, target)
+    found = Value("q", -1)
+    with SharedArray(values) as shared, shared.pool(workers, found) as pool:
+        futures = {
+            pool.submit(_chunk_search, lo, hi, target): lo
+            for lo, hi in shared.chunks(chunk_size)
+        }
+        best = -1
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            index = future.result()
+            if index != -1 and (best == -1 or index < best):
+                best = index
+                for other, lo in futures.items():
+                    if lo > best:
+                        other.cancel()
+        return best
@@ -0,0 +1,159 @@
+"""
+Merge sort paralelo entre processos, com intercalação também paralela.
+
+Os dados são copiados uma única vez para a memória compartilhada (ver
+`SharedArray` em `parallel_reductions.py`), junto com um buffer auxiliar do
+mesmo tamanho; os workers anexam os dois blocos e recebem apenas índices.
+
+Fase 1: o array é dividido em um trecho por worker e cada trecho é ordenado
+no lugar com a ordenação sequencial do NumPy.
+
+Fase 2: os runs ordenados são intercalados dois a dois, em log2(p) rodadas,
+alternando entre o array e o buffer. Cada intercalação é dividida em partes
+de tamanho igual na saída: para a posição k da saída, o co-rank (i, j), com
+i + j = k, é encontrado por busca binária de modo que a[:i] e b[:j] sejam
+exatamente os k primeiros elementos da intercalação estável. Assim todos os
+workers trabalham em todas as rodadas, inclusive na última, que intercala
+apenas dois runs.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from parallel_reductions import SharedArray, shareable
+
+# Abaixo deste tamanho a ordenação é feita no próprio processo
+PARALLEL_MIN_SIZE = 1 << 16
+
+# Estado de cada processo worker, preenchido por `_attach_buffers`
+_worker = {}
+
+
+def _attach_buffers(names, shape, dtype):
+    """
+    Inicializador dos workers: anexa o array e o buffer auxiliar.
+    """
+    blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    _worker["shm"] = blocks
+    _worker["buffers"] = [np.ndarray(shape, dtype=dtype, buffer=shm.buf) for shm in blocks]
+
+
+def co_rank(k, a, b):
+    """
+    Divide os k primeiros elementos da intercalação estável de `a` e `b`.
+
+    Args:
+        k (int): Posição na saída (0 <= k <= len(a) + len(b))
+        a (np.ndarray): Primeiro run ordenado (tem prioridade nos empates)
+        b (np.ndarray): Segundo run ordenado
+
+    Returns:
+        tuple: (i, j) com i + j = k, a[i - 1] <= b[j] e b[j - 1] < a[i]
+    """
+    lo, hi = max(0, k - len(b)), min(k, len(a))
+    while lo < hi:
+        i = (lo + hi) // 2
+        j = k - i
+        if j > 0 and i < len(a) and b[j - 1] >= a[i]:
+            lo = i + 1  # a[i] ainda pertence aos k primeiros
+        else:
+            hi = i
+    return lo, k - lo
+
+
+def _sort_chunk(lo, hi):
+    _worker["buffers"][0][lo:hi].sort()
+
+
+def _merge_segment(source, a_lo, a_hi, b_lo, b_hi, out_lo):
+    """
+    Intercala src[a_lo:a_hi] e src[b_lo:b_hi] em dst[out_lo:...].
+
+    As duas partes são copiadas lado a lado na saída e ordenadas com o sort
+    estável do NumPy (timsort), que detecta os dois runs e apenas os intercala.
+    """
+    src, dst = _worker["buffers"][source], _worker["buffers"][1 - source]
+    middle = out_lo + a_hi - a_lo
+    out_hi = middle + b_hi - b_lo
+    dst[out_lo:middle] = src[a_lo:a_hi]
+    dst[middle:out_hi] = src[b_lo:b_hi]
+    dst[out_lo:out_hi].sort(kind="stable")
+
+
+def _merge_tasks(data, bounds, pieces_per_run):
+    """
+    Divide a intercalação de cada par de runs em partes de tamanho igual.
+
+    Returns:
+        tuple: (tarefas (a_lo, a_hi, b_lo, b_hi, out_lo), novos limites)
+    """
+    tasks = []
+    merged = [0]
+    for r in range(0, len(bounds) - 1, 2):
+        lo, mid = bounds[r], bounds[r + 1]
+        hi = bounds[r + 2] if r + 2 < len(bounds) else mid
+        a, b = data[lo:mid], data[mid:hi]
+        size = hi - lo
+        parts = max(1, min(pieces_per_run, size))
+        cuts = [co_rank(size * p // parts, a, b) for p in range(parts + 1)]
+        for (i0, j0), (i1, j1) in zip(cuts, cuts[1:]):
+            tasks.append((lo + i0, lo + i1, mid + j0, mid + j1, lo + i0 + j0))
+        merged.append(hi)
+    return tasks, merged
+
+
+def parallel_merge_sort_array(values, workers=None):
+    """
+    Ordena um array NumPy com merge sort paralelo em memória compartilhada.
+
+    Args:
+        values (np.ndarray | list): Números a ordenar
+        workers (int): Número de processos (padrão: os.cpu_count())
+
+    Returns:
+        np.ndarray: Novo array ordenado
+    """
+    values = np.asarray(values)
+    workers = workers or os.cpu_count()
+    if values.size < PARALLEL_MIN_SIZE or workers == 1 or not shareable(values):
+        return np.sort(values)
+
+    with SharedArray(values) as shared, SharedArray(np.empty_like(values)) as aux:
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_attach_buffers,
+            initargs=((shared.shm.name, aux.shm.name), shared.shape, shared.dtype),
+        )
+        with pool:
+            # Fase 1: um trecho por worker, ordenado no lugar
+            chunk = -(-shared.size // workers)
+            bounds = [lo for lo, _ in shared.chunks(chunk)] + [shared.size]
+            list(pool.map(_sort_chunk, bounds[:-1], bounds[1:]))
+
+            # Fase 2: rodadas de intercalação dois a dois, alternando os buffers
+            buffers, source = (shared.data, aux.data), 0
+            while len(bounds) > 2:
+                pairs = len(bounds) // 2
+                tasks, bounds = _merge_tasks(buffers[source], bounds, -(-workers // pairs))
+                list(pool.map(_merge_segment, [source] * len(tasks), *zip(*tasks)))
+                source = 1 - source
+
+        result = buffers[source].copy()
+        del buffers  # o bloco compartilhado só pode ser liberado sem referências
+        return result
+
+
+# O(n log n): Merge Sort paralelo (ordenação dos trechos e intercalação por co-rank
+# divididas entre p processos)
+# Best : O(n log n / p) Time | O(n) Space
+# Average : O(n log n / p) Time | O(n) Space
+# Worst : O(n log n / p) Time | O(n) Space
+def parallel_merge_sort(arr):
+    """
+    Mesma convenção das ordenações de `functions.py`: recebe uma lista e
+    retorna a lista ordenada.
+    """
+    return parallel_merge_sort_array(arr).tolist()
@@ -0,0 +1,113 @@
+"""
+Radix sort LSD (dígito menos significativo primeiro) para chaves inteiras com
+e sem sinal de 8 a 64 bits, em tempo O(n) por dígito.
+
+As chaves são primeiro deslocadas pelo menor valor (chave - mínimo, em
+aritmética sem sinal de 64 bits), o que trata os negativos sem inverter o bit
+de sinal e reduz o número de passadas ao necessário para cobrir o intervalo
+[mínimo, máximo]: valores entre -1000 e 1000 precisam de uma única passada,
+mesmo em int64. O resultado volta para o tipo original das chaves.
+
+Cada passada ordena por um dígito de 16 bits com `np.argsort(kind="stable")`
+sobre um array uint16, que o NumPy implementa como counting/radix sort (e não
+por comparação); a estabilidade de cada passada garante a ordem final.
+"""
+
+import numpy as np
+
+# Largura de cada dígito, em bits
+DIGIT_BITS = 16
+
+_DIGIT_MASK = np.uint64((1 << DIGIT_BITS) - 1)
+
+
+def _as_keys(arr):
+    """
+    Valida a entrada: um array unidimensional de inteiros com ou sem sinal.
+    """
+    values = np.asarray(arr)
+    if values.size == 0 and values.dtype.kind == "f":  # lista vazia
+        values = values.astype(np.int64)
+    if values.ndim != 1:
+        raise ValueError("radix sort espera um array unidimensional")
+    if values.dtype.kind not in "iu":
+        raise TypeError(f"tipo de chave não suportado: {values.dtype}")
+    return values
+
+
+def _wide(values):
+    """
+    Tipo de 64 bits usado nas passadas (int64 ou uint64, conforme o sinal).
+    """
+    return np.uint64 if values.dtype.kind == "u" else np.int64
+
+
+def _lsd_passes(values, with_order):
+    """
+    Executa as passadas do radix sort.
+
+    Returns:
+        tuple: (chaves deslocadas ordenadas, mínimo em uint64, permutação ou None)
+    """
+    wide = _wide(values)
+    low = np.array(values.min(), dtype=wide).view(np.uint64)
+    # Diferença em relação ao mínimo, sem overflow: complemento de dois em uint64
+    keys = values.astype(wide).view(np.uint64) - low
+    span = int(keys.max())
+    order = np.arange(values.size, dtype=np.intp) if with_order else None
+
+    for shift in range(0, span.bit_length(), DIGIT_BITS):
+        digits = ((keys >> np.uint64(shift)) & _DIGIT_MASK).astype(np.uint16)
+        step = np.argsort(digits, kind="stable")
+        keys = keys[step]
+        if with_order:
+            order = order[step]
+    return keys, low, order
+
+
+def radix_sort_array(values):
+    """
+    Ordena um array de inteiros (int8 a int64, uint8 a uint64) com radix sort LSD.
+
+    Args:
+        values (np.ndarray | list): Chaves a ordenar
+
+    Returns:
+        np.ndarray: Novo array ordenado, com o mesmo tipo das chaves
+    """
+    values = _as_keys(values)
+    if values.size <= 1:
+        return values.copy()
+    keys, low, _ = _lsd_passes(values, with_order=False)
+    return (keys + low).view(_wide(values)).astype(values.dtype, copy=False)
+
+
+def radix_argsort(values):
+    """
+    Retorna a permutação estável que ordena as chaves (como
+    `np.argsort(values, kind="stable")`), calculada com radix sort LSD.
+
+    Args:
+        values (np.ndarray | list): Chaves inteiras (int8 a int64, uint8 a uint64)
+
+    Returns:
+        np.ndarray: Índices tais que values[índices] está em ordem crescente
+    """
+    values = _as_keys(values)
+    if values.size <= 1:
+        return np.arange(values.size, dtype=np.intp)
+    _, _, order = _lsd_passes(values, with_order=True)
+    return order
+
+
+# O(n): Radix sort LSD com dígitos de 16 bits; o número de passadas depende apenas
+# da largura do intervalo [mínimo, máximo] (no máximo 2 em 32 bits e 4 em 64 bits)
+# Best : O(n) Time | O(n) Space
+# Average : O(n) Time | O(n) Space
+# Worst : O(n) Time | O(n) Space
+def radix_sort(arr):
+    """
+    Mesma convenção das ordenações de `functions.py`: recebe uma lista e
+    retorna a lista ordenada, para ser medida pelo BigO Calculator.
+    """
+    return radix_sort_array(arr).tolist()
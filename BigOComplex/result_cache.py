@@ -0,0 +1,204 @@
+"""
+Cache persistente dos resultados de complexidade.
+
+Cada resultado é indexado pela função medida e pelas configurações do gerador
+de entradas, e guardado junto com um hash SHA-256 do bytecode da função:
+instruções, constantes (inclusive funções internas) e nomes usados, valores
+padrão dos parâmetros e valores das variáveis globais que ela lê (ex.: um
+corte como `MIN_RUN`), somados aos das funções do projeto que ela chama,
+direta ou indiretamente. Enquanto esse hash não muda, a medição (que leva
+dezenas de segundos) é reaproveitada.
+"""
+
+import hashlib
+import json
+import os
+import types
+
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".bigo_cache.json")
+
+# Apenas funções definidas dentro do repositório entram no hash: mudanças na
+# biblioteca padrão ou em dependências não invalidam o cache
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _const_repr(value):
+    # Representação estável das constantes (frozensets têm ordem variável)
+    if isinstance(value, types.CodeType):
+        return f"<code {value.co_name}>"
+    if isinstance(value, frozenset):
+        return "frozenset(" + repr(sorted(_const_repr(v) for v in value)) + ")"
+    if isinstance(value, tuple):
+        return "(" + ",".join(_const_repr(v) for v in value) + ")"
+    return repr(value)
+
+
+def _value_repr(value):
+    """
+    Representação estável de um valor global ou padrão, ou None se o valor
+    não tiver uma (objetos cujo repr inclui o endereço de memória).
+    """
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        return repr(value)
+    if isinstance(value, (types.FunctionType, types.BuiltinFunctionType, type)):
+        return f"<{type(value).__name__} {value.__module__}.{value.__qualname__}>"
+    if isinstance(value, (tuple, list, frozenset, set)):
+        items = [_value_repr(v) for v in value]
+        if None in items:
+            return None
+        if isinstance(value, (frozenset, set)):
+            items.sort()
+        return f"{type(value).__name__}({','.join(items)})"
+    return None
+
+
+def _hash_code(code, digest):
+    """
+    Acrescenta ao hash o bytecode de um code object e de seus code objects
+    internos (funções aninhadas, lambdas e compreensões).
+    """
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        digest.update(_const_repr(const).encode())
+        if isinstance(const, types.CodeType):
+            _hash_code(const, digest)
+
+
+def _referenced_names(code):
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _referenced_names(const)
+    return names
+
+
+def _is_project_function(obj):
+    if not isinstance(obj, types.FunctionType):
+        return False
+    path = os.path.abspath(obj.__code__.co_filename)
+    return path.startswith(PROJECT_ROOT + os.sep) and "site-packages" not in path
+
+
+def _dependencies(func):
+    """
+    Funções do projeto que `func` pode chamar (globais, atributos de módulos
+    importados como `functions.merge_sort`, variáveis de closure e valores
+    padrão) e os demais valores que ela lê (globais, atributos de módulos e
+    valores padrão), com representação estável.
+
+    Returns:
+        tuple: (lista de funções, dicionário nome -> repr)
+    """
+    names = _referenced_names(func.__code__)
+    found = []
+    values = {}
+    for name in names:
+        if name not in func.__globals__:
+            continue
+        value = func.__globals__[name]
+        if isinstance(value, types.ModuleType):
+            for attr in names:
+                if hasattr(value, attr):
+                    found.append((f"{name}.{attr}", getattr(value, attr)))
+        else:
+            found.append((name, value))
+    for cell in func.__closure__ or ():
+        try:
+            found.append((None, cell.cell_contents))
+        except ValueError:  # célula ainda não preenchida
+            pass
+    for i, value in enumerate(func.__defaults__ or ()):
+        found.append((f"<default {i}>", value))
+    for name, value in (func.__kwdefaults__ or {}).items():
+        found.append((f"<kwdefault {name}>", value))
+
+    callees = []
+    for name, value in found:
+        if _is_project_function(value):
+            callees.append(value)
+        if name is not None and not isinstance(value, types.ModuleType):
+            text = _value_repr(value)
+            if text is not None:
+                values[name] = text
+    return callees, values
+
+
+def function_digest(func):
+    """
+    Calcula o hash de uma função e de suas chamadas transitivas dentro do
+    projeto.
+
+    Args:
+        func (Callable): Função medida
+
+    Returns:
+        str: Hash SHA-256 em hexadecimal
+    """
+    digest = hashlib.sha256()
+    seen = {}
+    pending = [func]
+    while pending:
+        current = pending.pop()
+        key = (current.__module__, current.__qualname__, current.__code__.co_filename)
+        if key in seen:
+            continue
+        callees, values = _dependencies(current)
+        seen[key] = (current, values)
+        pending.extend(callees)
+
+    # Ordem fixa, independente da ordem em que as funções foram encontradas
+    for key in sorted(seen):
+        current, values = seen[key]
+        digest.update(repr(key[:2]).encode())
+        _hash_code(current.__code__, digest)
+        digest.update(repr(sorted(values.items())).encode())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Resultados de medições indexados pelo tipo de medição, pelo nome da
+    função e pelas configurações, válidos enquanto o hash da função não mudar.
+    """
+
+    def __init__(self, path=CACHE_PATH, force=False):
+        self.path = path
+        self.force = force
+        self.entries = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.entries = json.load(f)
+
+    def measure(self, func, measure, kind, name=None, **settings):
+        """
+        Retorna o resultado em cache ou executa `measure()` e o guarda.
+
+        Args:
+            func (Callable): Função cujo código identifica o resultado
+            measure (Callable): Executa a medição (sem argumentos)
+            kind (str): Tipo de medição (ex.: "time", "space")
+            name (str): Nome usado na chave (padrão: arquivo e nome qualificado
+                da função, que não dependem de como o módulo foi importado)
+            **settings: Configurações do gerador de entradas
+
+        Returns:
+            tuple: (resultado, True se veio do cache)
+        """
+        if name is None:
+            path = os.path.relpath(func.__code__.co_filename, PROJECT_ROOT)
+            name = f"{path}:{func.__qualname__}"
+        key = f"{kind}:{name}:{json.dumps(settings, sort_keys=True)}"
+        digest = function_digest(func)
+        entry = self.entries.get(key)
+        if not self.force and entry is not None and entry["digest"] == digest:
+            return entry["result"], True
+
+        result = measure()
+        self.entries[key] = {"digest": digest, "result": result}
+        self.save()
+        return result, False
+
+    def save(self):
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
@@ -0,0 +1,136 @@
+"""
+Estimativa da complexidade de espaço das funções do projeto.
+
+Para cada tamanho de entrada são medidos o pico de memória alocada durante a
+chamada (com `tracemalloc`) e a profundidade máxima de recursão (com
+`sys.setprofile`). As duas séries são ajustadas às mesmas curvas que o BigO
+Calculator usa para o tempo (O(1), O(log n), O(n), O(n log n), O(n²), O(n³)),
+pelo mesmo método de mínimos quadrados.
+"""
+
+import sys
+import time
+import tracemalloc
+
+from bigO import BigO
+
+# Tamanhos de entrada medidos (o de 10 elementos do BigO Calculator é omitido:
+# as alocações fixas do interpretador dominam a medição)
+SPACE_SIZES = [100, 1000, 10000, 100000]
+
+# Se uma medição levar mais que este tempo (em segundos), os tamanhos maiores
+# são ignorados, como faz o BigO Calculator
+SPACE_TIME_LIMIT = 4
+
+# Abaixo deste pico (em bytes) a alocação é considerada constante: são objetos
+# temporários do interpretador, não memória proporcional à entrada
+CONSTANT_PEAK_BYTES = 1024
+
+_tester = BigO()
+
+_generators = {
+    "random": _tester.genRandomArray,
+    "sorted": _tester.genSortedArray,
+    "reversed": _tester.genReversedArray,
+    "equal": _tester.genEqualArray,
+    "almost_equal": _tester.genAlmostEqualArray,
+}
+
+
+def peak_memory(func, arr):
+    """
+    Retorna o pico de memória (em bytes) alocada durante func(arr).
+
+    A entrada é copiada antes de o rastreamento começar, de modo que apenas
+    a memória alocada pela própria função (incluindo o resultado) é contada.
+    """
+    arr = list(arr)
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        func(arr)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return max(peak - baseline, 0)
+
+
+def max_recursion_depth(func, arr):
+    """
+    Retorna a profundidade máxima de chamadas Python aninhadas em func(arr).
+
+    A própria chamada de `func` tem profundidade 1; funções sem recursão nem
+    chamadas auxiliares retornam 1.
+    """
+    arr = list(arr)
+    depth = 0
+    deepest = 0
+
+    def profiler(frame, event, arg):
+        nonlocal depth, deepest
+        if event == "call":
+            depth += 1
+            deepest = max(deepest, depth)
+        elif event == "return":
+            depth -= 1
+
+    sys.setprofile(profiler)
+    try:
+        func(arr)
+    finally:
+        sys.setprofile(None)
+    return deepest
+
+
+def fit_complexity(sizes, values, constant_below=0):
+    """
+    Ajusta uma série de medições às curvas de complexidade do BigO Calculator.
+
+    Args:
+        sizes (list): Tamanhos de entrada
+        values (list): Medições correspondentes
+        constant_below (float): Séries cujo maior valor não passa deste
+            limite são classificadas como O(1) sem ajuste
+
+    Returns:
+        str: Classe de complexidade (ex.: "O(n)")
+    """
+    if max(values) <= constant_below:
+        return "O(1)"
+    return _tester._estimate(sizes, values)._to_str()
+
+
+def measure_space(func, array="random", sizes=None):
+    """
+    Mede o pico de memória e a profundidade de recursão de uma função para
+    entradas de tamanhos crescentes.
+
+    Args:
+        func (Callable): Função que recebe uma lista
+        array (str): Tipo de entrada ("random", "sorted", "reversed", "equal",
+            "almost_equal")
+        sizes (list): Tamanhos de entrada (padrão: SPACE_SIZES)
+
+    Returns:
+        dict: Tamanhos medidos, picos (bytes), profundidades e as classes
+            ajustadas ("space" e "depth")
+    """
+    generate = _generators.get(array, _tester.genRandomArray)
+    measured, peaks, depths = [], [], []
+
+    for size in sizes or SPACE_SIZES:
+        arr = generate(size)
+        start = time.perf_counter()
+        peaks.append(peak_memory(func, arr))
+        depths.append(max_recursion_depth(func, arr))
+        measured.append(size)
+        if time.perf_counter() - start > SPACE_TIME_LIMIT:
+            break
+
+    return {
+        "sizes": measured,
+        "peaks": peaks,
+        "depths": depths,
+        "space": fit_complexity(measured, peaks, CONSTANT_PEAK_BYTES),
+        "depth": fit_complexity(measured, depths),
+    }
@@ -0,0 +1,309 @@
+"""
+Construção do grafo de fluxo de controle (CFG) de funções Python a partir da AST.
+
+O grafo é formado por blocos básicos (sequências de instruções simples), nós de
+decisão (if, while, for, match, try) e nós de retorno, sempre com um único nó de
+entrada e um único nó de saída. Assim a complexidade ciclomática pode ser obtida
+diretamente pela fórmula M = E - N + 2.
+"""
+
+import ast
+import inspect
+import textwrap
+
+# Tamanho máximo de cada linha exibida nos rótulos dos nós
+MAX_LABEL_LENGTH = 40
+
+
+class ControlFlowGraph:
+    """
+    Grafo de fluxo de controle de uma função.
+
+    Attributes:
+        name (str): Nome qualificado da função
+        nodes (list): Lista de tuplas (id, rótulo, tipo)
+        edges (list): Lista de tuplas (origem, destino, rótulo)
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.nodes = []
+        self.edges = []
+
+    def add_node(self, label, kind):
+        node_id = f"N{len(self.nodes)}"
+        self.nodes.append((node_id, label, kind))
+        return node_id
+
+    def add_edge(self, source, target, label=""):
+        self.edges.append((source, target, label))
+
+    def cyclomatic_complexity(self):
+        """
+        Calcula a complexidade ciclomática pela fórmula M = E - N + 2.
+        """
+        return len(self.edges) - len(self.nodes) + 2
+
+
+def _short(node):
+    """
+    Converte um nó da AST em texto curto para ser usado como rótulo.
+    """
+    text = ast.unparse(node).splitlines()[0]
+    if len(text) > MAX_LABEL_LENGTH:
+        text = text[: MAX_LABEL_LENGTH - 3] + "..."
+    return text
+
+
+class _CFGBuilder:
+    """
+    Percorre o corpo de uma função e monta o ControlFlowGraph correspondente.
+
+    Cada método `_visit_*` recebe a lista de predecessores pendentes, no formato
+    (id do nó, rótulo da aresta), e devolve os predecessores que continuam
+    abertos após a instrução, isto é, os que seguem para a próxima instrução.
+    """
+
+    # Instruções que alteram o fluxo de controle e recebem tratamento próprio
+    COMPOUND = (
+        ast.If,
+        ast.While,
+        ast.For,
+        ast.AsyncFor,
+        ast.Try,
+        ast.TryStar,
+        ast.With,
+        ast.AsyncWith,
+        ast.Match,
+        ast.Return,
+        ast.Raise,
+        ast.Break,
+        ast.Continue,
+    )
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.exit = None
+        self.loops = []  # Pilha de (nó de cabeçalho, lista de breaks)
+        # Pilha de blocos `finally` em construção: (número de laços abertos
+        # quando o try começou, saltos que passam pelo finally)
+        self.finally_blocks = []
+
+    def build(self, func_node):
+        args = ", ".join(arg.arg for arg in func_node.args.args)
+        entry = self.graph.add_node(f"Entrada: {func_node.name}({args})", "entry")
+        self.exit = self.graph.add_node("Saída", "exit")
+        body = func_node.body
+        # A docstring não faz parte do fluxo de controle
+        if ast.get_docstring(func_node) is not None:
+            body = body[1:]
+        pending = self._visit_block(body, [(entry, "")])
+        # Chegar ao fim do corpo equivale a um `return None` implícito
+        self._connect(pending, self.exit)
+        return self.graph
+
+    def _connect(self, pending, target):
+        for source, label in pending:
+            self.graph.add_edge(source, target, label)
+
+    def _visit_block(self, statements, pending):
+        simple = []
+        for stmt in statements:
+            if isinstance(stmt, self.COMPOUND):
+                pending = self._flush(simple, pending)
+                simple = []
+                pending = getattr(self, f"_visit_{type(stmt).__name__}")(stmt, pending)
+            else:
+                simple.append(stmt)
+        return self._flush(simple, pending)
+
+    def _flush(self, simple, pending):
+        """
+        Agrupa instruções simples consecutivas em um único bloco básico.
+        """
+        if not simple:
+            return pending
+        label = "\n".join(_short(stmt) for stmt in simple)
+        node = self.graph.add_node(label, "block")
+        self._connect(pending, node)
+        return [(node, "")]
+
+    def _visit_If(self, stmt, pending):
+        node = self.graph.add_node(f"{_short(stmt.test)}?", "decision")
+        self._connect(pending, node)
+        taken = self._visit_block(stmt.body, [(node, "Sim")])
+        not_taken = self._visit_block(stmt.orelse, [(node, "Não")])
+        return taken + not_taken
+
+    def _visit_loop(self, stmt, label, pending, enter, leave):
+        node = self.graph.add_node(label, "decision")
+        self._connect(pending, node)
+        breaks = []
+        self.loops.append((node, breaks))
+        body = self._visit_block(stmt.body, [(node, enter)])
+        self._connect(body, node)
+        self.loops.pop()
+        return self._visit_block(stmt.orelse, [(node, leave)]) + breaks
+
+    def _visit_While(self, stmt, pending):
+        return self._visit_loop(stmt, f"{_short(stmt.test)}?", pending, "Sim", "Não")
+
+    def _visit_For(self, stmt, pending):
+        label = f"for {_short(stmt.target)} in {_short(stmt.iter)}"
+        return self._visit_loop(stmt, label, pending, "próximo", "fim")
+
+    _visit_AsyncFor = _visit_For
+
+    def _jump(self, kind, pending):
+        """
+        Liga um salto (break, continue, return ou raise) ao seu destino.
+
+        Se o salto sai de um try com `finally`, ele é registrado nesse bloco e
+        só segue para o destino depois de passar pelo corpo do finally.
+        """
+        if self.finally_blocks:
+            loop_depth, jumps = self.finally_blocks[-1]
+            # break/continue só atravessam o finally se o laço envolve o try
+            if kind in ("return", "raise") or loop_depth == len(self.loops):
+                jumps.append((kind, pending))
+                return
+        if kind == "break":
+            self.loops[-1][1].extend(pending)
+        elif kind == "continue":
+            self._connect(pending, self.loops[-1][0])
+        else:
+            for source, _ in pending:
+                self.graph.add_edge(source, self.exit, "exceção" if kind == "raise" else "")
+
+    def _visit_Break(self, stmt, pending):
+        self._jump("break", pending)
+        return []
+
+    def _visit_Continue(self, stmt, pending):
+        self._jump("continue", pending)
+        return []
+
+    def _visit_Return(self, stmt, pending):
+        label = f"return {_short(stmt.value)}" if stmt.value else "return"
+        node = self.graph.add_node(label, "return")
+        self._connect(pending, node)
+        self._jump("return", [(node, "")])
+        return []
+
+    def _visit_Raise(self, stmt, pending):
+        label = f"raise {_short(stmt.exc)}" if stmt.exc else "raise"
+        node = self.graph.add_node(label, "return")
+        self._connect(pending, node)
+        self._jump("raise", [(node, "")])
+        return []
+
+    def _visit_With(self, stmt, pending):
+        items = ", ".join(_short(item.context_expr) for item in stmt.items)
+        node = self.graph.add_node(f"with {items}", "block")
+        self._connect(pending, node)
+        return self._visit_block(stmt.body, [(node, "")])
+
+    _visit_AsyncWith = _visit_With
+
+    def _visit_Try(self, stmt, pending, keyword="except"):
+        node = self.graph.add_node("try", "decision")
+        self._connect(pending, node)
+        jumps = []
+        if stmt.finalbody:
+            self.finally_blocks.append((len(self.loops), jumps))
+        body = self._visit_block(stmt.body, [(node, "")])
+        outcomes = self._visit_block(stmt.orelse, body)
+        for handler in stmt.handlers:
+            kind = _short(handler.type) if handler.type else "Exception"
+            handler_node = self.graph.add_node(f"{keyword} {kind}", "block")
+            self.graph.add_edge(node, handler_node, "exceção")
+            outcomes += self._visit_block(handler.body, [(handler_node, "")])
+        if not stmt.finalbody:
+            return outcomes
+
+        # O finally é executado no fim normal e antes de cada salto que sai do
+        # try. Cada saída (normal e cada tipo de salto) recebe a sua cópia do
+        # corpo do finally, que depois segue para o destino do salto; assim o
+        # finally não vira um ponto de decisão que não existe no código
+        self.finally_blocks.pop()
+        groups = {}
+        for kind, sources in jumps:
+            groups.setdefault(kind, []).extend(sources)
+        for kind, sources in groups.items():
+            self._jump(kind, self._visit_block(stmt.finalbody, sources))
+        return self._visit_block(stmt.finalbody, outcomes) if outcomes else []
+
+    def _visit_TryStar(self, stmt, pending):
+        return self._visit_Try(stmt, pending, "except*")
+
+    def _visit_Match(self, stmt, pending):
+        node = self.graph.add_node(f"match {_short(stmt.subject)}", "decision")
+        self._connect(pending, node)
+        outcomes = []
+        for case in stmt.cases:
+            label = ast.unparse(case.pattern)
+            outcomes += self._visit_block(case.body, [(node, label)])
+        # Sem um caso irrefutável (`case _:` ou captura sem guarda), o valor
+        # pode não casar com nenhum padrão e a execução segue após o match
+        if not any(case.guard is None and _irrefutable(case.pattern) for case in stmt.cases):
+            outcomes.append((node, "nenhum"))
+        return outcomes
+
+
+def _irrefutable(pattern):
+    """
+    Indica se um padrão do `match` casa com qualquer valor.
+    """
+    if isinstance(pattern, ast.MatchAs):
+        return pattern.pattern is None or _irrefutable(pattern.pattern)
+    if isinstance(pattern, ast.MatchOr):
+        return any(_irrefutable(p) for p in pattern.patterns)
+    return False
+
+
+def build_cfg(func_node, name=None):
+    """
+    Constrói o grafo de fluxo de controle de um nó `FunctionDef` da AST.
+
+    Args:
+        func_node (ast.FunctionDef): Definição da função
+        name (str): Nome a ser usado no grafo (padrão: nome da função)
+
+    Returns:
+        ControlFlowGraph: Grafo de fluxo de controle da função
+    """
+    graph = ControlFlowGraph(name or func_node.name)
+    return _CFGBuilder(graph).build(func_node)
+
+
+def cfg_from_function(func):
+    """
+    Constrói o grafo de fluxo de controle de uma função Python em tempo de execução.
+    """
+    tree = ast.parse(textwrap.dedent(inspect.getsource(func)))
+    return build_cfg(tree.body[0], func.__qualname__)
+
+
+def cfgs_from_source(code):
+    """
+    Constrói os grafos de todas as funções (inclusive métodos e funções
+    aninhadas) definidas em um código-fonte Python.
+
+    Returns:
+        list: Lista de ControlFlowGraph, na ordem em que as funções aparecem
+    """
+    graphs = []
+
+    def visit(node, prefix):
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                name = prefix + child.name
+                graphs.append(build_cfg(child, name))
+                visit(child, name + ".")
+            elif isinstance(child, ast.ClassDef):
+                visit(child, prefix + child.name + ".")
+            else:
+                visit(child, prefix)
+
+    visit(ast.parse(code), "")
+    return graphs
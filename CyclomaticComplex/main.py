@@ -56,7 +56,9 @@ if __name__ == "__main__":
         factorial_iterative,     # O(n)
         factorial_recursive,     # O(n)
         merge_sort,              # O(n log n)
+        natural_merge_sort,      # O(n log n)
         quick_sort,              # O(n log n)
+        intro_sort,              # O(n log n)
         bubble_sort,             # O(n²)
         fibonacci,               # O(2ⁿ)
     ]
@@ -7,20 +7,24 @@ usando o projeto BigOComplex.
 import sys
 import os
 import time
-import random
+
+from corpus import seeded_operands
 
 # Adicionar o diretório BigOComplex ao path
 sys.path.append(os.path.join(os.path.dirname(__file__), "BigOComplex"))
 
-try:
-    from BigOComplex.main import measure_complexity
-    from BigOComplex.wrapper import *
+
+def load_bigo_complex():
+    """
+    Importa o projeto BigOComplex sob demanda.
+
+    O projeto depende do pacote big-O-calculator; importá-lo apenas quando a
+    análise é executada permite importar este módulo mesmo sem o pacote.
+    """
+    from BigOComplex import main, wrapper
 
     print("✅ Projeto BigOComplex carregado com sucesso!")
-except ImportError as e:
-    print(f"❌ Erro ao importar BigOComplex: {e}")
-    print("Verifique se o projeto BigOComplex está configurado corretamente.")
-    sys.exit(1)
+    return main, wrapper
 
 
 def create_karatsuba_wrapper():
@@ -32,7 +36,7 @@ def create_karatsuba_wrapper():
     def karatsuba_wrapper(arr):
         """
         Wrapper para o algoritmo de Karatsuba.
-        Multiplica dois números aleatórios baseados no tamanho do array.
+        Multiplica dois números com semente fixa baseados no tamanho do array.
         """
         if len(arr) < 2:
             return [0]
@@ -43,9 +47,9 @@ def create_karatsuba_wrapper():
         # Limitar o número de dígitos para evitar erros de limite
         max_digits = min(max(1, size // 20), 100)  # Máximo de 100 dígitos
 
-        # Gerar números com o número especificado de dígitos
-        x = random.randint(10 ** (max_digits - 1), 10**max_digits - 1)
-        y = random.randint(10 ** (max_digits - 1), 10**max_digits - 1)
+        # Gerar números com o número especificado de dígitos (os mesmos em
+        # todas as execuções e nos dois wrappers)
+        x, y = seeded_operands(max_digits)
 
         # Executar o algoritmo de Karatsuba
         result = karatsuba_multiply(x, y)
@@ -71,8 +75,7 @@ def create_traditional_wrapper():
         # Limitar o número de dígitos para evitar erros de limite
         max_digits = min(max(1, size // 20), 100)  # Máximo de 100 dígitos
 
-        x = random.randint(10 ** (max_digits - 1), 10**max_digits - 1)
-        y = random.randint(10 ** (max_digits - 1), 10**max_digits - 1)
+        x, y = seeded_operands(max_digits)
 
         result = traditional_multiply(x, y)
         return [result]
@@ -80,10 +83,18 @@ def create_traditional_wrapper():
     return traditional_wrapper
 
 
-def analyze_karatsuba_bigO():
+def analyze_karatsuba_bigO(force=False):
     """
     Analisa a complexidade Big-O do algoritmo de Karatsuba.
+
+    Args:
+        force (bool): Se True, mede todas as funções novamente, ignorando os
+            resultados em cache
     """
+    bigo_main, wrapper = load_bigo_complex()
+    measure_complexity = bigo_main.measure_complexity
+    cache = bigo_main.ResultCache(force=force)
+
     print("=== ANÁLISE DA COMPLEXIDADE BIG-O - ALGORITMO DE KARATSUBA ===\n")
 
     # Criar wrappers para nossos algoritmos
@@ -94,10 +105,10 @@ def analyze_karatsuba_bigO():
     functions_to_analyze = [
         ("karatsuba_multiply", karatsuba_wrapper),
         ("traditional_multiply", traditional_wrapper),
-        ("binary_search_wrapper", binary_search_wrapper),
-        ("linear_search_wrapper", linear_search_wrapper),
-        ("merge_sort", merge_sort),
-        ("bubble_sort", bubble_sort),
+        ("binary_search_wrapper", wrapper.binary_search_wrapper),
+        ("linear_search_wrapper", wrapper.linear_search_wrapper),
+        ("merge_sort", wrapper.merge_sort),
+        ("bubble_sort", wrapper.bubble_sort),
     ]
 
     print("📊 ANÁLISE DA COMPLEXIDADE BIG-O\n")
@@ -109,7 +120,7 @@ def analyze_karatsuba_bigO():
 
         try:
             # Medir a complexidade usando o BigO Calculator
-            complexity = measure_complexity(func)
+            complexity = measure_complexity(func, cache=cache)
             results[func_name] = complexity
 
             print(f"   📈 Complexidade Big-O: {complexity}")
@@ -247,8 +258,8 @@ def main():
             "🚀 Iniciando análise da complexidade Big-O do algoritmo de Karatsuba...\n"
         )
 
-        # Analisar complexidade Big-O
-        results = analyze_karatsuba_bigO()
+        # Analisar complexidade Big-O (--force ignora o cache de resultados)
+        results = analyze_karatsuba_bigO(force="--force" in sys.argv[1:])
 
         # Executar benchmark de performance
         benchmark_performance()
@@ -276,6 +287,10 @@ def main():
 
         print(f"\n💾 Resultados salvos em: exports/karatsuba_bigO_analysis.txt")
 
+    except ImportError as e:
+        print(f"❌ Erro ao importar BigOComplex: {e}")
+        print("Verifique se o projeto BigOComplex está configurado corretamente.")
+        sys.exit(1)
     except Exception as e:
         print(f"❌ Erro durante a análise: {e}")
         print("Verifique se o projeto BigOComplex está configurado corretamente.")
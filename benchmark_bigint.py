@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Benchmark das funções de números inteiros grandes (bigint.py) contra as versões
+ingênuas do projeto CyclomaticComplex e contra a multiplicação nativa.
+"""
+
+import math
+import operator
+import os
+import random
+import sys
+import time
+
+# Adicionar o diretório CyclomaticComplex ao path
+sys.path.append(os.path.join(os.path.dirname(__file__), "CyclomaticComplex"))
+
+from CyclomaticComplex.functions import factorial_iterative, factorial_recursive, fibonacci
+from corpus import iter_cases
+from bigint import (
+    fast_divmod,
+    fast_fibonacci,
+    fast_isqrt,
+    prime_swing_factorial,
+    product_tree_factorial,
+)
+from main import fast_multiply, karatsuba_multiply
+from modular import BarrettContext, MontgomeryContext
+
+# Acima deste índice a versão recursiva ingênua leva tempo demais
+NAIVE_FIBONACCI_LIMIT = 30
+
+
+def builtin_square(x):
+    return x * x
+
+
+def measure(func, *args):
+    """
+    Executa a função uma vez e retorna (resultado, tempo em segundos).
+    """
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def benchmark_fibonacci():
+    """
+    Compara a versão ingênua de Fibonacci com a duplicação rápida usando o motor
+    de Karatsuba e usando a multiplicação nativa.
+    """
+    print("=== BENCHMARK: FIBONACCI ===\n")
+
+    for n in (20, 30, 1_000, 100_000, 1_000_000, 10_000_000):
+        print(f"🔍 F({n:,})")
+
+        karatsuba, karatsuba_time = measure(fast_fibonacci, n)
+        builtin, builtin_time = measure(
+            fast_fibonacci, n, operator.mul, builtin_square
+        )
+        assert karatsuba == builtin, "Resultados diferentes!"
+
+        print(f"   Bits do resultado: {karatsuba.bit_length():,}")
+        if n <= NAIVE_FIBONACCI_LIMIT:
+            naive, naive_time = measure(fibonacci, n)
+            assert naive == karatsuba, "Resultados diferentes!"
+            print(f"   Recursiva ingênua: {naive_time:.6f} segundos")
+        else:
+            print("   Recursiva ingênua: (inviável)")
+        print(f"   Duplicação rápida (Karatsuba): {karatsuba_time:.6f} segundos")
+        print(f"   Duplicação rápida (nativa): {builtin_time:.6f} segundos")
+        print()
+
+
+def benchmark_factorial():
+    """
+    Compara os fatoriais iterativo e recursivo com a árvore de produtos e com
+    a oscilação de primos.
+    """
+    print("=== BENCHMARK: FATORIAL ===\n")
+
+    functions = [
+        factorial_iterative,
+        factorial_recursive,
+        product_tree_factorial,
+        prime_swing_factorial,
+    ]
+
+    for n in (100, 900, 10_000, 100_000):
+        print(f"🔍 {n:,}!")
+        expected = None
+        for func in functions:
+            try:
+                result, elapsed = measure(func, n)
+            except RecursionError:
+                print(f"   {func.__name__}: (limite de recursão)")
+                continue
+            if expected is None:
+                expected = result
+            assert result == expected, "Resultados diferentes!"
+            print(f"   {func.__name__}: {elapsed:.6f} segundos")
+        print()
+
+
+def benchmark_modular():
+    """
+    Compara os contextos de Barrett e Montgomery com o `pow(b, e, m)` nativo
+    e com a multiplicação seguida de `%` em lote.
+    """
+    print("=== BENCHMARK: ARITMÉTICA MODULAR ===\n")
+
+    rng = random.Random(0)
+    batch = 1_000
+
+    for bits in (2048, 4096, 8192):
+        print(f"🔍 Módulo de {bits} bits")
+        modulus = rng.getrandbits(bits) | (1 << (bits - 1)) | 1
+        base, exponent = rng.getrandbits(bits), rng.getrandbits(bits)
+        a_values = [rng.getrandbits(bits) % modulus for _ in range(batch)]
+        b_values = [rng.getrandbits(bits) % modulus for _ in range(batch)]
+
+        expected, native_time = measure(pow, base, exponent, modulus)
+        print(f"   modpow - pow nativo: {native_time:.6f} segundos")
+        for context_class in (BarrettContext, MontgomeryContext):
+            context = context_class(modulus)
+            result, elapsed = measure(context.modpow, base, exponent)
+            assert result == expected, "Resultados diferentes!"
+            print(f"   modpow - {context_class.__name__}: {elapsed:.6f} segundos")
+
+        expected, native_time = measure(
+            lambda: [a * b % modulus for a, b in zip(a_values, b_values)]
+        )
+        print(f"   {batch} modmul - (a * b) % m: {native_time:.6f} segundos")
+        _, elapsed = measure(
+            lambda: [fast_multiply(a, b) % modulus for a, b in zip(a_values, b_values)]
+        )
+        print(f"   {batch} modmul - fast_multiply + %: {elapsed:.6f} segundos")
+        for context_class in (BarrettContext, MontgomeryContext):
+            context = context_class(modulus)
+            result, elapsed = measure(context.modmul_many, a_values, b_values)
+            assert result == expected, "Resultados diferentes!"
+            print(f"   {batch} modmul - {context_class.__name__}: {elapsed:.6f} segundos")
+        print()
+
+
+def benchmark_division():
+    """
+    Compara `fast_divmod` e `fast_isqrt` (Newton) com `divmod` e `math.isqrt`.
+    """
+    print("=== BENCHMARK: DIVISÃO E RAIZ QUADRADA ===\n")
+
+    rng = random.Random(0)
+
+    for bits in (1 << 14, 1 << 16, 1 << 18, 1 << 20):
+        print(f"🔍 Divisor de {bits:,} bits, dividendo de {2 * bits:,} bits")
+        b = rng.getrandbits(bits) | (1 << (bits - 1))
+        a = rng.getrandbits(2 * bits)
+
+        expected, native_time = measure(divmod, a, b)
+        result, newton_time = measure(fast_divmod, a, b)
+        assert result == expected, "Resultados diferentes!"
+        print(f"   divmod nativo: {native_time:.6f} segundos")
+        print(f"   fast_divmod: {newton_time:.6f} segundos")
+
+        expected, native_time = measure(math.isqrt, a)
+        result, newton_time = measure(fast_isqrt, a)
+        assert result == expected, "Resultados diferentes!"
+        print(f"   math.isqrt: {native_time:.6f} segundos")
+        print(f"   fast_isqrt: {newton_time:.6f} segundos")
+        print()
+
+
+def benchmark_corpus():
+    """
+    Multiplica os operandos do corpus reprodutível (corpus.py), lidos via mmap,
+    com o motor de Karatsuba e com a multiplicação nativa.
+    """
+    print("=== BENCHMARK: CORPUS DE OPERANDOS ===\n")
+
+    for case, x, y in iter_cases():
+        bits_x, bits_y = case["bits"]
+        print(f"🔍 {case['name']} ({bits_x:,} x {bits_y:,} bits)")
+
+        expected, native_time = measure(operator.mul, x, y)
+        result, fast_time = measure(fast_multiply, x, y)
+        assert result == expected, "Resultados diferentes!"
+        print(f"   Multiplicação nativa: {native_time:.6f} segundos")
+        print(f"   fast_multiply: {fast_time:.6f} segundos")
+
+        # karatsuba_multiply converte os números para string (limite de 4300 dígitos)
+        if case["size_class"] == "small":
+            result, karatsuba_time = measure(karatsuba_multiply, x, y)
+            assert result == expected, "Resultados diferentes!"
+            print(f"   karatsuba_multiply: {karatsuba_time:.6f} segundos")
+        print()
+
+
+def main():
+    """
+    Função principal.
+    """
+    benchmark_corpus()
+    benchmark_fibonacci()
+    benchmark_factorial()
+    benchmark_modular()
+    benchmark_division()
+    print("Benchmark concluído!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark da ordenação externa (BigOComplex/external_sort.py): vazão em MB/s
+de cada fase para um arquivo de inteiros de 64 bits maior que o limite de
+memória configurado.
+
+Uso:
+    python benchmark_external_sort.py [--size-mb N] [--memory-mb M] [--workers W]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# Adicionar o diretório BigOComplex ao path
+sys.path.append(os.path.join(os.path.dirname(__file__), "BigOComplex"))
+
+import numpy as np
+
+from BigOComplex.external_sort import external_sort
+
+# Registros gerados por vez ao criar o arquivo de entrada
+GENERATE_CHUNK = 1 << 22
+
+
+def generate_input(path, records, seed=0):
+    """
+    Grava `records` inteiros aleatórios de 64 bits em `path`, em partes.
+    """
+    rng = np.random.default_rng(seed)
+    with open(path, "wb") as f:
+        for lo in range(0, records, GENERATE_CHUNK):
+            count = min(GENERATE_CHUNK, records - lo)
+            rng.integers(-(2**63), 2**63 - 1, count, dtype=np.int64).tofile(f)
+
+
+def verify_output(input_path, output_path):
+    """
+    Confere, percorrendo o arquivo em partes via mmap, que a saída está em
+    ordem crescente e tem a mesma soma (módulo 2^64) que a entrada.
+    """
+    source = np.memmap(input_path, dtype="<i8", mode="r")
+    result = np.memmap(output_path, dtype="<i8", mode="r")
+    if source.size != result.size:
+        return False
+    checksum_in = checksum_out = 0
+    previous = None
+    for lo in range(0, result.size, GENERATE_CHUNK):
+        block = result[lo : lo + GENERATE_CHUNK]
+        if np.any(block[1:] < block[:-1]) or (previous is not None and block[0] < previous):
+            return False
+        previous = block[-1]
+        checksum_out += int(block.view(np.uint64).sum(dtype=np.uint64))
+        checksum_in += int(source[lo : lo + GENERATE_CHUNK].view(np.uint64).sum(dtype=np.uint64))
+    return checksum_in % 2**64 == checksum_out % 2**64
+
+
+def main():
+    """
+    Função principal.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=512)
+    parser.add_argument("--memory-mb", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--tmp-dir", default=None)
+    args = parser.parse_args()
+
+    print("=== BENCHMARK: ORDENAÇÃO EXTERNA ===\n")
+
+    records = args.size_mb * 1024 * 1024 // 8
+    size_mb = records * 8 / 1e6
+    work_dir = tempfile.mkdtemp(prefix="benchmark_external_sort_", dir=args.tmp_dir)
+    input_path = os.path.join(work_dir, "input.bin")
+    output_path = os.path.join(work_dir, "output.bin")
+
+    try:
+        start = time.perf_counter()
+        generate_input(input_path, records)
+        generate_time = time.perf_counter() - start
+        print(f"🔍 Arquivo com {records:,} inteiros de 64 bits ({size_mb:,.0f} MB)")
+        print(f"   Limite de memória: {args.memory_mb} MB")
+        print(f"   Geração: {generate_time:.2f} segundos ({size_mb / generate_time:,.0f} MB/s)")
+
+        stats = external_sort(
+            input_path, output_path, "<i8", args.memory_mb * 1024 * 1024,
+            args.workers, args.tmp_dir,
+        )
+        total = stats["run_time"] + stats["merge_time"]
+        print(
+            f"   Fase 1 - {stats['runs']} runs ordenados: {stats['run_time']:.2f} segundos "
+            f"({size_mb / stats['run_time']:,.0f} MB/s)"
+        )
+        print(
+            f"   Fase 2 - intercalação em {stats['merge_passes']} passada(s): "
+            f"{stats['merge_time']:.2f} segundos "
+            f"({size_mb / stats['merge_time']:,.0f} MB/s)"
+        )
+        print(f"   Total: {total:.2f} segundos ({size_mb / total:,.0f} MB/s)")
+
+        ok = verify_output(input_path, output_path)
+        print(f"   Saída ordenada e com a mesma soma: {'✅ Sim' if ok else '❌ Não'}")
+    finally:
+        for path in (input_path, output_path):
+            if os.path.exists(path):
+                os.remove(path)
+        os.rmdir(work_dir)
+
+    print("\nBenchmark concluído!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Histórico de benchmarks dos motores de multiplicação com detecção de regressões.
+
+Cada execução de `record` mede os motores em vários tamanhos de operando e
+acrescenta uma linha JSON por medição em `exports/benchmark_history.jsonl`
+(arquivo somente de acréscimo). O comando `compare` confronta as medições de
+uma revisão com as de uma revisão de referência na mesma máquina e termina com
+código de saída 1 se alguma regressão estatisticamente significativa for
+encontrada, ou 2 se a comparação não puder ser feita (histórico vazio,
+revisão desconhecida ou nenhuma medição em comum).
+
+Uso:
+    python benchmark_history.py record [--repeat N]
+    python benchmark_history.py compare [--baseline REV] [--candidate REV]
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+from main import fast_multiply, fast_square, karatsuba_multiply, traditional_multiply
+
+HISTORY_PATH = os.path.join("exports", "benchmark_history.jsonl")
+
+# Motores medidos e os tamanhos de operando (em dígitos decimais) de cada um.
+# karatsuba_multiply converte os números para string e é limitado a 4300 dígitos.
+ENGINES = {
+    "karatsuba_multiply": (karatsuba_multiply, (100, 1_000, 4_000)),
+    "fast_multiply": (fast_multiply, (1_000, 10_000, 100_000)),
+    "fast_square": (lambda x, y: fast_square(x), (1_000, 10_000, 100_000)),
+    "traditional_multiply": (traditional_multiply, (1_000, 10_000, 100_000)),
+}
+
+# Uma regressão só é reportada se a mediana piorar mais que este percentual...
+DEFAULT_THRESHOLD = 0.05
+# ...e o teste de Mann-Whitney rejeitar a igualdade com este nível de significância
+DEFAULT_ALPHA = 0.01
+
+
+def git_revision():
+    """
+    Retorna o hash do commit atual, com sufixo "-dirty" se houver alterações.
+    """
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "--short=12", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return revision + ("-dirty" if status else "")
+
+
+def machine_fingerprint():
+    """
+    Identifica a máquina e o interpretador em que as medições foram feitas.
+
+    Medições só são comparáveis entre si quando a impressão digital é a mesma.
+    """
+    info = {
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "system": platform.system(),
+        "release": platform.release(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "cpu_count": os.cpu_count(),
+        "node": platform.node(),
+    }
+    digest = hashlib.sha256(json.dumps(info, sort_keys=True).encode()).hexdigest()
+    return digest[:16], info
+
+
+def operands(digits, seed):
+    """
+    Gera dois operandos reprodutíveis com o número de dígitos informado.
+    """
+    rng = random.Random(seed)
+    low, high = 10 ** (digits - 1), 10**digits - 1
+    return rng.randint(low, high), rng.randint(low, high)
+
+
+def time_engine(func, x, y, repeat):
+    """
+    Mede `repeat` execuções de func(x, y) e retorna os tempos em segundos.
+    """
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(x, y)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def record(repeat):
+    """
+    Mede todos os motores e acrescenta os resultados ao histórico.
+    """
+    revision = git_revision()
+    fingerprint, info = machine_fingerprint()
+    timestamp = datetime.now().isoformat(timespec="seconds")
+
+    print(f"📊 Registrando benchmarks da revisão {revision}\n")
+    os.makedirs(os.path.dirname(HISTORY_PATH), exist_ok=True)
+
+    with open(HISTORY_PATH, "a", encoding="utf-8") as f:
+        for engine, (func, sizes) in ENGINES.items():
+            for digits in sizes:
+                x, y = operands(digits, seed=digits)
+                samples = time_engine(func, x, y, repeat)
+                entry = {
+                    "timestamp": timestamp,
+                    "revision": revision,
+                    "machine": fingerprint,
+                    "machine_info": info,
+                    "engine": engine,
+                    "digits": digits,
+                    "median": statistics.median(samples),
+                    "samples": samples,
+                }
+                f.write(json.dumps(entry) + "\n")
+                print(f"   {engine} ({digits:,} dígitos): {entry['median']:.6f} s")
+
+    print(f"\n💾 Resultados acrescentados em: {HISTORY_PATH}")
+
+
+def load_history():
+    if not os.path.exists(HISTORY_PATH):
+        return []
+    with open(HISTORY_PATH, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def mann_whitney_p(baseline, candidate):
+    """
+    Teste U de Mann-Whitney unilateral (aproximação normal).
+
+    Retorna a probabilidade de observar tempos do candidato pelo menos tão
+    maiores que os da referência se ambos viessem da mesma distribuição.
+    """
+    combined = sorted(
+        [(value, 0) for value in baseline] + [(value, 1) for value in candidate]
+    )
+    # Postos médios para valores empatados
+    ranks = [0.0] * len(combined)
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        i = j + 1
+
+    n1, n2 = len(baseline), len(candidate)
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, combined) if group == 1)
+    u = rank_sum - n2 * (n2 + 1) / 2
+    mean = n1 * n2 / 2
+    std = math.sqrt(n1 * n2 * (n1 + n2 + 1) / 12)
+    if std == 0:
+        return 1.0
+    z = (u - mean) / std
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def revision_matches(recorded, revision):
+    """
+    Confere se uma revisão gravada no histórico corresponde à informada.
+
+    O hash pode ser abreviado (prefixo), mas o sufixo "-dirty" precisa ser
+    igual: "abc123" não corresponde a "abc123-dirty".
+    """
+    dirty = recorded.endswith("-dirty")
+    if dirty != revision.endswith("-dirty"):
+        return False
+    return recorded.removesuffix("-dirty").startswith(revision.removesuffix("-dirty"))
+
+
+def compare(baseline, candidate, threshold, alpha):
+    """
+    Compara duas revisões e retorna o número de regressões encontradas, ou
+    None se a comparação não pôde ser feita (histórico vazio, revisão
+    desconhecida ou nenhuma medição em comum).
+    """
+    fingerprint, _ = machine_fingerprint()
+    history = [e for e in load_history() if e["machine"] == fingerprint]
+    revisions = list(dict.fromkeys(e["revision"] for e in history))
+
+    if not revisions:
+        print("❌ Nenhuma medição desta máquina no histórico. Execute 'record' antes.")
+        return None
+    candidate = candidate or revisions[-1]
+    if baseline is None:
+        previous = [rev for rev in revisions if rev != candidate]
+        if not previous:
+            print("❌ Não há outra revisão no histórico para usar como referência.")
+            return None
+        baseline = previous[-1]
+
+    def samples_of(revision):
+        groups = {}
+        for entry in history:
+            if revision_matches(entry["revision"], revision):
+                key = (entry["engine"], entry["digits"])
+                groups.setdefault(key, []).extend(entry["samples"])
+        return groups
+
+    base, cand = samples_of(baseline), samples_of(candidate)
+    for revision, groups in ((baseline, base), (candidate, cand)):
+        if not groups:
+            print(f"❌ Revisão {revision} não encontrada no histórico desta máquina.")
+            return None
+    common = sorted(base.keys() & cand.keys())
+    if not common:
+        print(f"❌ As revisões {baseline} e {candidate} não têm medições em comum.")
+        return None
+    print(f"🔍 Comparando {candidate} com a referência {baseline}\n")
+
+    regressions = 0
+    for key in common:
+        base_median = statistics.median(base[key])
+        cand_median = statistics.median(cand[key])
+        change = cand_median / base_median - 1
+        p_value = mann_whitney_p(base[key], cand[key])
+        regressed = change > threshold and p_value < alpha
+
+        status = "🔴 REGRESSÃO" if regressed else "✅"
+        engine, digits = key
+        print(
+            f"   {status} {engine} ({digits:,} dígitos): "
+            f"{base_median:.6f} s -> {cand_median:.6f} s "
+            f"({change:+.1%}, p={p_value:.4f})"
+        )
+        regressions += regressed
+
+    print(f"\n{'🔴' if regressions else '🎉'} {regressions} regressão(ões) encontrada(s)")
+    return regressions
+
+
+def main():
+    """
+    Função principal.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = commands.add_parser("record", help="mede e registra no histórico")
+    record_parser.add_argument("--repeat", type=int, default=15)
+
+    compare_parser = commands.add_parser("compare", help="detecta regressões")
+    compare_parser.add_argument("--baseline", help="revisão de referência")
+    compare_parser.add_argument("--candidate", help="revisão comparada")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    compare_parser.add_argument("--alpha", type=float, default=DEFAULT_ALPHA)
+
+    args = parser.parse_args()
+    if args.command == "record":
+        record(args.repeat)
+    else:
+        regressions = compare(args.baseline, args.candidate, args.threshold, args.alpha)
+        # 2: comparação impossível; 1: regressões encontradas
+        sys.exit(2 if regressions is None else 1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark do merge sort paralelo (BigOComplex/parallel_sort.py): speedup em
+relação à ordenação sequencial do NumPy para cada número de processos, e
+comparação com `merge_sort` do projeto BigOComplex e `sorted()`.
+
+Com mais processos do que núcleos (os.cpu_count()) os processos disputam os
+mesmos núcleos e o speedup esperado é no máximo o número de núcleos.
+
+Uso:
+    python benchmark_parallel_sort.py [--workers 1 2 4 8] [--sizes 1000000 10000000]
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+
+# Adicionar o diretório BigOComplex ao path
+sys.path.append(os.path.join(os.path.dirname(__file__), "BigOComplex"))
+
+import numpy as np
+
+from BigOComplex.functions import merge_sort
+from BigOComplex.parallel_sort import parallel_merge_sort_array
+
+# Tamanho da amostra usada para estimar o tempo do merge_sort em Python puro
+MERGE_SORT_SAMPLE = 100_000
+
+
+def measure(func, *args):
+    """
+    Mede o tempo de execução de uma função.
+    """
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def benchmark_size(n, worker_counts, rng):
+    """
+    Executa o benchmark para `n` inteiros aleatórios de 64 bits.
+    """
+    print(f"\n🔍 {n:,} inteiros de 64 bits")
+    values = rng.integers(-(2**63), 2**63 - 1, n, dtype=np.int64)
+
+    reference, sequential_time = measure(np.sort, values)
+    print(f"   np.sort (sequencial): {sequential_time:.3f} segundos")
+
+    for workers in worker_counts:
+        result, elapsed = measure(parallel_merge_sort_array, values, workers)
+        assert np.array_equal(result, reference), "Resultado incorreto!"
+        del result
+        speedup = sequential_time / elapsed
+        print(
+            f"   {workers} processo(s): {elapsed:.3f} segundos - speedup {speedup:.2f}x "
+            f"(eficiência {speedup / workers:.0%})"
+        )
+
+    data = values.tolist()
+    _, sorted_time = measure(sorted, data)
+    sample = data[:MERGE_SORT_SAMPLE]
+    _, merge_time = measure(merge_sort, sample)
+    merge_time *= (n * math.log2(n)) / (len(sample) * math.log2(len(sample)))
+    print(f"   sorted(): {sorted_time:.3f} segundos")
+    print(f"   merge_sort: {merge_time:.3f} segundos (estimado)")
+
+
+def main():
+    """
+    Função principal.
+    """
+    cores = os.cpu_count()
+    default_workers = sorted({1, 2, 4, cores})
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=default_workers)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000_000, 10_000_000])
+    args = parser.parse_args()
+
+    print("=== BENCHMARK: MERGE SORT PARALELO ===")
+    print(f"\n💻 Núcleos disponíveis: {cores}")
+
+    rng = np.random.default_rng(0)
+    for n in args.sizes:
+        benchmark_size(n, args.workers, rng)
+
+    print("\nBenchmark concluído!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark da multiplicação de polinômios por Karatsuba (polynomial.py) contra
+o produto escolar do `numpy.convolve`.
+"""
+
+import time
+
+import numpy as np
+
+from polynomial import poly_karatsuba
+
+SIZES = (64, 1_024, 16_384, 65_536, 262_144, 1_000_000)
+
+# Acima deste tamanho o `numpy.convolve` (O(n²)) leva tempo demais; o tempo é
+# extrapolado quadraticamente a partir da última medição
+CONVOLVE_LIMIT = 65_536
+
+# Número de polinômios e de coeficientes do benchmark em lote
+BATCH_SHAPE = (1_000, 2_048)
+
+# Linhas do lote modular conferidas com a convolução exata (inteiros do Python)
+MODULAR_CHECK_ROWS = 8
+
+
+def measure(func, *args):
+    """
+    Executa a função uma vez e retorna (resultado, tempo em segundos).
+    """
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def benchmark_single(rng):
+    """
+    Multiplica dois polinômios de coeficientes inteiros de cada tamanho.
+    """
+    print("=== BENCHMARK: KARATSUBA X NUMPY.CONVOLVE ===\n")
+
+    measured = None
+    for n in SIZES:
+        print(f"🔍 Polinômios com {n:,} coeficientes")
+        p = rng.integers(-1_000, 1_000, n)
+        q = rng.integers(-1_000, 1_000, n)
+
+        result, karatsuba_time = measure(poly_karatsuba, p, q)
+        print(f"   poly_karatsuba: {karatsuba_time:.4f} segundos")
+
+        if n <= CONVOLVE_LIMIT:
+            expected, convolve_time = measure(np.convolve, p, q)
+            assert np.array_equal(result, expected), "Resultados diferentes!"
+            measured = (n, convolve_time)
+            label = ""
+        else:
+            last_n, last_time = measured
+            convolve_time = last_time * (n / last_n) ** 2
+            label = " (estimado)"
+
+        speedup = convolve_time / karatsuba_time if karatsuba_time > 0 else float("inf")
+        print(f"   numpy.convolve: {convolve_time:.4f} segundos{label}")
+        print(f"   Karatsuba {speedup:.2f}x mais rápido\n")
+
+
+def benchmark_batch(rng):
+    """
+    Multiplica um lote de polinômios de uma vez e compara com um laço de
+    `numpy.convolve`, também no caso modular.
+    """
+    batch, n = BATCH_SHAPE
+    print(f"=== BENCHMARK: LOTE DE {batch:,} POLINÔMIOS DE {n:,} COEFICIENTES ===\n")
+
+    p = rng.integers(-1_000, 1_000, BATCH_SHAPE)
+    q = rng.integers(-1_000, 1_000, BATCH_SHAPE)
+    result, karatsuba_time = measure(poly_karatsuba, p, q)
+    expected, convolve_time = measure(
+        lambda: np.array([np.convolve(a, b) for a, b in zip(p, q)])
+    )
+    assert np.array_equal(result, expected), "Resultados diferentes!"
+    print(f"   poly_karatsuba: {karatsuba_time:.4f} segundos")
+    print(f"   numpy.convolve em laço: {convolve_time:.4f} segundos")
+
+    modulus = 998_244_353
+    p %= modulus
+    q %= modulus
+    result, modular_time = measure(poly_karatsuba, p, q, modulus)
+    # Referência exata: convolução com inteiros do Python, sem overflow
+    for row in np.linspace(0, batch - 1, MODULAR_CHECK_ROWS, dtype=int):
+        exact = np.convolve(p[row].astype(object), q[row].astype(object)) % modulus
+        assert np.array_equal(result[row], exact.astype(np.int64)), "Resultados diferentes!"
+    print(f"   poly_karatsuba mod {modulus:,}: {modular_time:.4f} segundos\n")
+
+
+def main():
+    """
+    Função principal.
+    """
+    rng = np.random.default_rng(0)
+    benchmark_single(rng)
+    benchmark_batch(rng)
+    print("Benchmark concluído!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark do radix sort LSD (BigOComplex/radix_sort.py) contra as ordenações
+por comparação do projeto BigOComplex, `sorted()` e `np.sort`, de 10^6 a 10^8
+chaves inteiras de 32 e 64 bits.
+
+As ordenações em Python puro são medidas em uma amostra menor e o tempo é
+extrapolado para o tamanho completo pela complexidade de cada uma (marcado
+como "estimado").
+
+Uso:
+    python benchmark_radix_sort.py [--max-exponent 8]
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+
+# Adicionar o diretório BigOComplex ao path
+sys.path.append(os.path.join(os.path.dirname(__file__), "BigOComplex"))
+
+import numpy as np
+
+from BigOComplex.functions import bubble_sort, intro_sort, merge_sort, natural_merge_sort, quick_sort
+from BigOComplex.radix_sort import radix_argsort, radix_sort, radix_sort_array
+
+# Maior tamanho medido diretamente por função e a complexidade usada para
+# extrapolar o tempo acima dele
+COMPARISON_SORTS = {
+    "sorted": (sorted, 10**7, "n log n"),
+    "radix_sort (lista)": (radix_sort, 10**7, "n"),
+    "merge_sort": (merge_sort, 10**5, "n log n"),
+    "natural_merge_sort": (natural_merge_sort, 10**5, "n log n"),
+    "quick_sort": (quick_sort, 10**5, "n log n"),
+    "intro_sort": (intro_sort, 10**5, "n log n"),
+    "bubble_sort": (bubble_sort, 2_000, "n²"),
+}
+
+_GROWTH = {
+    "n": lambda n: n,
+    "n log n": lambda n: n * math.log2(n),
+    "n²": lambda n: n * n,
+}
+
+
+def measure(func, *args):
+    """
+    Mede o tempo de execução de uma função.
+    """
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def benchmark_dtype(dtype, sizes, rng):
+    """
+    Executa o benchmark para chaves aleatórias em todo o intervalo de `dtype`.
+    """
+    info = np.iinfo(dtype)
+    print(f"\n🔍 Chaves {np.dtype(dtype).name} em [{info.min:,}, {info.max:,}]")
+
+    for n in sizes:
+        keys = rng.integers(info.min, info.max, n, dtype=dtype, endpoint=True)
+        print(f"\n   {n:,} elementos:")
+
+        reference, numpy_time = measure(np.sort, keys)
+        result, radix_time = measure(radix_sort_array, keys)
+        assert np.array_equal(result, reference), "radix_sort_array incorreto!"
+        assert result.dtype == keys.dtype, "radix_sort_array mudou o tipo das chaves!"
+        del result, reference
+        print(f"     radix_sort_array: {radix_time:.3f} segundos")
+        print(f"     np.sort: {numpy_time:.3f} segundos")
+
+        order, argsort_time = measure(radix_argsort, keys)
+        assert np.all(keys[order[1:]] >= keys[order[:-1]]), "radix_argsort incorreto!"
+        del order
+        print(f"     radix_argsort: {argsort_time:.3f} segundos")
+
+        for name, (func, limit, growth) in COMPARISON_SORTS.items():
+            sample = min(n, limit)
+            data = keys[:sample].tolist()
+            _, elapsed = measure(func, data)
+            del data
+            if sample < n:
+                elapsed *= _GROWTH[growth](n) / _GROWTH[growth](sample)
+            label = " (estimado)" if sample < n else ""
+            print(
+                f"     {name}: {elapsed:,.3f} segundos{label} - "
+                f"radix_sort_array {elapsed / radix_time:,.1f}x mais rápido"
+            )
+
+
+def main():
+    """
+    Função principal.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--max-exponent", type=int, default=8, help="maior tamanho: 10^N")
+    args = parser.parse_args()
+
+    print("=== BENCHMARK: RADIX SORT LSD ===")
+
+    rng = np.random.default_rng(0)
+    sizes = [10**e for e in range(6, args.max_exponent + 1)]
+    for dtype in (np.int32, np.int64):
+        benchmark_dtype(dtype, sizes, rng)
+
+    print("\nBenchmark concluído!")
+
+
+if __name__ == "__main__":
+    main()
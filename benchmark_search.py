@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark das buscas em lote: índice de Eytzinger (search_many) contra
+chamadas repetidas de `binary_search` e `linear_search` do projeto BigOComplex.
+"""
+
+import os
+import random
+import sys
+import time
+
+# Adicionar o diretório BigOComplex ao path
+sys.path.append(os.path.join(os.path.dirname(__file__), "BigOComplex"))
+
+import numpy as np
+
+from BigOComplex.functions import binary_search, linear_search
+from BigOComplex.search_index import EytzingerIndex
+
+# Número máximo de alvos medidos nas buscas feitas alvo a alvo; o tempo por
+# alvo é extrapolado para o lote completo
+LOOP_SAMPLE = {"binary_search": 20_000, "linear_search": 20}
+
+
+def time_loop(func, arr, targets, sample):
+    """
+    Mede o tempo por alvo de uma busca chamada em laço.
+    """
+    sample = targets[:sample]
+    start = time.perf_counter()
+    for target in sample:
+        func(arr, target)
+    return (time.perf_counter() - start) / len(sample)
+
+
+def benchmark_search(array_size, batch_sizes):
+    """
+    Executa o benchmark para uma lista ordenada de `array_size` elementos.
+    """
+    print(f"\n🔍 Lista ordenada com {array_size:,} elementos")
+
+    arr = sorted(random.sample(range(array_size * 4), array_size))
+
+    start = time.perf_counter()
+    index = EytzingerIndex(arr)
+    build_time = time.perf_counter() - start
+    print(f"   Construção do índice: {build_time:.3f} segundos")
+
+    for batch in batch_sizes:
+        # Cerca de 1/4 dos alvos estão presentes na lista
+        targets = np.random.randint(0, array_size * 4, size=batch)
+        target_list = targets.tolist()
+
+        start = time.perf_counter()
+        result = index.search_many(targets)
+        batch_time = time.perf_counter() - start
+
+        expected = [binary_search(arr, t) for t in target_list[:1000]]
+        assert result[:1000].tolist() == expected, "Resultados diferentes!"
+
+        print(f"\n   Lote de {batch:,} alvos:")
+        print(f"     search_many (Eytzinger): {batch_time:.4f} segundos")
+        for func in (binary_search, linear_search):
+            per_target = time_loop(func, arr, target_list, LOOP_SAMPLE[func.__name__])
+            estimated = per_target * batch
+            speedup = estimated / batch_time if batch_time > 0 else float("inf")
+            print(
+                f"     {func.__name__} em laço: {estimated:.4f} segundos "
+                f"(estimado) - search_many {speedup:,.1f}x mais rápido"
+            )
+
+
+def main():
+    """
+    Função principal.
+    """
+    print("=== BENCHMARK: BUSCA EM LOTE COM ÍNDICE DE EYTZINGER ===")
+
+    for array_size in (10_000, 1_000_000):
+        benchmark_search(array_size, (100_000, 1_000_000))
+
+    print("\nBenchmark concluído!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark da serialização binária de inteiros grandes (`dumps_int` /
+`read_int` em main.py) contra o `pickle`, incluindo a troca de operandos por
+um bloco de memória compartilhada.
+"""
+
+import pickle
+import random
+import time
+from multiprocessing import shared_memory
+
+from main import dumps_int, int_nbytes, loads_int, read_int, write_int
+
+# Tamanhos dos operandos, em bytes
+SIZES = (1_000, 100_000, 10_000_000, 100_000_000)
+
+
+def measure(func, *args):
+    """
+    Executa a função uma vez e retorna (resultado, tempo em segundos).
+    """
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def format_size(nbytes):
+    for unit in ("B", "KB", "MB"):
+        if nbytes < 1000 or unit == "MB":
+            return f"{nbytes:,.0f} {unit}"
+        nbytes /= 1000
+
+
+def benchmark_size(nbytes, rng):
+    """
+    Serializa e desserializa um operando de `nbytes` bytes com cada método.
+    """
+    print(f"🔍 Operando de {format_size(nbytes)}")
+    value = rng.getrandbits(8 * nbytes)
+
+    data, dump_time = measure(pickle.dumps, value, pickle.HIGHEST_PROTOCOL)
+    result, load_time = measure(pickle.loads, data)
+    assert result == value, "Resultados diferentes!"
+    print(
+        f"   pickle: {dump_time:.6f} + {load_time:.6f} segundos "
+        f"({format_size(len(data))})"
+    )
+
+    data, dump_time = measure(dumps_int, value)
+    result, load_time = measure(loads_int, data)
+    assert result == value, "Resultados diferentes!"
+    print(
+        f"   dumps_int / loads_int: {dump_time:.6f} + {load_time:.6f} segundos "
+        f"({format_size(len(data))})"
+    )
+
+    # Gravação e leitura direto no bloco compartilhado, como fariam dois
+    # processos (to_bytes e from_bytes ainda fazem uma cópia temporária)
+    shm = shared_memory.SharedMemory(create=True, size=int_nbytes(value))
+    try:
+        _, write_time = measure(write_int, shm.buf, 0, value)
+        (result, _), read_time = measure(read_int, shm.buf)
+        assert result == value, "Resultados diferentes!"
+        print(
+            f"   write_int / read_int (memória compartilhada): "
+            f"{write_time:.6f} + {read_time:.6f} segundos"
+        )
+    finally:
+        shm.close()
+        shm.unlink()
+    print()
+
+
+def main():
+    """
+    Função principal.
+    """
+    print("=== BENCHMARK: SERIALIZAÇÃO DE INTEIROS GRANDES ===\n")
+
+    rng = random.Random(0)
+    for nbytes in SIZES:
+        benchmark_size(nbytes, rng)
+
+    print("Benchmark concluído!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,351 @@
+"""
+Funções de aritmética com números inteiros grandes construídas sobre o motor de
+multiplicação de Karatsuba (`fast_multiply` / `fast_square` em main.py).
+"""
+
+import random
+import time
+from functools import lru_cache
+
+from main import fast_multiply, fast_square
+
+# Número máximo de resultados mantidos pelo cache de `cached_fibonacci`
+FIBONACCI_CACHE_SIZE = 128
+
+# Tamanho (em bits do divisor e do quociente) a partir do qual `fast_divmod`
+# supera o `divmod` nativo; abaixo dele a divisão é delegada ao nativo.
+# Valor obtido com `calibrate_divmod_cutoff()`.
+DIVMOD_CUTOFF_BITS = 131072
+
+# Bits extras de precisão usados ao truncar o divisor em `fast_divmod`
+DIVMOD_GUARD_BITS = 32
+
+
+def fast_fibonacci(n, multiply=None, square=None):
+    """
+    Calcula F(n) pelo método de duplicação rápida (fast doubling).
+
+    Percorre os bits de n do mais significativo para o menos significativo,
+    usando as identidades:
+        F(2k)     = F(k) * (2F(k+1) - F(k))
+        F(2k + 1) = F(k)² + F(k+1)²
+
+    São O(log n) passos, cada um com um produto e dois quadrados.
+
+    Args:
+        n (int): Índice do termo (n >= 0)
+        multiply (Callable): Função de multiplicação usada nos produtos
+            (padrão: `fast_multiply`)
+        square (Callable): Função de quadrado usada nos quadrados
+            (padrão: `fast_square`)
+
+    Returns:
+        int: O n-ésimo número de Fibonacci
+    """
+    if n < 0:
+        raise ValueError("n deve ser não negativo")
+    # Resolvidos na chamada, e não como valores padrão, para que troquem junto
+    # com o módulo (ex.: metrics.install())
+    multiply = multiply or fast_multiply
+    square = square or fast_square
+
+    a, b = 0, 1  # F(k), F(k+1) com k = 0
+    for bit in bin(n)[2:]:
+        c = multiply(a, 2 * b - a)  # F(2k)
+        d = square(a) + square(b)  # F(2k + 1)
+        if bit == "1":
+            a, b = d, c + d  # k -> 2k + 1
+        else:
+            a, b = c, d  # k -> 2k
+    return a
+
+
+@lru_cache(maxsize=FIBONACCI_CACHE_SIZE)
+def cached_fibonacci(n):
+    """
+    Versão de `fast_fibonacci` com cache limitado para consultas repetidas.
+    """
+    return fast_fibonacci(n)
+
+
+def product_tree(values, lo=0, hi=None):
+    """
+    Multiplica values[lo:hi] por divisão binária (binary splitting).
+
+    Os produtos são combinados em uma árvore balanceada, de modo que cada
+    multiplicação envolve operandos de tamanhos parecidos, o caso em que o
+    algoritmo de Karatsuba é mais vantajoso.
+
+    Args:
+        values (list): Fatores a serem multiplicados
+        lo (int): Índice inicial (inclusivo)
+        hi (int): Índice final (exclusivo); padrão: len(values)
+
+    Returns:
+        int: Produto dos fatores (1 para intervalo vazio)
+    """
+    if hi is None:
+        hi = len(values)
+    if hi - lo <= 8:
+        result = 1
+        for i in range(lo, hi):
+            result *= values[i]
+        return result
+    mid = (lo + hi) // 2
+    return fast_multiply(product_tree(values, lo, mid), product_tree(values, mid, hi))
+
+
+def _odd_product(lo, hi):
+    # Produto dos números ímpares no intervalo (lo, hi]
+    return product_tree(range(lo + 1 | 1, hi + 1, 2))
+
+
+def product_tree_factorial(n):
+    """
+    Calcula n! com árvore de produtos e fatoração das potências de dois.
+
+    Usa a identidade n! = (n//2)! * 2^(n//2) * (produto dos ímpares <= n):
+    a parte ímpar de n! é o produto, para cada i, dos ímpares até n >> i, e
+    todos os fatores 2 são aplicados no final com um único deslocamento
+    (n! contém exatamente n - popcount(n) fatores 2).
+
+    Args:
+        n (int): Número não negativo
+
+    Returns:
+        int: Fatorial de n
+    """
+    if n < 0:
+        raise ValueError("n deve ser não negativo")
+
+    inner = outer = 1
+    for i in range(n.bit_length() - 1, -1, -1):
+        # inner = produto dos ímpares <= n >> i
+        inner = fast_multiply(inner, _odd_product(n >> (i + 1), n >> i))
+        outer = fast_multiply(outer, inner)
+    return outer << (n - bin(n).count("1"))
+
+
+def _primes_up_to(n):
+    # Crivo de Eratóstenes
+    sieve = bytearray([1]) * (n + 1)
+    sieve[: min(n + 1, 2)] = bytes(min(n + 1, 2))
+    for p in range(2, int(n**0.5) + 1):
+        if sieve[p]:
+            sieve[p * p :: p] = bytes(len(range(p * p, n + 1, p)))
+    return [p for p in range(2, n + 1) if sieve[p]]
+
+
+def _swing(n, primes):
+    # Oscilação (swing) de n: n! / ((n//2)!)², como produto de potências de primos
+    factors = []
+    for p in primes:
+        if p > n:
+            break
+        power, q = 1, n
+        while q >= p:
+            q //= p
+            if q & 1:
+                power *= p
+        if power > 1:
+            factors.append(power)
+    return product_tree(factors)
+
+
+def prime_swing_factorial(n):
+    """
+    Calcula n! pelo método da oscilação de primos (prime swing).
+
+    Usa a recorrência n! = ((n//2)!)² * swing(n), onde swing(n) é obtido
+    diretamente da fatoração em primos. Os quadrados usam `fast_square`.
+
+    Args:
+        n (int): Número não negativo
+
+    Returns:
+        int: Fatorial de n
+    """
+    if n < 0:
+        raise ValueError("n deve ser não negativo")
+
+    primes = _primes_up_to(n)
+    result = 1
+    for i in range(n.bit_length() - 1, -1, -1):
+        m = n >> i
+        result = fast_multiply(fast_square(result), _swing(m, primes))
+    return result
+
+
+def _reciprocal(b, t):
+    """
+    Retorna uma aproximação de 2^(2t) / b para um b com exatamente t bits.
+
+    Iteração de Newton com duplicação de precisão: a recíproca dos t/2 bits
+    mais significativos de b é escalada e refinada por um passo
+        x <- x + x * (2^(2t) - b * x) / 2^(2t)
+    que dobra o número de bits corretos. Cada nível custa duas multiplicações
+    de até t bits, logo o total é O(M(t)). O resultado pode diferir de
+    floor(2^(2t) / b) em poucas unidades; quem o usa corrige o quociente final.
+    """
+    if t <= 64:
+        return (1 << (2 * t)) // b
+
+    h = t // 2 + 1
+    x = _reciprocal(b >> (t - h), h) << (t - h)
+    error = (1 << (2 * t)) - fast_multiply(b, x)
+    return x + (fast_multiply(x, error) >> (2 * t))
+
+
+def _divmod_balanced(a, b):
+    """
+    Divisão de a por b quando o quociente tem no máximo tantos bits quanto b.
+
+    Usa a variante de Karp-Markstein: a recíproca é calculada com apenas
+    metade da precisão necessária, e a metade restante dos bits do quociente
+    é obtida multiplicando o resto parcial pela mesma recíproca, o que evita
+    o último (e mais caro) passo de Newton.
+    """
+    k = a.bit_length() - b.bit_length() + 1  # Bits do quociente
+    t = k + DIVMOD_GUARD_BITS
+
+    # Apenas os t bits mais significativos do divisor influenciam o quociente
+    shift = max(b.bit_length() - t, 0)
+    big_a, big_b = a >> shift, b >> shift
+    t = big_b.bit_length()
+
+    # x ≈ 2^(t + h) / B com h bits corretos
+    h = min(t, t // 2 + DIVMOD_GUARD_BITS)
+    x = _reciprocal(big_b >> (t - h), h)
+
+    def approx_quotient(n):
+        # n / B usando só os 2h bits mais significativos de n
+        s = max(abs(n).bit_length() - 2 * h, 0)
+        return fast_multiply(n >> s, x) >> (t + h - s)
+
+    q = approx_quotient(big_a)
+    q += approx_quotient(big_a - fast_multiply(q, big_b))
+
+    # O quociente estimado erra por poucas unidades (truncamento do divisor e
+    # últimos ulps da recíproca): corrige com o resto exato
+    r = a - fast_multiply(q, b)
+    while r < 0:
+        q -= 1
+        r += b
+    while r >= b:
+        q += 1
+        r -= b
+    return q, r
+
+
+def _divmod_positive(a, b):
+    n = b.bit_length()
+    k = a.bit_length() - n + 1
+    if a < b:
+        return 0, a
+    if n < DIVMOD_CUTOFF_BITS or k < DIVMOD_CUTOFF_BITS:
+        return divmod(a, b)
+    if k <= n:
+        return _divmod_balanced(a, b)
+
+    # Quociente maior que o divisor: divide blocos de n bits do dividendo,
+    # do mais significativo para o menos, como na divisão escolar
+    position = a.bit_length() - a.bit_length() % n
+    q_blocks, r = [], a >> position
+    mask = (1 << n) - 1
+    while position > 0:
+        position -= n
+        current = (r << n) | ((a >> position) & mask)
+        qi, r = _divmod_balanced(current, b) if current >= b else (0, current)
+        q_blocks.append(qi)
+    q = 0
+    for qi in q_blocks:
+        q = (q << n) | qi
+    return q, r
+
+
+def fast_divmod(a, b):
+    """
+    Divisão inteira com recíproca calculada pela iteração de Newton.
+
+    A recíproca do divisor é obtida com precisão dobrando a cada passo e
+    usando `fast_multiply` em todas as multiplicações; o quociente estimado é
+    corrigido com o resto exato. Abaixo de DIVMOD_CUTOFF_BITS usa o `divmod`
+    nativo. Segue a mesma convenção de sinais do `divmod` do Python.
+
+    Args:
+        a (int): Dividendo
+        b (int): Divisor (diferente de zero)
+
+    Returns:
+        tuple: (quociente, resto)
+    """
+    if b == 0:
+        raise ZeroDivisionError("divisão por zero")
+
+    q, r = _divmod_positive(abs(a), abs(b))
+    if (a < 0) != (b < 0):
+        q = -q
+        if r:
+            q -= 1
+            r = abs(b) - r
+    if b < 0:
+        r = -r
+    return q, r
+
+
+def fast_isqrt(n):
+    """
+    Raiz quadrada inteira (floor(sqrt(n))) por Newton com duplicação de precisão.
+
+    Mesmo algoritmo de `math.isqrt`: a cada passo a raiz dos bits mais
+    significativos é estendida para o dobro de bits com uma iteração de
+    Newton. As divisões usam `fast_divmod` e o quadrado final `fast_square`.
+
+    Args:
+        n (int): Número não negativo
+
+    Returns:
+        int: Maior inteiro a tal que a² <= n
+    """
+    if n < 0:
+        raise ValueError("n deve ser não negativo")
+    if n == 0:
+        return 0
+
+    c = (n.bit_length() - 1) // 2
+    a, d = 1, 0
+    for s in reversed(range(c.bit_length())):
+        e, d = d, c >> s
+        a = (a << (d - e - 1)) + fast_divmod(n >> (2 * c - e - d + 1), a)[0]
+    return a - (fast_square(a) > n)
+
+
+def calibrate_divmod_cutoff(max_bits=1 << 20, repeat=3):
+    """
+    Mede o menor tamanho em que `fast_divmod` supera o `divmod` nativo.
+
+    Testa divisões balanceadas (dividendo com o dobro de bits do divisor)
+    em tamanhos que dobram a cada passo.
+
+    Returns:
+        int: Tamanho do divisor, em bits, a partir do qual `fast_divmod`
+        é mais rápido (ou None se isso não ocorrer até max_bits)
+    """
+    rng = random.Random(0)
+    bits = 1024
+    while bits <= max_bits:
+        b = rng.getrandbits(bits) | (1 << (bits - 1))
+        a = rng.getrandbits(2 * bits)
+
+        def best(func):
+            times = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                func(a, b)
+                times.append(time.perf_counter() - start)
+            return min(times)
+
+        if best(_divmod_balanced) < best(divmod):
+            return bits
+        bits *= 2
+    return None
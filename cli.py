@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Ponto de entrada único para as ferramentas do projeto.
+
+Cada subcomando importa seus módulos (e dependências opcionais como bigO,
+graphviz e numpy) apenas quando é executado, de modo que comandos simples
+como `multiply` iniciam rapidamente.
+
+Uso:
+    python -m cli multiply 12345 67890 [--engine karatsuba|fast|traditional]
+    python -m cli compare 12345 67890
+    python -m cli test
+    python -m cli cyclomatic
+    python -m cli bigo [--force]
+    python -m cli graph [arquivos ou diretórios...] [--force]
+    python -m cli bench {search,bigint,polynomial,serialization,external_sort,radix_sort,parallel_sort}
+    python -m cli history {record,compare} [opções...]
+    python -m cli fuzz [opções...]
+"""
+
+import argparse
+import sys
+
+
+def run_multiply(args):
+    from main import fast_multiply, karatsuba_multiply, traditional_multiply
+
+    engines = {
+        "karatsuba": karatsuba_multiply,
+        "fast": fast_multiply,
+        "traditional": traditional_multiply,
+    }
+    print(engines[args.engine](args.x, args.y))
+
+
+def run_compare(args):
+    from main import compare_algorithms
+
+    result = compare_algorithms(args.x, args.y)
+    print(f"Resultado Karatsuba: {result['karatsuba_result']}")
+    print(f"Tempo Karatsuba: {result['karatsuba_time']:.6f} segundos")
+    print(f"Tempo Tradicional: {result['traditional_time']:.6f} segundos")
+    print(f"Resultados coincidem: {'Sim' if result['results_match'] else 'Não'}")
+
+
+def run_test(args):
+    import test_karatsuba
+
+    test_karatsuba.test_edge_cases()
+    test_karatsuba.benchmark_algorithms()
+
+
+def run_cyclomatic(args):
+    import analyze_karatsuba_complexity
+
+    analyze_karatsuba_complexity.main()
+
+
+def run_bigo(args):
+    import analyze_karatsuba_bigO
+
+    sys.argv = ["analyze_karatsuba_bigO.py"] + (["--force"] if args.force else [])
+    analyze_karatsuba_bigO.main()
+
+
+def run_graph(args):
+    import generate_graph
+
+    sys.argv = ["generate_graph.py", *args.paths] + (["--force"] if args.force else [])
+    generate_graph.main()
+
+
+def run_bench(args):
+    if args.suite == "search":
+        import benchmark_search as benchmark
+    elif args.suite == "polynomial":
+        import benchmark_polynomial as benchmark
+    elif args.suite == "serialization":
+        import benchmark_serialization as benchmark
+    elif args.suite == "external_sort":
+        import benchmark_external_sort as benchmark
+
+        sys.argv = ["benchmark_external_sort.py"]
+    elif args.suite == "radix_sort":
+        import benchmark_radix_sort as benchmark
+
+        sys.argv = ["benchmark_radix_sort.py"]
+    elif args.suite == "parallel_sort":
+        import benchmark_parallel_sort as benchmark
+
+        sys.argv = ["benchmark_parallel_sort.py"]
+    else:
+        import benchmark_bigint as benchmark
+    benchmark.main()
+
+
+def run_history(args):
+    import benchmark_history
+
+    sys.argv = ["benchmark_history.py", *args.options]
+    benchmark_history.main()
+
+
+def run_fuzz(args):
+    import fuzz
+
+    sys.argv = ["fuzz.py", *args.options]
+    fuzz.main()
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m cli", description="Ferramentas do projeto Karatsuba"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    multiply = commands.add_parser("multiply", help="multiplica dois inteiros")
+    multiply.add_argument("x", type=int)
+    multiply.add_argument("y", type=int)
+    multiply.add_argument(
+        "--engine", choices=("karatsuba", "fast", "traditional"), default="karatsuba"
+    )
+    multiply.set_defaults(handler=run_multiply)
+
+    compare = commands.add_parser("compare", help="compara Karatsuba e tradicional")
+    compare.add_argument("x", type=int)
+    compare.add_argument("y", type=int)
+    compare.set_defaults(handler=run_compare)
+
+    test = commands.add_parser("test", help="casos extremos e benchmark")
+    test.set_defaults(handler=run_test)
+
+    cyclomatic = commands.add_parser("cyclomatic", help="complexidade ciclomática")
+    cyclomatic.set_defaults(handler=run_cyclomatic)
+
+    bigo = commands.add_parser("bigo", help="complexidade Big-O (big-O-calculator)")
+    bigo.add_argument("--force", action="store_true")
+    bigo.set_defaults(handler=run_bigo)
+
+    graph = commands.add_parser("graph", help="grafos de fluxo (graphviz)")
+    graph.add_argument("paths", nargs="*")
+    graph.add_argument("--force", action="store_true")
+    graph.set_defaults(handler=run_graph)
+
+    bench = commands.add_parser("bench", help="benchmarks")
+    bench.add_argument(
+        "suite",
+        choices=(
+            "search", "bigint", "polynomial", "serialization",
+            "external_sort", "radix_sort", "parallel_sort",
+        ),
+    )
+    bench.set_defaults(handler=run_bench)
+
+    history = commands.add_parser("history", help="histórico de benchmarks")
+    history.add_argument("options", nargs=argparse.REMAINDER)
+    history.set_defaults(handler=run_history)
+
+    fuzz = commands.add_parser("fuzz", help="fuzzing diferencial dos multiplicadores")
+    fuzz.add_argument("options", nargs=argparse.REMAINDER)
+    fuzz.set_defaults(handler=run_fuzz)
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    # Subcomandos que repassam opções (history, fuzz) recebem também as que
+    # começam com "--" antes de qualquer argumento posicional
+    args, extra = parser.parse_known_args(argv)
+    if extra:
+        if not hasattr(args, "options"):
+            parser.error(f"argumentos não reconhecidos: {' '.join(extra)}")
+        args.options = extra + args.options
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Corpus reprodutível de operandos grandes para os benchmarks.
+
+Os operandos são gerados a partir de uma semente com `random.getrandbits`
+(linear no número de bits, ao contrário de `random.randint(10**(d-1), ...)`),
+gravados em arquivos binários de limbs little-endian e descritos por um
+manifesto com checksums SHA-256. Os benchmarks abrem os arquivos com `mmap`
+em vez de gerar os números a cada execução, e todas as execuções medem
+exatamente as mesmas entradas.
+
+Cada arquivo contém os dois operandos (x e y) em sequência, no formato binário
+de `dumps_int` / `read_int` (main.py): cabeçalho de 8 bytes com o tamanho e o
+sinal, seguido dos limbs de 64 bits em little-endian.
+
+Uso:
+    python corpus.py generate [--seed N] [--classes small,medium,...] [--force]
+    python corpus.py verify
+    python corpus.py list
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import mmap
+import os
+import random
+import sys
+
+from main import dumps_int, read_int
+
+CORPUS_DIR = os.path.join("exports", "corpus")
+MANIFEST_NAME = "manifest.json"
+FORMAT_VERSION = 1
+DEFAULT_SEED = 0
+
+# Classes de tamanho, em número (aproximado) de dígitos decimais dos operandos
+SIZE_CLASSES = {
+    "small": 100,
+    "medium": 10_000,
+    "large": 100_000,
+    "huge": 1_000_000,
+}
+
+# Formatos especiais de operando gerados para cada classe de tamanho
+SHAPES = ("random", "all_nines", "power_of_two", "sparse", "unbalanced")
+
+# Número de bits ligados nos operandos esparsos
+SPARSE_BITS = 16
+
+# Razão entre os tamanhos dos operandos no formato desbalanceado
+UNBALANCED_RATIO = 1_000
+
+def digits_to_bits(digits):
+    """
+    Maior número de bits que ainda garante no máximo `digits` dígitos decimais.
+    """
+    return max(int(digits * math.log2(10)), 1)
+
+
+def _random_operand(rng, bits):
+    # O bit mais significativo é ligado para que o operando tenha exatamente `bits` bits
+    return rng.getrandbits(bits) | (1 << (bits - 1))
+
+
+def _sparse_operand(rng, bits):
+    positions = rng.sample(range(bits - 1), min(SPARSE_BITS, bits - 1))
+    return sum(1 << p for p in positions) | (1 << (bits - 1))
+
+
+def make_operands(shape, digits, rng):
+    """
+    Gera o par de operandos (x, y) de um formato e classe de tamanho.
+
+    Args:
+        shape (str): Um dos formatos de SHAPES
+        digits (int): Número aproximado de dígitos decimais
+        rng (random.Random): Gerador com semente
+
+    Returns:
+        tuple: Par de inteiros (x, y)
+    """
+    bits = digits_to_bits(digits)
+    if shape == "random":
+        return _random_operand(rng, bits), _random_operand(rng, bits)
+    if shape == "all_nines":
+        nines = 10**digits - 1
+        return nines, nines
+    if shape == "power_of_two":
+        return 1 << (bits - 1), 1 << (bits - 1)
+    if shape == "sparse":
+        return _sparse_operand(rng, bits), _sparse_operand(rng, bits)
+    if shape == "unbalanced":
+        small_bits = max(bits // UNBALANCED_RATIO, 64)
+        return _random_operand(rng, bits), _random_operand(rng, small_bits)
+    raise ValueError(f"formato desconhecido: {shape}")
+
+
+def seeded_operands(digits, seed=DEFAULT_SEED):
+    """
+    Par de operandos com exatamente `digits` dígitos decimais, gerado sob
+    demanda a partir da semente.
+
+    Para operandos pequenos demais para valer um arquivo do corpus (testes e
+    wrappers do BigO Calculator): a mesma semente e o mesmo número de dígitos
+    produzem sempre o mesmo par, em qualquer execução.
+
+    Args:
+        digits (int): Número de dígitos decimais de cada operando
+        seed (int): Semente do gerador
+
+    Returns:
+        tuple: Par de inteiros (x, y)
+    """
+    rng = random.Random(f"{seed}:digits:{digits}")
+    low, high = 10 ** (digits - 1), 10**digits - 1
+    return rng.randint(low, high), rng.randint(low, high)
+
+
+def decode_operands(buffer, count=2):
+    """
+    Lê `count` operandos consecutivos de um buffer (bytes, memoryview ou mmap).
+    """
+    values = []
+    offset = 0
+    for _ in range(count):
+        value, offset = read_int(buffer, offset)
+        values.append(value)
+    return values
+
+
+def _sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_manifest(directory=CORPUS_DIR):
+    """
+    Retorna o manifesto do corpus, ou None se ele ainda não foi gerado.
+    """
+    path = os.path.join(directory, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def generate_corpus(directory=CORPUS_DIR, seed=DEFAULT_SEED, classes=None, force=False):
+    """
+    Gera os arquivos do corpus e o manifesto.
+
+    Se já existir um corpus com a mesma semente e as mesmas classes, ele é
+    reaproveitado (a menos que `force` seja verdadeiro).
+
+    Args:
+        directory (str): Diretório de saída
+        seed (int): Semente do gerador
+        classes (list): Nomes das classes de tamanho (padrão: todas)
+        force (bool): Regenera mesmo que o corpus já exista
+
+    Returns:
+        dict: Manifesto do corpus
+    """
+    classes = list(classes or SIZE_CLASSES)
+    manifest = load_manifest(directory)
+    if (
+        not force
+        and manifest is not None
+        and manifest["seed"] == seed
+        and manifest["classes"] == classes
+        and manifest["format_version"] == FORMAT_VERSION
+    ):
+        return manifest
+
+    os.makedirs(directory, exist_ok=True)
+    cases = []
+    for size_class in classes:
+        digits = SIZE_CLASSES[size_class]
+        for shape in SHAPES:
+            name = f"{shape}-{size_class}"
+            # Cada caso tem o próprio gerador: o conteúdo de um caso não
+            # depende de quais outras classes foram geradas
+            rng = random.Random(f"{seed}:{name}")
+            x, y = make_operands(shape, digits, rng)
+
+            filename = f"{name}.bin"
+            path = os.path.join(directory, filename)
+            with open(path, "wb") as f:
+                f.write(dumps_int(x))
+                f.write(dumps_int(y))
+
+            cases.append(
+                {
+                    "name": name,
+                    "shape": shape,
+                    "size_class": size_class,
+                    "digits": digits,
+                    "bits": [x.bit_length(), y.bit_length()],
+                    "file": filename,
+                    "bytes": os.path.getsize(path),
+                    "sha256": _sha256_file(path),
+                }
+            )
+
+    manifest = {
+        "format_version": FORMAT_VERSION,
+        "seed": seed,
+        "classes": classes,
+        "cases": cases,
+    }
+    with open(os.path.join(directory, MANIFEST_NAME), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def load_case(name, directory=CORPUS_DIR):
+    """
+    Lê o par de operandos de um caso do corpus via `mmap`.
+
+    Args:
+        name (str): Nome do caso (ex.: "random-large")
+        directory (str): Diretório do corpus
+
+    Returns:
+        tuple: Par de inteiros (x, y)
+    """
+    path = os.path.join(directory, f"{name}.bin")
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        x, y = decode_operands(m)
+    return x, y
+
+
+def iter_cases(directory=CORPUS_DIR, size_class=None, shape=None):
+    """
+    Percorre os casos do manifesto, gerando o corpus padrão se necessário.
+
+    Yields:
+        tuple: (entrada do manifesto, x, y)
+    """
+    manifest = load_manifest(directory) or generate_corpus(directory)
+    for case in manifest["cases"]:
+        if size_class not in (None, case["size_class"]):
+            continue
+        if shape not in (None, case["shape"]):
+            continue
+        x, y = load_case(case["name"], directory)
+        yield case, x, y
+
+
+def verify_corpus(directory=CORPUS_DIR):
+    """
+    Confere os checksums de todos os arquivos do corpus.
+
+    Returns:
+        list: Nomes dos casos ausentes ou corrompidos
+    """
+    manifest = load_manifest(directory)
+    if manifest is None:
+        raise FileNotFoundError(f"manifesto não encontrado em {directory}")
+    invalid = []
+    for case in manifest["cases"]:
+        path = os.path.join(directory, case["file"])
+        if not os.path.exists(path) or _sha256_file(path) != case["sha256"]:
+            invalid.append(case["name"])
+    return invalid
+
+
+def main():
+    """
+    Função principal.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--dir", default=CORPUS_DIR, help="diretório do corpus")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate = commands.add_parser("generate", help="gera o corpus e o manifesto")
+    generate.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    generate.add_argument(
+        "--classes", default=",".join(SIZE_CLASSES), help="classes separadas por vírgula"
+    )
+    generate.add_argument("--force", action="store_true")
+
+    commands.add_parser("verify", help="confere os checksums")
+    commands.add_parser("list", help="lista os casos do manifesto")
+
+    args = parser.parse_args()
+    if args.command == "generate":
+        classes = args.classes.split(",")
+        unknown = [c for c in classes if c not in SIZE_CLASSES]
+        if unknown:
+            parser.error(f"classes desconhecidas: {', '.join(unknown)}")
+        manifest = generate_corpus(args.dir, args.seed, classes, args.force)
+        print(f"💾 Corpus com {len(manifest['cases'])} casos em: {args.dir}")
+    elif args.command == "verify":
+        invalid = verify_corpus(args.dir)
+        for name in invalid:
+            print(f"   ✗ {name}")
+        print(f"{'❌' if invalid else '✅'} {len(invalid)} caso(s) inválido(s)")
+        sys.exit(1 if invalid else 0)
+    else:
+        manifest = load_manifest(args.dir)
+        if manifest is None:
+            print("❌ Corpus ainda não gerado. Execute 'generate' antes.")
+            return
+        print(f"📂 Corpus (semente {manifest['seed']}):")
+        for case in manifest["cases"]:
+            bits_x, bits_y = case["bits"]
+            print(f"   {case['name']}: {bits_x:,} x {bits_y:,} bits ({case['bytes']:,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
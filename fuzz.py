@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Fuzzing diferencial dos motores de multiplicação com verificação modular.
+
+Em vez de recalcular x * y com outro multiplicador (o que dobra o custo e
+depende de um segundo algoritmo correto), cada produto é conferido módulo
+alguns primos aleatórios de 61 bits: se (x mod p)(y mod p) ≡ produto (mod p)
+para todos os primos, o produto está correto com probabilidade de erro
+desprezível. Cada redução mod p custa O(n).
+
+Os operandos são gerados em formatos que costumam expor erros: cadeias de
+"vai um" (2^k - 1, 10^k - 1), tamanhos nas fronteiras de divisão (pares e
+ímpares, em torno do corte), metades nulas, números negativos e operandos
+desbalanceados. Os casos são distribuídos entre processos até o fim do
+orçamento de tempo; cada caso é reprodutível a partir da semente impressa.
+
+Uso:
+    python fuzz.py [--budget SEGUNDOS] [--workers N] [--max-bits B] [--seed S]
+    python fuzz.py --replay SEMENTE_DO_CASO [--max-bits B]
+"""
+
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from main import KARATSUBA_CUTOFF_BITS, fast_multiply, fast_square, karatsuba_multiply
+
+# karatsuba_multiply converte os números para string (limite de 4300 dígitos)
+KARATSUBA_MAX_BITS = 13_000
+
+ENGINES = {
+    "karatsuba_multiply": (karatsuba_multiply, KARATSUBA_MAX_BITS),
+    "fast_multiply": (fast_multiply, None),
+    "fast_square": (lambda x, y: fast_square(x), None),
+}
+
+# Número de primos usados na verificação de cada produto
+DEFAULT_PRIMES = 3
+
+DEFAULT_BUDGET = 60
+DEFAULT_MAX_BITS = 1 << 20
+
+# Bases do teste de Miller-Rabin, determinístico para n < 3.3 * 10^24
+_MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+
+def is_prime(n):
+    """
+    Teste de primalidade de Miller-Rabin (determinístico para n < 3.3 * 10^24).
+    """
+    if n < 2:
+        return False
+    for p in _MILLER_RABIN_BASES:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in _MILLER_RABIN_BASES:
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def random_prime(rng, bits=61):
+    """
+    Sorteia um primo com exatamente `bits` bits.
+    """
+    while True:
+        candidate = rng.getrandbits(bits) | (1 << (bits - 1)) | 1
+        if is_prime(candidate):
+            return candidate
+
+
+def verify_product(x, y, product, primes):
+    """
+    Confere x * y == product módulo cada primo, em tempo O(n).
+    """
+    return all((x % p) * (y % p) % p == product % p for p in primes)
+
+
+def _random_size(rng, max_bits):
+    # Tamanhos em escala logarítmica, com preferência pelas fronteiras de corte
+    if rng.random() < 0.3:
+        base = KARATSUBA_CUTOFF_BITS << rng.randrange(0, 6)
+        return max(1, min(base + rng.randint(-2, 2), max_bits))
+    return max(1, int(2 ** rng.uniform(0, max_bits.bit_length() - 1)))
+
+
+def _operand(rng, shape, bits):
+    if shape == "ones":  # cadeia de "vai um" binária: 2^k - 1
+        return (1 << bits) - 1
+    if shape == "nines":  # cadeia de "vai um" decimal: 10^k - 1
+        return 10 ** max(1, bits * 3 // 10) - 1
+    if shape == "power":
+        return 1 << (bits - 1)
+    if shape == "low_zero":  # metade inferior nula
+        half = bits // 2
+        return (rng.getrandbits(bits - half) | 1) << half
+    if shape == "high_zero":  # metade superior nula (operando "curto" no corte)
+        return rng.getrandbits(max(bits // 2, 1))
+    if shape == "zero":
+        return 0
+    return rng.getrandbits(bits) | (1 << (bits - 1))
+
+
+SHAPES = ("random", "ones", "nines", "power", "low_zero", "high_zero", "zero")
+
+
+def make_case(seed, max_bits):
+    """
+    Gera um caso de teste reprodutível a partir de uma semente.
+
+    Returns:
+        tuple: (nome do motor, x, y, descrição do caso)
+    """
+    rng = random.Random(seed)
+    engine = rng.choice(list(ENGINES))
+    limit = ENGINES[engine][1] or max_bits
+    limit = min(limit, max_bits)
+
+    bits_x = _random_size(rng, limit)
+    # Operandos desbalanceados em parte dos casos
+    bits_y = max(1, bits_x >> rng.randrange(0, 12)) if rng.random() < 0.3 else bits_x
+    shape_x, shape_y = rng.choice(SHAPES), rng.choice(SHAPES)
+    x, y = _operand(rng, shape_x, bits_x), _operand(rng, shape_y, bits_y)
+    if rng.random() < 0.25:
+        x = -x
+    if rng.random() < 0.25:
+        y = -y
+    if engine == "fast_square":
+        y, shape_y = x, shape_x
+
+    description = f"{engine}: {shape_x}({x.bit_length()} bits) x {shape_y}({y.bit_length()} bits)"
+    return engine, x, y, description
+
+
+def run_worker(worker, seed, budget, max_bits, prime_count):
+    """
+    Executa casos até o fim do orçamento de tempo.
+
+    Cada processo sorteia os próprios primos, de modo que processos
+    diferentes verificam com primos diferentes.
+
+    Returns:
+        dict: Número de casos por motor, tempos gastos e falhas encontradas
+    """
+    rng = random.Random(f"{seed}:primes:{worker}")
+    primes = [random_prime(rng) for _ in range(prime_count)]
+    deadline = time.perf_counter() + budget
+    counts = {engine: 0 for engine in ENGINES}
+    failures = []
+    multiply_time = verify_time = 0.0
+
+    case = 0
+    while time.perf_counter() < deadline:
+        case_seed = f"{seed}:{worker}:{case}"
+        engine, x, y, description = make_case(case_seed, max_bits)
+        func = ENGINES[engine][0]
+
+        start = time.perf_counter()
+        try:
+            product = func(x, y)
+        except Exception as e:  # uma exceção também é uma falha
+            failures.append((case_seed, description, repr(e)))
+            case += 1
+            continue
+        middle = time.perf_counter()
+        ok = verify_product(x, y, product, primes)
+        end = time.perf_counter()
+
+        multiply_time += middle - start
+        verify_time += end - middle
+        counts[engine] += 1
+        if not ok:
+            failures.append((case_seed, description, "produto incorreto"))
+        case += 1
+
+    return {
+        "counts": counts,
+        "failures": failures,
+        "multiply_time": multiply_time,
+        "verify_time": verify_time,
+    }
+
+
+def fuzz(budget=DEFAULT_BUDGET, workers=None, max_bits=DEFAULT_MAX_BITS, seed=None,
+         prime_count=DEFAULT_PRIMES):
+    """
+    Executa o fuzzing em paralelo e retorna os resultados combinados.
+
+    Args:
+        budget (float): Orçamento de tempo, em segundos
+        workers (int): Número de processos (padrão: os.cpu_count())
+        max_bits (int): Tamanho máximo dos operandos, em bits
+        seed (int): Semente (padrão: aleatória)
+        prime_count (int): Número de primos de 61 bits por verificação
+
+    Returns:
+        dict: Semente, casos por motor, tempos e falhas
+    """
+    workers = workers or os.cpu_count()
+    seed = random.randrange(1 << 32) if seed is None else seed
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(run_worker, worker, seed, budget, max_bits, prime_count)
+            for worker in range(workers)
+        ]
+        results = [future.result() for future in futures]
+
+    counts = {engine: sum(r["counts"][engine] for r in results) for engine in ENGINES}
+    return {
+        "seed": seed,
+        "counts": counts,
+        "failures": [f for r in results for f in r["failures"]],
+        "multiply_time": sum(r["multiply_time"] for r in results),
+        "verify_time": sum(r["verify_time"] for r in results),
+    }
+
+
+def main():
+    """
+    Função principal.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET, help="segundos")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-bits", type=int, default=DEFAULT_MAX_BITS)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--primes", type=int, default=DEFAULT_PRIMES)
+    parser.add_argument("--replay", help="reexecuta um caso pela semente impressa")
+    args = parser.parse_args()
+
+    if args.replay:
+        engine, x, y, description = make_case(args.replay, args.max_bits)
+        try:
+            ok = ENGINES[engine][0](x, y) == x * y
+        except Exception as e:  # uma exceção também é uma falha
+            print(f"❌ {description}: {e!r}")
+            raise SystemExit(1)
+        print(f"{'✅' if ok else '❌'} {description}")
+        if not ok:
+            raise SystemExit(1)
+        return
+
+    print(f"🔍 Fuzzing por {args.budget:g} segundos...")
+    result = fuzz(args.budget, args.workers, args.max_bits, args.seed, args.primes)
+
+    total = sum(result["counts"].values())
+    print(f"\n📊 Semente {result['seed']}: {total:,} casos ({total * 60 / args.budget:,.0f} por minuto)")
+    for engine, count in result["counts"].items():
+        print(f"   {engine}: {count:,} casos")
+    print(
+        f"   Tempo multiplicando: {result['multiply_time']:.2f} s | "
+        f"verificando: {result['verify_time']:.2f} s"
+    )
+
+    for case_seed, description, error in result["failures"]:
+        print(f"   ❌ [{case_seed}] {description}: {error}")
+    if result["failures"]:
+        print(f"\n   Para reproduzir: python fuzz.py --replay SEMENTE --max-bits {args.max_bits}")
+    print(f"\n{'❌' if result['failures'] else '🎉'} {len(result['failures'])} falha(s)")
+    if result["failures"]:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
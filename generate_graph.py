@@ -1,87 +1,236 @@
 #!/usr/bin/env python3
 """
-Script para gerar uma imagem do grafo de fluxo do algoritmo de Karatsuba.
-Este script cria uma visualização gráfica do fluxo de controle da função.
+Script para gerar imagens dos grafos de fluxo de controle de funções Python.
+
+Os grafos são derivados automaticamente da AST de cada função (ver
+CyclomaticComplex/cfg.py). O layout de cada grafo é calculado uma única vez e
+os formatos de saída (PNG, SVG e PDF) são renderizados em paralelo a partir do
+layout já posicionado. Grafos cujo hash não mudou desde a última execução não
+são renderizados novamente.
+
+Requer o pacote `graphviz` e os executáveis `dot` (layout) e `neato`
+(renderização a partir do layout) do Graphviz no PATH.
+
+Uso:
+    python generate_graph.py                  # Grafo do algoritmo de Karatsuba
+    python generate_graph.py arquivo.py dir/  # Grafos de todas as funções
 """
 
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from CyclomaticComplex.cfg import cfg_from_function, cfgs_from_source
+
 try:
-    from graphviz import Digraph
-    import os
-
-    def create_karatsuba_flowchart():
-        """
-        Cria o grafo de fluxo do algoritmo de Karatsuba.
-        """
-        # Criar o grafo
-        dot = Digraph(comment="Grafo de Fluxo - Algoritmo de Karatsuba")
-        dot.attr(rankdir="TB")
-
-        # Definir estilos
-        dot.attr(
-            "node", shape="box", style="rounded,filled", fontname="Arial", fontsize="10"
-        )
-
-        # Adicionar nós
-        dot.node("A", "Entrada da função", fillcolor="#e1f5fe")
-        dot.node("B", "x < 10 ou y < 10?", fillcolor="#fff3e0", shape="diamond")
-        dot.node("C", "Retorno: x * y", fillcolor="#c8e6c9")
-        dot.node("D", "Calcular n = max dígitos", fillcolor="#f5f5f5")
-        dot.node("E", "n é ímpar?", fillcolor="#fff3e0", shape="diamond")
-        dot.node("F", "n = n + 1", fillcolor="#f5f5f5")
-        dot.node("G", "Calcular divisor = 10^(n/2)", fillcolor="#f5f5f5")
-        dot.node("H", "Dividir números em partes", fillcolor="#f5f5f5")
-        dot.node("I", "Chamada recursiva:\nkaratsuba(a, c)", fillcolor="#f3e5f5")
-        dot.node("J", "Chamada recursiva:\nkaratsuba(b, d)", fillcolor="#f3e5f5")
-        dot.node("K", "Chamada recursiva:\nkaratsuba(a+b, c+d)", fillcolor="#f3e5f5")
-        dot.node("L", "Calcular resultado final", fillcolor="#f5f5f5")
-        dot.node("M", "Retorno do resultado", fillcolor="#c8e6c9")
-
-        # Adicionar arestas
-        dot.edge("A", "B")
-        dot.edge("B", "C", "Sim")
-        dot.edge("B", "D", "Não")
-        dot.edge("D", "E")
-        dot.edge("E", "F", "Sim")
-        dot.edge("E", "G", "Não")
-        dot.edge("F", "G")
-        dot.edge("G", "H")
-        dot.edge("H", "I")
-        dot.edge("H", "J")
-        dot.edge("H", "K")
-        dot.edge("I", "L")
-        dot.edge("J", "L")
-        dot.edge("K", "L")
-        dot.edge("L", "M")
-
-        return dot
-
-    def main():
-        """
-        Função principal que gera o grafo.
-        """
-        print("Gerando grafo de fluxo do algoritmo de Karatsuba...")
+    from graphviz import Digraph, ExecutableNotFound, pipe
+except ImportError:
+    Digraph = None
 
-        # Criar o grafo
-        dot = create_karatsuba_flowchart()
+# Formatos gerados para cada grafo
+FORMATS = ("png", "svg", "pdf")
 
-        # Salvar como PNG
-        dot.render("exports/karatsuba_flowchart", format="png", cleanup=True)
-        print("✓ Grafo salvo como 'exports/karatsuba_flowchart.png'")
+# Arquivo com os hashes dos grafos já renderizados
+CACHE_PATH = os.path.join("exports", ".flowchart_cache.json")
 
-        # Salvar como SVG (mais nítido)
-        dot.render("exports/karatsuba_flowchart", format="svg", cleanup=True)
-        print("✓ Grafo salvo como 'exports/karatsuba_flowchart.svg'")
+# Saída do grafo do algoritmo de Karatsuba, sem extensão
+KARATSUBA_OUTPUT = os.path.join("exports", "karatsuba_flowchart")
 
-        # Salvar como PDF
-        dot.render("exports/karatsuba_flowchart", format="pdf", cleanup=True)
-        print("✓ Grafo salvo como 'exports/karatsuba_flowchart.pdf'")
+# Estilo de cada tipo de nó do grafo de fluxo
+NODE_STYLES = {
+    "entry": {"fillcolor": "#e1f5fe"},
+    "exit": {"fillcolor": "#e1f5fe"},
+    "decision": {"fillcolor": "#fff3e0", "shape": "diamond"},
+    "return": {"fillcolor": "#c8e6c9"},
+    "block": {"fillcolor": "#f5f5f5"},
+}
 
-        print("\nArquivos gerados com sucesso!")
-        print("Você pode incluir a imagem no README.md")
 
-    if __name__ == "__main__":
-        main()
+def create_flowchart(cfg):
+    """
+    Converte um grafo de fluxo de controle em um Digraph do Graphviz.
 
-except ImportError:
-    print("❌ Erro: A biblioteca 'graphviz' não está instalada.")
-    print("Para instalar, execute: pip install graphviz")
+    Args:
+        cfg (ControlFlowGraph): Grafo de fluxo de controle da função
+
+    Returns:
+        Digraph: Grafo pronto para ser renderizado
+    """
+    dot = Digraph(comment=f"Grafo de Fluxo - {cfg.name}")
+    dot.attr(rankdir="TB")
+    dot.attr(
+        "node", shape="box", style="rounded,filled", fontname="Arial", fontsize="10"
+    )
+
+    for node_id, label, kind in cfg.nodes:
+        dot.node(node_id, label, **NODE_STYLES[kind])
+    for source, target, label in cfg.edges:
+        dot.edge(source, target, label)
+
+    return dot
+
+
+def create_karatsuba_flowchart():
+    """
+    Cria o grafo de fluxo do algoritmo de Karatsuba.
+    """
+    from main import karatsuba_multiply
+
+    return create_flowchart(cfg_from_function(karatsuba_multiply))
+
+
+def render_flowchart(dot, output, executor):
+    """
+    Calcula o layout uma única vez e renderiza todos os formatos em paralelo.
+
+    O layout é feito pelo `dot` com saída em xdot (grafo já posicionado). Os
+    formatos finais são gerados pelo `neato -n2`, que reaproveita as posições
+    calculadas em vez de refazer o layout. Os dois executáveis precisam estar
+    no PATH; sem eles é lançado `ExecutableNotFound`.
+
+    Args:
+        dot (Digraph): Grafo a ser renderizado
+        output (str): Caminho de saída, sem extensão
+        executor (ThreadPoolExecutor): Executor usado para as renderizações
+
+    Returns:
+        list: Caminhos dos arquivos gerados
+    """
+    laid_out = dot.pipe(format="xdot")
+
+    def render(fmt):
+        path = f"{output}.{fmt}"
+        data = pipe("neato", fmt, laid_out, neato_no_op=2)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    return list(executor.map(render, FORMATS))
+
+
+def collect_graphs(paths):
+    """
+    Coleta os grafos de fluxo de todas as funções dos arquivos informados.
+
+    Diretórios são percorridos recursivamente em busca de arquivos `.py`.
+
+    Returns:
+        list: Lista de tuplas (caminho de saída sem extensão, Digraph)
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                dirs[:] = sorted(d for d in dirs if not d.startswith((".", "__")))
+                files += [os.path.join(root, n) for n in sorted(names) if n.endswith(".py")]
+        else:
+            files.append(path)
+
+    graphs = []
+    for file in files:
+        with open(file, encoding="utf-8") as f:
+            code = f.read()
+        prefix = os.path.splitext(os.path.normpath(file))[0].replace(os.sep, ".")
+        for cfg in cfgs_from_source(code):
+            output = os.path.join("exports", "flowcharts", f"{prefix}.{cfg.name}")
+            graphs.append((output, create_flowchart(cfg)))
+    return graphs
+
+
+def load_cache():
+    if not os.path.exists(CACHE_PATH):
+        return {}
+    with open(CACHE_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def flowchart_digest(dot):
+    """
+    Hash SHA-256 do código DOT do grafo (estrutura, rótulos e estilo).
+    """
+    return hashlib.sha256(dot.source.encode("utf-8")).hexdigest()
+
+
+def is_up_to_date(cache, output, digest):
+    """
+    Verifica se o grafo já foi renderizado com o mesmo hash em todos os formatos.
+    """
+    if cache.get(output) != digest:
+        return False
+    return all(os.path.exists(f"{output}.{fmt}") for fmt in FORMATS)
+
+
+def generate_flowcharts(graphs, force=False):
+    """
+    Renderiza os grafos informados, pulando os que não mudaram.
+
+    Args:
+        graphs (list): Lista de tuplas (caminho de saída, Digraph)
+        force (bool): Se True, renderiza todos os grafos ignorando o cache
+
+    Returns:
+        tuple: (lista de caminhos renderizados, número de grafos pulados)
+    """
+    cache = {} if force else load_cache()
+    digests = [(output, dot, flowchart_digest(dot)) for output, dot in graphs]
+    pending = [item for item in digests if not is_up_to_date(cache, item[0], item[2])]
+
+    rendered = []
+    with ThreadPoolExecutor() as graph_pool, ThreadPoolExecutor() as format_pool:
+
+        def job(item):
+            output, dot, digest = item
+            os.makedirs(os.path.dirname(output), exist_ok=True)
+            render_flowchart(dot, output, format_pool)
+            return output, digest
+
+        for output, digest in graph_pool.map(job, pending):
+            cache[output] = digest
+            rendered.append(output)
+
+    os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+    with open(CACHE_PATH, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+
+    return rendered, len(graphs) - len(pending)
+
+
+def main():
+    """
+    Função principal que gera os grafos.
+    """
+    if Digraph is None:
+        print("❌ Erro: A biblioteca 'graphviz' não está instalada.")
+        print("Para instalar, execute: pip install graphviz")
+        return
+
+    args = sys.argv[1:]
+    force = "--force" in args
+    paths = [arg for arg in args if arg != "--force"]
+
+    if paths:
+        print(f"Gerando grafos de fluxo das funções em: {', '.join(paths)}...")
+        graphs = collect_graphs(paths)
+    else:
+        print("Gerando grafo de fluxo do algoritmo de Karatsuba...")
+        graphs = [(KARATSUBA_OUTPUT, create_karatsuba_flowchart())]
+
+    try:
+        rendered, skipped = generate_flowcharts(graphs, force=force)
+    except ExecutableNotFound:
+        print("❌ Erro: Os executáveis do Graphviz (dot e neato) não foram encontrados no PATH.")
+        return
+
+    for output in rendered:
+        print(f"✓ Grafo salvo como '{output}' ({', '.join(FORMATS)})")
+    if skipped:
+        print(f"↷ {skipped} grafo(s) sem alterações (use --force para renderizar)")
+
+    print("\nArquivos gerados com sucesso!")
+    print("Você pode incluir a imagem no README.md")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,6 @@
+import struct
+
+
 def karatsuba_multiply(x, y):
     """
     Implementação do algoritmo de Karatsuba para multiplicação de números inteiros.
@@ -42,6 +45,164 @@ def karatsuba_multiply(x, y):
     return result
 
 
+# Abaixo deste número de bits os produtos são delegados à multiplicação nativa,
+# cujo laço em C é mais rápido que a recursão em Python para operandos pequenos
+KARATSUBA_CUTOFF_BITS = 4096
+
+
+def fast_multiply(x, y):
+    """
+    Algoritmo de Karatsuba em base binária para números inteiros grandes.
+
+    Diferente de `karatsuba_multiply`, divide os números por deslocamento de
+    bits em vez de potências de 10, evitando a conversão para string (que é
+    quadrática e limitada a 4300 dígitos no Python 3.11+).
+
+    Args:
+        x (int): Primeiro número inteiro
+        y (int): Segundo número inteiro
+
+    Returns:
+        int: Produto de x e y
+    """
+    product = _fast_multiply(abs(x), abs(y))
+    return -product if (x < 0) != (y < 0) else product
+
+
+def _fast_multiply(x, y):
+    # Recursão de `fast_multiply` para x, y >= 0. Fica separada do ponto de
+    # entrada público para que instrumentações (ex.: metrics.py) que trocam
+    # `fast_multiply` não vejam as chamadas recursivas.
+
+    # Caso base: operandos pequenos (ou muito desbalanceados)
+    if min(x.bit_length(), y.bit_length()) < KARATSUBA_CUTOFF_BITS:
+        return x * y
+
+    half = max(x.bit_length(), y.bit_length()) // 2
+    mask = (1 << half) - 1
+
+    # Dividir os números em partes alta e baixa
+    a, b = x >> half, x & mask
+    c, d = y >> half, y & mask
+
+    ac = _fast_multiply(a, c)
+    bd = _fast_multiply(b, d)
+    ad_bc = _fast_multiply(a + b, c + d) - ac - bd
+
+    return (ac << (2 * half)) + (ad_bc << half) + bd
+
+
+def fast_square(x):
+    """
+    Calcula x² com a variante de Karatsuba para quadrados.
+
+    Usa três quadrados recursivos: (a+b)², a² e b², aproveitando que os dois
+    operandos são iguais.
+
+    Args:
+        x (int): Número inteiro
+
+    Returns:
+        int: Quadrado de x
+    """
+    return _fast_square(abs(x))
+
+
+def _fast_square(x):
+    # Recursão de `fast_square` para x >= 0 (ver `_fast_multiply`)
+    if x.bit_length() < KARATSUBA_CUTOFF_BITS:
+        return x * x
+
+    half = x.bit_length() // 2
+    a, b = x >> half, x & ((1 << half) - 1)
+
+    a2 = _fast_square(a)
+    b2 = _fast_square(b)
+    ab2 = _fast_square(a + b) - a2 - b2  # 2ab
+
+    return (a2 << (2 * half)) + (ab2 << half) + b2
+
+
+# Formato binário dos inteiros: cabeçalho de 8 bytes little-endian com sinal
+# (número de bytes do valor absoluto, negativo se o número for negativo)
+# seguido do valor absoluto em little-endian, completado com zeros até um
+# múltiplo de INT_LIMB_BYTES (limbs de 64 bits)
+INT_HEADER = struct.Struct("<q")
+INT_LIMB_BYTES = 8
+
+
+def int_nbytes(value):
+    """
+    Retorna o número de bytes ocupados por `value` no formato binário.
+    """
+    size = (abs(value).bit_length() + 7) // 8
+    return INT_HEADER.size + -(-size // INT_LIMB_BYTES) * INT_LIMB_BYTES
+
+
+def write_int(buffer, offset, value):
+    """
+    Grava um inteiro no formato binário dentro de um buffer gravável.
+
+    Args:
+        buffer: bytearray, memoryview, mmap ou `SharedMemory.buf`
+        offset (int): Posição inicial da gravação
+        value (int): Número a ser gravado
+
+    Returns:
+        int: Posição logo após o número gravado
+    """
+    size = (abs(value).bit_length() + 7) // 8
+    end = offset + int_nbytes(value)
+    INT_HEADER.pack_into(buffer, offset, -size if value < 0 else size)
+    start = offset + INT_HEADER.size
+    view = memoryview(buffer)
+    view[start:end] = abs(value).to_bytes(end - start, "little")
+    view.release()
+    return end
+
+
+def read_int(buffer, offset=0):
+    """
+    Lê um inteiro no formato binário a partir de um buffer.
+
+    O buffer não precisa ser convertido em bytes antes da leitura, mas
+    `int.from_bytes` faz uma cópia temporária dos limbs ao construir o
+    inteiro: o pico de memória é cerca de duas vezes o tamanho do número.
+
+    Args:
+        buffer: bytes, bytearray, memoryview, mmap ou `SharedMemory.buf`
+        offset (int): Posição do cabeçalho do número
+
+    Returns:
+        tuple: (número lido, posição logo após o número)
+    """
+    (size,) = INT_HEADER.unpack_from(buffer, offset)
+    start = offset + INT_HEADER.size
+    view = memoryview(buffer)
+    value = int.from_bytes(view[start : start + abs(size)], "little")
+    view.release()
+    end = start + -(-abs(size) // INT_LIMB_BYTES) * INT_LIMB_BYTES
+    return (-value if size < 0 else value), end
+
+
+def dumps_int(value):
+    """
+    Serializa um inteiro no formato binário.
+    """
+    size = (abs(value).bit_length() + 7) // 8
+    padded = int_nbytes(value) - INT_HEADER.size
+    return INT_HEADER.pack(-size if value < 0 else size) + abs(value).to_bytes(
+        padded, "little"
+    )
+
+
+def loads_int(data):
+    """
+    Lê um inteiro serializado por `dumps_int`.
+    """
+    return read_int(data)[0]
+
+
 def traditional_multiply(x, y):
     """
     Implementação da multiplicação tradicional para comparação.
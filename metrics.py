@@ -0,0 +1,315 @@
+"""
+Registro opcional de métricas dos pontos de entrada da multiplicação.
+
+Depois de `install()`, cada chamada de `karatsuba_multiply`, `fast_multiply`
+e `fast_square` registra, por faixa de tamanho dos operandos e pelo motor
+escolhido (multiplicação nativa abaixo do corte ou recursão de Karatsuba):
+número de chamadas, histograma de latência em faixas fixas de escala
+logarítmica, tempo total e bytes processados. Chamadas recursivas internas
+não são contadas, apenas a chamada externa.
+
+Cada thread atualiza a própria cópia das métricas, sem lock; o lock só é
+usado ao criar a cópia de uma thread nova e ao tirar um snapshot. O snapshot
+pode ser exportado em JSON ou no formato texto do OpenMetrics, gravado em
+arquivo ou servido por HTTP em um endereço local.
+
+Uso:
+    import metrics
+    metrics.install()
+    ...
+    metrics.write("exports/metrics.txt")          # ou "exports/metrics.json"
+    metrics.serve(port=9464)                      # GET /metrics ou /metrics.json
+"""
+
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import main
+
+# Faixas de latência: potências de 2 a partir de 2^10 ns (~1 µs) até 2^37 ns
+# (~137 s). O índice da faixa é obtido de `bit_length()`, sem busca binária.
+# Chamadas mais longas que a última faixa só entram no total (faixa +Inf).
+LATENCY_MIN_BITS = 10
+LATENCY_BUCKETS = 28
+
+# Nome de cada ponto de entrada instrumentado e a função que informa o motor
+# escolhido para os operandos
+_ENTRY_POINTS = {
+    "karatsuba_multiply": lambda x, y: (
+        "builtin" if x < 10 or y < 10 else "karatsuba_decimal"
+    ),
+    "fast_multiply": lambda x, y: (
+        "builtin"
+        if min(abs(x).bit_length(), abs(y).bit_length()) < main.KARATSUBA_CUTOFF_BITS
+        else "karatsuba"
+    ),
+    "fast_square": lambda x: (
+        "builtin" if abs(x).bit_length() < main.KARATSUBA_CUTOFF_BITS else "karatsuba"
+    ),
+}
+
+
+def latency_bucket_bounds():
+    """
+    Limites superiores (em segundos) das faixas do histograma de latência.
+    """
+    return [2 ** (LATENCY_MIN_BITS + i) / 1e9 for i in range(LATENCY_BUCKETS)]
+
+
+class MetricsRegistry:
+    """
+    Métricas agregadas por (ponto de entrada, motor, faixa de tamanho).
+
+    A faixa de tamanho é a menor potência de 2 maior ou igual ao número de
+    bits do maior operando.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards = []
+        self._lock = threading.Lock()
+
+    def _shard(self):
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = {}
+            with self._lock:
+                self._shards.append(shard)
+            return shard
+
+    def observe(self, entry, engine, bits, nbytes, elapsed_ns):
+        """
+        Registra uma chamada.
+
+        Args:
+            entry (str): Ponto de entrada (ex.: "fast_multiply")
+            engine (str): Motor escolhido
+            bits (int): Número de bits do maior operando
+            nbytes (int): Bytes dos operandos processados
+            elapsed_ns (int): Duração da chamada em nanossegundos
+        """
+        key = (entry, engine, 1 << max(bits - 1, 0).bit_length())
+        shard = self._shard()
+        stats = shard.get(key)
+        if stats is None:
+            stats = shard[key] = [0, 0, 0, [0] * LATENCY_BUCKETS]
+        stats[0] += 1
+        stats[1] += elapsed_ns
+        stats[2] += nbytes
+        # Menor faixa i com elapsed_ns <= 2^(LATENCY_MIN_BITS + i)
+        index = max((elapsed_ns - 1).bit_length() - LATENCY_MIN_BITS, 0)
+        if index < LATENCY_BUCKETS:
+            stats[3][index] += 1
+
+    def snapshot(self):
+        """
+        Combina as métricas de todas as threads.
+
+        Returns:
+            list: Um dicionário por (entry, engine, size_bits), ordenados
+        """
+        merged = {}
+        with self._lock:
+            shards = list(self._shards)
+        for shard in shards:
+            for key, (count, total_ns, nbytes, histogram) in list(shard.items()):
+                stats = merged.setdefault(key, [0, 0, 0, [0] * LATENCY_BUCKETS])
+                stats[0] += count
+                stats[1] += total_ns
+                stats[2] += nbytes
+                stats[3] = [a + b for a, b in zip(stats[3], histogram)]
+        return [
+            {
+                "entry": entry,
+                "engine": engine,
+                "size_bits": size_bits,
+                "calls": count,
+                "seconds": total_ns / 1e9,
+                "bytes": nbytes,
+                "latency_histogram": histogram,
+            }
+            for (entry, engine, size_bits), (count, total_ns, nbytes, histogram)
+            in sorted(merged.items())
+        ]
+
+    def reset(self):
+        with self._lock:
+            for shard in self._shards:
+                shard.clear()
+
+    def to_json(self):
+        """
+        Exporta o snapshot em JSON, com os limites das faixas de latência.
+        """
+        return json.dumps(
+            {"latency_buckets_seconds": latency_bucket_bounds(), "series": self.snapshot()},
+            indent=2,
+        )
+
+    def to_openmetrics(self):
+        """
+        Exporta o snapshot no formato texto do OpenMetrics.
+        """
+        series = self.snapshot()
+        bounds = latency_bucket_bounds()
+
+        def labels(s, **extra):
+            pairs = {
+                "entry": s["entry"], "engine": s["engine"], "size_bits": s["size_bits"], **extra
+            }
+            return "{" + ",".join(f'{k}="{v}"' for k, v in pairs.items()) + "}"
+
+        lines = [
+            "# TYPE karatsuba_calls counter",
+            "# HELP karatsuba_calls Chamadas por ponto de entrada, motor e faixa de tamanho.",
+        ]
+        lines += [f"karatsuba_calls_total{labels(s)} {s['calls']}" for s in series]
+        lines += [
+            "# TYPE karatsuba_bytes counter",
+            "# UNIT karatsuba_bytes bytes",
+            "# HELP karatsuba_bytes Bytes dos operandos processados.",
+        ]
+        lines += [f"karatsuba_bytes_total{labels(s)} {s['bytes']}" for s in series]
+        lines += [
+            "# TYPE karatsuba_latency_seconds histogram",
+            "# UNIT karatsuba_latency_seconds seconds",
+            "# HELP karatsuba_latency_seconds Latência das chamadas.",
+        ]
+        for s in series:
+            cumulative = 0
+            for bound, count in zip(bounds, s["latency_histogram"]):
+                cumulative += count
+                lines.append(
+                    f"karatsuba_latency_seconds_bucket{labels(s, le=repr(bound))} {cumulative}"
+                )
+            lines.append(f"karatsuba_latency_seconds_bucket{labels(s, le='+Inf')} {s['calls']}")
+            lines.append(f"karatsuba_latency_seconds_count{labels(s)} {s['calls']}")
+            lines.append(f"karatsuba_latency_seconds_sum{labels(s)} {s['seconds']}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+# Funções originais substituídas por `install`, para `uninstall`
+_originals = {}
+
+# Marca, por thread, que já há uma chamada instrumentada em andamento
+_active = threading.local()
+
+
+def _instrument(entry, func, registry):
+    choose_engine = _ENTRY_POINTS[entry]
+
+    def wrapper(*args):
+        # A recursão de `karatsuba_multiply` passa pelo nome global e chega
+        # aqui (a de fast_multiply/fast_square usa funções privadas): apenas a
+        # chamada externa é medida
+        if getattr(_active, "busy", False):
+            return func(*args)
+        _active.busy = True
+        start = time.perf_counter_ns()
+        try:
+            return func(*args)
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            _active.busy = False
+            bits = max(abs(a).bit_length() for a in args)
+            nbytes = sum((abs(a).bit_length() + 7) // 8 for a in args)
+            registry.observe(entry, choose_engine(*args), bits, nbytes, elapsed)
+
+    wrapper.__name__ = func.__name__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__wrapped__ = func
+    return wrapper
+
+
+def _project_modules():
+    # Módulos que importaram as funções com `from main import ...`
+    return [
+        module for module in list(sys.modules.values())
+        if module is not None and getattr(module, "__file__", None)
+        and module.__file__.startswith(main.__file__.rsplit("main.py", 1)[0])
+    ]
+
+
+def install(registry=REGISTRY):
+    """
+    Passa a registrar as chamadas dos pontos de entrada em `registry`.
+
+    Substitui as funções em `main` e nos módulos do projeto já importados que
+    as referenciam (ex.: `bigint.fast_multiply`). Referências guardadas antes
+    da instalação em outros lugares (como valores padrão de parâmetros)
+    continuam chamando a versão sem métricas.
+    """
+    if _originals:
+        uninstall()
+    for entry in _ENTRY_POINTS:
+        original = getattr(main, entry)
+        _originals[entry] = original
+        wrapped = _instrument(entry, original, registry)
+        for module in _project_modules():
+            if getattr(module, entry, None) is original:
+                setattr(module, entry, wrapped)
+
+
+def uninstall():
+    """
+    Restaura as funções originais.
+    """
+    for entry, original in _originals.items():
+        for module in _project_modules():
+            current = getattr(module, entry, None)
+            if getattr(current, "__wrapped__", None) is original:
+                setattr(module, entry, original)
+    _originals.clear()
+
+
+def write(path, registry=REGISTRY):
+    """
+    Grava o snapshot em arquivo: JSON se o nome terminar em ".json",
+    OpenMetrics caso contrário.
+    """
+    text = registry.to_json() if path.endswith(".json") else registry.to_openmetrics()
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def serve(port=9464, host="127.0.0.1", registry=REGISTRY):
+    """
+    Serve o snapshot por HTTP em uma thread em segundo plano.
+
+    GET /metrics retorna OpenMetrics e GET /metrics.json retorna JSON.
+
+    Returns:
+        ThreadingHTTPServer: Servidor em execução (use `shutdown()` para parar)
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/metrics":
+                body = registry.to_openmetrics()
+                content_type = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+            elif self.path == "/metrics.json":
+                body = registry.to_json()
+                content_type = "application/json"
+            else:
+                self.send_error(404)
+                return
+            data = body.encode()
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -0,0 +1,175 @@
+"""
+Aritmética modular sobre o motor de Karatsuba (`fast_multiply` / `fast_square`).
+
+Os contextos pré-calculam, uma única vez por módulo, as constantes da redução
+de Barrett ou de Montgomery. A partir daí cada multiplicação modular custa
+apenas multiplicações, deslocamentos e subtrações, sem a divisão completa que
+`(x * y) % m` executa a cada operação.
+"""
+
+from main import fast_multiply, fast_square
+
+# Número de bits do expoente processados por vez em `modpow` (janela fixa)
+WINDOW_BITS = 4
+
+
+class _ModularContext:
+    """
+    Base comum: exponenciação por janela fixa e variantes em lote.
+
+    As subclasses definem a representação interna dos resíduos
+    (`_to_internal` / `_from_internal`) e as operações `_mul` e `_sqr`.
+    """
+
+    def __init__(self, modulus):
+        if modulus < 2:
+            raise ValueError("o módulo deve ser maior que 1")
+        self.modulus = modulus
+
+    def modmul(self, a, b):
+        """
+        Retorna (a * b) mod m.
+        """
+        a, b = self._to_internal(a), self._to_internal(b)
+        return self._from_internal(self._mul(a, b))
+
+    def modpow(self, base, exponent):
+        """
+        Retorna base^exponent mod m.
+
+        Usa exponenciação por janela fixa de WINDOW_BITS bits: uma tabela com
+        as potências base^0 .. base^(2^w - 1) e, para cada janela do expoente,
+        w quadrados seguidos de uma multiplicação.
+
+        Args:
+            base (int): Base
+            exponent (int): Expoente (não negativo)
+
+        Returns:
+            int: Resultado da exponenciação modular
+        """
+        if exponent < 0:
+            raise ValueError("o expoente deve ser não negativo")
+
+        one = self._to_internal(1)
+        table = [one, self._to_internal(base)]
+        for _ in range(2, 1 << WINDOW_BITS):
+            table.append(self._mul(table[-1], table[1]))
+
+        result = one
+        windows = (exponent.bit_length() + WINDOW_BITS - 1) // WINDOW_BITS
+        mask = (1 << WINDOW_BITS) - 1
+        for i in range(windows - 1, -1, -1):
+            for _ in range(WINDOW_BITS):
+                result = self._sqr(result)
+            digit = (exponent >> (i * WINDOW_BITS)) & mask
+            if digit:
+                result = self._mul(result, table[digit])
+        return self._from_internal(result)
+
+    def modmul_many(self, a_values, b_values):
+        """
+        Multiplica modularmente os pares (a_values[i], b_values[i]).
+        """
+        return [self.modmul(a, b) for a, b in zip(a_values, b_values)]
+
+    def modpow_many(self, bases, exponent):
+        """
+        Eleva cada base ao mesmo expoente, reaproveitando o contexto.
+        """
+        return [self.modpow(base, exponent) for base in bases]
+
+
+class BarrettContext(_ModularContext):
+    """
+    Redução de Barrett: aproxima o quociente x // m por uma multiplicação pela
+    constante mu = floor(4^k / m), com k = número de bits de m.
+
+    Funciona para qualquer módulo. Os resíduos são mantidos na forma usual.
+    """
+
+    def __init__(self, modulus):
+        super().__init__(modulus)
+        self.k = modulus.bit_length()
+        self.mu = (1 << (2 * self.k)) // modulus
+
+    def reduce(self, x):
+        """
+        Reduz 0 <= x < m² módulo m.
+        """
+        q = fast_multiply(x >> (self.k - 1), self.mu) >> (self.k + 1)
+        r = x - fast_multiply(q, self.modulus)
+        # O quociente estimado é no máximo 2 unidades menor que o exato
+        while r >= self.modulus:
+            r -= self.modulus
+        return r
+
+    def _to_internal(self, a):
+        return a % self.modulus
+
+    def _from_internal(self, a):
+        return a
+
+    def _mul(self, a, b):
+        return self.reduce(fast_multiply(a, b))
+
+    def _sqr(self, a):
+        return self.reduce(fast_square(a))
+
+
+class MontgomeryContext(_ModularContext):
+    """
+    Redução de Montgomery com R = 2^k, k = número de bits de m.
+
+    Os resíduos são mantidos na forma de Montgomery (a * R mod m), na qual a
+    redução troca a divisão por m por máscaras e deslocamentos de bits.
+    Exige módulo ímpar.
+    """
+
+    def __init__(self, modulus):
+        super().__init__(modulus)
+        if modulus % 2 == 0:
+            raise ValueError("a redução de Montgomery exige módulo ímpar")
+        self.k = modulus.bit_length()
+        self.mask = (1 << self.k) - 1
+        self.m_prime = pow(-modulus, -1, 1 << self.k)  # -m⁻¹ mod R
+        self.r2 = (1 << (2 * self.k)) % modulus  # R² mod m, para converter
+
+    def redc(self, t):
+        """
+        Retorna t * R⁻¹ mod m, para 0 <= t < m * R.
+        """
+        u = fast_multiply(t & self.mask, self.m_prime) & self.mask
+        t = (t + fast_multiply(u, self.modulus)) >> self.k
+        return t - self.modulus if t >= self.modulus else t
+
+    def _to_internal(self, a):
+        return self.redc(fast_multiply(a % self.modulus, self.r2))
+
+    def _from_internal(self, a):
+        return self.redc(a)
+
+    def _mul(self, a, b):
+        return self.redc(fast_multiply(a, b))
+
+    def _sqr(self, a):
+        return self.redc(fast_square(a))
+
+    def modmul(self, a, b):
+        """
+        Retorna (a * b) mod m, convertendo apenas um dos operandos.
+
+        Como redc(a * (b * R)) = a * b mod m, basta levar b para a forma de
+        Montgomery; o resultado já sai na forma usual (2 REDCs em vez de 4).
+        """
+        return self.redc(fast_multiply(a % self.modulus, self._to_internal(b)))
+
+
+def modular_context(modulus):
+    """
+    Escolhe o contexto adequado: Montgomery para módulos ímpares, Barrett
+    para os demais.
+    """
+    if modulus % 2:
+        return MontgomeryContext(modulus)
+    return BarrettContext(modulus)
@@ -0,0 +1,221 @@
+"""
+Multiplicação de polinômios pelo algoritmo de Karatsuba sobre arrays NumPy.
+
+É o mesmo truque das três multiplicações de `karatsuba_multiply`, aplicado aos
+vetores de coeficientes: com p = p0 + x^h p1 e q = q0 + x^h q1,
+    p * q = p0 q0 + x^h ((p0 + p1)(q0 + q1) - p0 q0 - p1 q1) + x^2h p1 q1
+
+Os coeficientes são guardados do termo de grau 0 para o de maior grau, como em
+`numpy.convolve`. Enquanto cabem em BATCH_LIMIT valores, os subproblemas de um
+mesmo nível da recursão são empilhados no eixo de lote e resolvidos juntos, de
+modo que o número de chamadas Python cresce com a profundidade da recursão e
+não com o número de subproblemas.
+"""
+
+import numpy as np
+
+# Abaixo deste tamanho o produto é feito pelo método escolar: a recursão de
+# Karatsuba em Python só compensa quando cada subproblema é grande o bastante
+# para que o laço em C do `numpy.convolve` domine o custo
+CONVOLVE_CUTOFF = 512
+
+# Lotes com mais polinômios que coeficientes e coeficientes até este limite
+# usam o produto escolar vetorizado sobre o lote, em vez de um
+# `numpy.convolve` por linha
+SCHOOLBOOK_CUTOFF = 32
+
+# Número máximo de valores empilhados em um nível da recursão; acima disso os
+# subproblemas são resolvidos um de cada vez
+BATCH_LIMIT = 1 << 22
+
+# Maior módulo aceito: garante que o produto de dois resíduos caiba em int64
+MAX_MODULUS = 1 << 31
+
+
+def _convolve_rows(p, q, modulus):
+    """
+    Produto escolar linha a linha com `numpy.convolve`.
+
+    No caso modular cada resíduo (< 2^31) é separado em metades de 16 bits,
+    para que nenhuma soma de produtos ultrapasse o int64, e as três
+    convoluções são combinadas com o mesmo truque de Karatsuba.
+    """
+    batch, n = p.shape
+    out = np.empty((batch, 2 * n - 1), dtype=p.dtype)
+    for row in range(batch):
+        if modulus is None:
+            out[row] = np.convolve(p[row], q[row])
+            continue
+        p_lo, p_hi = p[row] & 0xFFFF, p[row] >> 16
+        q_lo, q_hi = q[row] & 0xFFFF, q[row] >> 16
+        lo = np.convolve(p_lo, q_lo) % modulus
+        hi = np.convolve(p_hi, q_hi) % modulus
+        mid = (np.convolve(p_lo + p_hi, q_lo + q_hi) - lo - hi) % modulus
+        mid = mid * ((1 << 16) % modulus) % modulus
+        hi = hi * ((1 << 32) % modulus) % modulus
+        out[row] = (lo + mid + hi) % modulus
+    return out
+
+
+def _schoolbook(p, q, modulus):
+    """
+    Produto escolar de um lote de polinômios pequenos, shape (B, n).
+
+    O laço percorre apenas os n coeficientes de p; cada passo soma p[:, i] * q
+    na posição i de todos os produtos do lote de uma vez.
+    """
+    batch, n = p.shape
+    out = np.zeros((batch, 2 * n - 1), dtype=p.dtype)
+    for i in range(n):
+        term = p[:, i : i + 1] * q
+        if modulus is not None:
+            term %= modulus
+        out[:, i : i + n] += term
+    if modulus is not None:
+        out %= modulus
+    return out
+
+
+def _karatsuba(p, q, modulus):
+    """
+    Karatsuba em lote para polinômios de shape (B, n), com n = (corte) * 2^L.
+    """
+    batch, n = p.shape
+    if n <= SCHOOLBOOK_CUTOFF and batch > n:
+        return _schoolbook(p, q, modulus)
+    if n <= CONVOLVE_CUTOFF:
+        return _convolve_rows(p, q, modulus)
+
+    h = n // 2
+    p0, p1 = p[:, :h], p[:, h:]
+    q0, q1 = q[:, :h], q[:, h:]
+    p01, q01 = p0 + p1, q0 + q1
+    if modulus is not None:
+        p01 %= modulus
+        q01 %= modulus
+
+    if 3 * batch * h <= BATCH_LIMIT:
+        # Os três subproblemas são resolvidos em uma única chamada
+        z = _karatsuba(
+            np.concatenate([p0, p1, p01]), np.concatenate([q0, q1, q01]), modulus
+        )
+        z0, z2, z01 = z[:batch], z[batch : 2 * batch], z[2 * batch :]
+    else:
+        z0 = _karatsuba(p0, q0, modulus)
+        z2 = _karatsuba(p1, q1, modulus)
+        z01 = _karatsuba(p01, q01, modulus)
+
+    z1 = z01 - z0 - z2
+    out = np.zeros((batch, 2 * n - 1), dtype=p.dtype)
+    out[:, : 2 * h - 1] += z0
+    out[:, h : 3 * h - 1] += z1
+    out[:, 2 * h :] += z2
+    if modulus is not None:
+        out %= modulus
+    return out
+
+
+def _padded_size(m):
+    """
+    Menor tamanho >= m que a recursão divide ao meio até o caso base.
+    """
+    levels = 0
+    while -(-m // (1 << levels)) > CONVOLVE_CUTOFF:
+        levels += 1
+    return -(-m // (1 << levels)) << levels
+
+
+def _prepare(values, modulus):
+    """
+    Converte os coeficientes para o tipo usado nas contas (int64 ou float64).
+    """
+    values = np.asarray(values)
+    if modulus is not None:
+        return np.asarray(values, dtype=np.int64) % modulus
+    if values.dtype.kind == "f":
+        return values.astype(np.float64)
+    if values.dtype.kind in "iub":
+        return values.astype(np.int64)
+    raise TypeError(f"tipo de coeficiente não suportado: {values.dtype}")
+
+
+def _check_overflow(p, q):
+    """
+    Garante que nenhum valor intermediário ultrapasse o limite do int64.
+
+    Todo coeficiente intermediário da recursão é limitado pelo produto das
+    normas L1 das entradas (vezes 3, pelas somas na recombinação).
+    """
+    l1_p = np.abs(p, dtype=np.float64).sum(axis=-1).max(initial=0)
+    l1_q = np.abs(q, dtype=np.float64).sum(axis=-1).max(initial=0)
+    if 4 * l1_p * l1_q >= 2.0**62:
+        raise OverflowError(
+            "os coeficientes podem ultrapassar o limite do int64; "
+            "use coeficientes float64 ou informe um módulo"
+        )
+
+
+def poly_karatsuba(p, q, modulus=None):
+    """
+    Multiplica polinômios (ou lotes de polinômios) pelo algoritmo de Karatsuba.
+
+    Args:
+        p (array): Coeficientes do primeiro polinômio, shape (n,) ou (B, n)
+        q (array): Coeficientes do segundo polinômio, shape (m,) ou (B, m)
+        modulus (int): Se informado, calcula os coeficientes módulo este valor
+            (menor que 2^31)
+
+    Returns:
+        np.ndarray: Coeficientes do produto, shape (n + m - 1,) ou (B, n + m - 1)
+
+    Raises:
+        OverflowError: Se coeficientes inteiros puderem ultrapassar o int64
+    """
+    if modulus is not None and not 1 < modulus <= MAX_MODULUS:
+        raise ValueError(f"o módulo deve estar entre 2 e {MAX_MODULUS}")
+
+    p, q = _prepare(p, modulus), _prepare(q, modulus)
+    single = p.ndim == 1 and q.ndim == 1
+    p, q = np.atleast_2d(p), np.atleast_2d(q)
+    if p.dtype != q.dtype:
+        p, q = p.astype(np.float64), q.astype(np.float64)
+    batch = max(p.shape[0], q.shape[0])
+    p = np.broadcast_to(p, (batch, p.shape[1]))
+    q = np.broadcast_to(q, (batch, q.shape[1]))
+    if modulus is None and p.dtype == np.int64:
+        _check_overflow(p, q)
+
+    n, m = p.shape[1], q.shape[1]
+    if n == 0 or m == 0:
+        out = np.zeros((batch, 0), dtype=p.dtype)
+        return out[0] if single else out
+    if n < m:
+        p, q, n, m = q, p, m, n
+
+    # Operandos desbalanceados: o maior é dividido em blocos do tamanho do
+    # menor, multiplicados em lote e somados com sobreposição
+    chunks = -(-n // m)
+    size = _padded_size(m)
+
+    padded_p = np.zeros((batch, chunks * m), dtype=p.dtype)
+    padded_p[:, :n] = p
+    blocks = np.zeros((batch, chunks, size), dtype=p.dtype)
+    blocks[:, :, :m] = padded_p.reshape(batch, chunks, m)
+    padded_q = np.zeros((batch, chunks, size), dtype=q.dtype)
+    padded_q[:, :, :m] = q[:, None, :]
+
+    products = _karatsuba(
+        blocks.reshape(-1, size), padded_q.reshape(-1, size), modulus
+    ).reshape(batch, chunks, 2 * size - 1)
+
+    # Cada bloco contribui com 2m - 1 coeficientes a partir da posição c * m:
+    # os m primeiros e os m - 1 seguintes são somados em duas operações
+    high = np.zeros((batch, chunks, m), dtype=p.dtype)
+    high[:, :, : m - 1] = products[:, :, m : 2 * m - 1]
+    out = np.zeros((batch, (chunks + 1) * m), dtype=p.dtype)
+    out[:, : chunks * m] += products[:, :, :m].reshape(batch, -1)
+    out[:, m:] += high.reshape(batch, -1)
+    out = out[:, : n + m - 1]
+    if modulus is not None:
+        out %= modulus
+    return out[0] if single else out
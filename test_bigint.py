@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Testes do motor de multiplicação binário (fast_multiply / fast_square em
+main.py) e da aritmética de bigint.py contra o operador `*`, `divmod`,
+`math.isqrt` e `math.factorial`.
+"""
+
+import math
+import random
+
+import pytest
+
+import bigint
+from bigint import (
+    DIVMOD_CUTOFF_BITS,
+    cached_fibonacci,
+    fast_divmod,
+    fast_fibonacci,
+    fast_isqrt,
+    prime_swing_factorial,
+    product_tree,
+    product_tree_factorial,
+)
+from main import KARATSUBA_CUTOFF_BITS, fast_multiply, fast_square
+
+CUTOFF = KARATSUBA_CUTOFF_BITS
+
+# Tamanhos (em bits) em torno do corte e bem acima dele, incluindo tamanhos
+# que não são potências de dois
+BIT_SIZES = [1, 64, CUTOFF - 1, CUTOFF, CUTOFF + 1, 3 * CUTOFF + 7, 20 * CUTOFF + 3]
+
+
+def operand(rng, bits):
+    # Exatamente `bits` bits
+    return rng.getrandbits(bits) | (1 << (bits - 1))
+
+
+@pytest.mark.parametrize("bits", BIT_SIZES)
+def test_fast_multiply_matches_operator(bits):
+    rng = random.Random(bits)
+    x, y = operand(rng, bits), operand(rng, bits)
+    for a, b in [(x, y), (-x, y), (x, -y), (-x, -y), (x, 0), (0, -y), (x, 1)]:
+        assert fast_multiply(a, b) == a * b
+
+
+def test_fast_multiply_unbalanced():
+    rng = random.Random(1)
+    x, y = operand(rng, 40 * CUTOFF), operand(rng, CUTOFF)
+    assert fast_multiply(x, y) == x * y
+    assert fast_multiply(y, -x) == -x * y
+
+
+def test_fast_multiply_worst_case_carries():
+    # Operandos com todos os bits ligados maximizam os "vai-um" de a + b
+    x = (1 << (8 * CUTOFF)) - 1
+    assert fast_multiply(x, x) == x * x
+    assert fast_square(x) == x * x
+
+
+@pytest.mark.parametrize("bits", BIT_SIZES)
+def test_fast_square_matches_operator(bits):
+    x = operand(random.Random(bits), bits)
+    assert fast_square(x) == x * x
+    assert fast_square(-x) == x * x
+    assert fast_square(0) == 0
+
+
+def fibonacci_reference(limit):
+    a, b = 0, 1
+    values = []
+    for _ in range(limit + 1):
+        values.append(a)
+        a, b = b, a + b
+    return values
+
+
+def test_fast_fibonacci_matches_iteration():
+    # F(6000) já tem mais de KARATSUBA_CUTOFF_BITS bits
+    reference = fibonacci_reference(12_000)
+    for n in list(range(0, 100)) + [1023, 1024, 5_000, 6_000, 11_999, 12_000]:
+        assert fast_fibonacci(n) == reference[n]
+        assert cached_fibonacci(n) == reference[n]
+
+
+def test_fast_fibonacci_rejects_negative():
+    with pytest.raises(ValueError):
+        fast_fibonacci(-1)
+
+
+@pytest.mark.parametrize("factorial", [product_tree_factorial, prime_swing_factorial])
+def test_factorials_match_math(factorial):
+    for n in list(range(0, 70)) + [127, 128, 129, 1000, 1023, 5_000, 10_007]:
+        assert factorial(n) == math.factorial(n)
+
+
+@pytest.mark.parametrize("factorial", [product_tree_factorial, prime_swing_factorial])
+def test_factorials_reject_negative(factorial):
+    with pytest.raises(ValueError):
+        factorial(-1)
+
+
+def test_product_tree():
+    assert product_tree([]) == 1
+    assert product_tree([-3]) == -3
+    values = list(range(-20, 0)) + list(range(1, 31))
+    assert product_tree(values) == math.prod(values)
+    assert product_tree(values, 5, 17) == math.prod(values[5:17])
+    assert product_tree([4, 0, 5] * 7) == 0
+
+
+def check_divmod(a, b):
+    for x, y in [(a, b), (-a, b), (a, -b), (-a, -b)]:
+        assert fast_divmod(x, y) == divmod(x, y)
+
+
+def test_fast_divmod_small_and_edges():
+    for a, b in [(0, 1), (0, -7), (1, 1), (6, 3), (5, 7), (2**64, 3), (10**50, 10**50 + 1)]:
+        check_divmod(a, b)
+    with pytest.raises(ZeroDivisionError):
+        fast_divmod(5, 0)
+
+
+def test_fast_divmod_at_cutoff():
+    # Divisor e quociente com exatamente DIVMOD_CUTOFF_BITS bits: caminho de Newton
+    rng = random.Random(2)
+    b = operand(rng, DIVMOD_CUTOFF_BITS)
+    a = fast_multiply(b, operand(rng, DIVMOD_CUTOFF_BITS)) + rng.getrandbits(DIVMOD_CUTOFF_BITS)
+    check_divmod(a, b)
+    check_divmod(fast_multiply(b, b), b)  # resto zero
+    check_divmod(fast_multiply(b, b) - 1, b)  # resto máximo
+
+
+@pytest.mark.parametrize("a_bits, b_bits", [(3000, 1500), (4001, 2000), (20_000, 3_001), (3000, 2999)])
+def test_fast_divmod_newton_paths(monkeypatch, a_bits, b_bits):
+    # Corte reduzido para exercitar a divisão balanceada e a divisão em
+    # blocos (quociente maior que o divisor) com operandos pequenos
+    monkeypatch.setattr(bigint, "DIVMOD_CUTOFF_BITS", 64)
+    rng = random.Random(a_bits + b_bits)
+    check_divmod(operand(rng, a_bits), operand(rng, b_bits))
+    b = operand(rng, b_bits)
+    check_divmod(b * operand(rng, a_bits - b_bits), b)
+
+
+def test_fast_isqrt_matches_math():
+    rng = random.Random(3)
+    values = list(range(0, 300)) + [2**64 - 1, 2**64, 2**64 + 1]
+    values += [operand(rng, bits) for bits in (127, 128, 1001, 2 * DIVMOD_CUTOFF_BITS + 5)]
+    values += [v * v for v in values[-4:]] + [v * v - 1 for v in values[-4:]]
+    for n in values:
+        assert fast_isqrt(n) == math.isqrt(n)
+    with pytest.raises(ValueError):
+        fast_isqrt(-1)
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Testes do grafo de fluxo de controle (CyclomaticComplex/cfg.py) nos casos de
+match sem caso irrefutável, try/except* e saltos dentro de try/finally.
+"""
+
+import os
+import sys
+
+# Adicionar o diretório CyclomaticComplex ao path
+sys.path.append(os.path.join(os.path.dirname(__file__), "CyclomaticComplex"))
+
+from cfg import cfgs_from_source
+
+
+def graph_of(code):
+    return cfgs_from_source(code)[0]
+
+
+def test_match_without_irrefutable_case():
+    graph = graph_of(
+        "def f(x):\n"
+        "    match x:\n"
+        "        case 1:\n"
+        "            return 1\n"
+        "        case 2:\n"
+        "            y = 2\n"
+        "    return 0\n"
+    )
+    assert graph.cyclomatic_complexity() == 3
+
+    # Com `case _:` não há caminho que pule todos os casos
+    graph = graph_of(
+        "def f(x):\n"
+        "    match x:\n"
+        "        case 1:\n"
+        "            return 1\n"
+        "        case _:\n"
+        "            y = 2\n"
+        "    return 0\n"
+    )
+    assert graph.cyclomatic_complexity() == 2
+
+
+def test_try_star_handlers():
+    graph = graph_of(
+        "def g():\n"
+        "    try:\n"
+        "        a()\n"
+        "    except* ValueError:\n"
+        "        b()\n"
+        "    except* TypeError:\n"
+        "        c()\n"
+    )
+    labels = [label for _, label, _ in graph.nodes]
+    assert "except* ValueError" in labels and "except* TypeError" in labels
+    assert graph.cyclomatic_complexity() == 3
+
+
+def test_jumps_run_finally():
+    graph = graph_of(
+        "def h(items):\n"
+        "    for i in items:\n"
+        "        try:\n"
+        "            if i:\n"
+        "                continue\n"
+        "            return i\n"
+        "        finally:\n"
+        "            cleanup()\n"
+        "    return None\n"
+    )
+    finally_nodes = [node for node, label, _ in graph.nodes if label == "cleanup()"]
+    targets = {target for _, target, _ in graph.edges}
+    assert finally_nodes and all(node in targets for node in finally_nodes)
+    # Decisões: for e if
+    assert graph.cyclomatic_complexity() == 3
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Testes da ordenação externa (BigOComplex/external_sort.py): resultado igual ao
+`np.sort` e memória alocada dentro do limite com vários processos.
+"""
+
+import os
+import sys
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+# Adicionar o diretório BigOComplex ao path
+sys.path.append(os.path.join(os.path.dirname(__file__), "BigOComplex"))
+
+import numpy as np
+import pytest
+
+import external_sort as module
+from external_sort import external_sort
+
+
+def sort_file(tmp_path, values, **kwargs):
+    source, target = tmp_path / "entrada.bin", tmp_path / "saida.bin"
+    values.tofile(source)
+    stats = external_sort(str(source), str(target), dtype=values.dtype.str,
+                          tmp_dir=str(tmp_path), **kwargs)
+    return np.fromfile(target, dtype=values.dtype), stats
+
+
+@pytest.mark.parametrize("size", [0, 1, 1000, 100_003])
+@pytest.mark.parametrize("workers", [1, 2])
+def test_matches_np_sort(tmp_path, size, workers):
+    rng = np.random.default_rng(size)
+    values = rng.integers(-(2**63), 2**63 - 1, size, dtype=np.int64)
+    result, stats = sort_file(tmp_path, values, memory_limit=64 * 1024, workers=workers)
+    assert np.array_equal(result, np.sort(values))
+    assert stats["records"] == size
+
+
+def test_duplicates_and_floats(tmp_path):
+    rng = np.random.default_rng(1)
+    values = rng.integers(-3, 3, 50_001).astype("<f8")
+    result, stats = sort_file(tmp_path, values, memory_limit=32 * 1024, workers=2)
+    assert np.array_equal(result, np.sort(values))
+    assert stats["merge_passes"] > 1
+
+
+def test_memory_limit_is_total(tmp_path, monkeypatch):
+    # Threads no lugar de processos: o tracemalloc vê os runs de todos os
+    # workers ao mesmo tempo, como a RAM da máquina veria
+    monkeypatch.setattr(module, "ProcessPoolExecutor", ThreadPoolExecutor)
+    memory_limit = 4 * 1024 * 1024
+    values = np.random.default_rng(2).integers(-(2**40), 2**40, 2_000_000, dtype=np.int64)
+    source, target = tmp_path / "entrada.bin", tmp_path / "saida.bin"
+    values.tofile(source)
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        stats = external_sort(str(source), str(target), memory_limit=memory_limit,
+                              workers=4, tmp_dir=str(tmp_path))
+        peak = tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+
+    assert stats["runs"] > 4
+    assert np.array_equal(np.fromfile(target, dtype=np.int64), np.sort(values))
+    assert peak < memory_limit
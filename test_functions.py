@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Testes das ordenações de BigOComplex/functions.py contra `sorted`.
+"""
+
+import os
+import random
+import sys
+
+# Adicionar o diretório BigOComplex ao path
+sys.path.append(os.path.join(os.path.dirname(__file__), "BigOComplex"))
+
+import pytest
+
+from functions import MIN_RUN, _intro_sort, intro_sort, natural_merge_sort
+
+
+class Key:
+    """
+    Valor comparado apenas pela chave, para verificar a estabilidade.
+    """
+
+    def __init__(self, key, tag):
+        self.key, self.tag = key, tag
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+    def __le__(self, other):
+        return self.key <= other.key
+
+    def __gt__(self, other):
+        return self.key > other.key
+
+    def __ge__(self, other):
+        return self.key >= other.key
+
+
+def inputs(n, seed=0):
+    """
+    Entradas com formatos variados de tamanho `n`.
+    """
+    rng = random.Random(seed)
+    yield [rng.randint(-n, n) for _ in range(n)]
+    yield list(range(n))
+    yield list(range(n, 0, -1))
+    yield [0] * n
+    yield [rng.randint(-2, 2) for _ in range(n)]
+    yield list(range(n // 2)) + list(range(n // 2, 0, -1))  # organ pipe
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, MIN_RUN - 1, MIN_RUN, MIN_RUN + 1, 1000, 1023])
+def test_natural_merge_sort_matches_sorted(n):
+    for arr in inputs(n, seed=n):
+        expected = sorted(arr)
+        result = natural_merge_sort(arr)
+        assert result == expected
+        assert result is arr  # ordena no lugar
+
+
+def test_natural_merge_sort_is_stable():
+    rng = random.Random(1)
+    arr = [Key(rng.randint(0, 9), i) for i in range(2000)]
+    result = natural_merge_sort(list(arr))
+    assert [(k.key, k.tag) for k in result] == sorted((k.key, k.tag) for k in arr)
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 15, 16, 17, 1000, 1023])
+def test_intro_sort_matches_sorted(n):
+    for arr in inputs(n, seed=n):
+        expected = sorted(arr)
+        result = intro_sort(arr)
+        assert result == expected
+        assert result is arr  # ordena no lugar
+
+
+def test_intro_sort_heapsort_fallback():
+    # Profundidade zero: o intervalo inteiro é ordenado pelo heapsort
+    for arr in inputs(500, seed=3):
+        expected = sorted(arr)
+        _intro_sort(arr, 0, len(arr) - 1, 0)
+        assert arr == expected
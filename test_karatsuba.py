@@ -6,23 +6,24 @@ de performance entre os métodos tradicional e Karatsuba.
 """
 
 from main import karatsuba_multiply, traditional_multiply, compare_algorithms
+from corpus import seeded_operands
 import time
-import random
 
 
-def generate_large_number(digits):
+def generate_large_numbers(digits):
     """
-    Gera um número aleatório com o número especificado de dígitos.
+    Gera o par de números do benchmark com o número especificado de dígitos.
+
+    Os números vêm de uma semente fixa (ver `seeded_operands` em corpus.py),
+    de modo que todas as execuções medem as mesmas entradas.
 
     Args:
         digits (int): Número de dígitos desejados
 
     Returns:
-        int: Número aleatório com o número especificado de dígitos
+        tuple: Par de números com o número especificado de dígitos
     """
-    start = 10 ** (digits - 1)
-    end = 10**digits - 1
-    return random.randint(start, end)
+    return seeded_operands(digits)
 
 
 def benchmark_algorithms():
@@ -42,10 +43,9 @@ def benchmark_algorithms():
         (123456789, 987654321, "Muito grandes (9 dígitos)"),
     ]
 
-    # Adicionar alguns números gerados aleatoriamente para teste
+    # Adicionar alguns números gerados com semente fixa para teste
     for digits in [10, 15, 20]:
-        x = generate_large_number(digits)
-        y = generate_large_number(digits)
+        x, y = generate_large_numbers(digits)
         test_cases.append((x, y, f"Aleatórios ({digits} dígitos)"))
 
     total_karatsuba_time = 0
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Testes do histograma de latência do registro de métricas (metrics.py).
+"""
+
+from metrics import LATENCY_BUCKETS, LATENCY_MIN_BITS, MetricsRegistry
+
+
+def buckets(registry):
+    text = registry.to_openmetrics()
+    return [
+        line.rsplit(" ", 1) for line in text.splitlines()
+        if line.startswith("karatsuba_latency_seconds_bucket")
+    ]
+
+
+def test_bucket_upper_bounds_are_inclusive():
+    registry = MetricsRegistry()
+    bound = 2 ** (LATENCY_MIN_BITS + 3)
+    registry.observe("fast_multiply", "builtin", 64, 16, bound)
+    registry.observe("fast_multiply", "builtin", 64, 16, bound + 1)
+    histogram = registry.snapshot()[0]["latency_histogram"]
+    assert histogram[3] == 1 and histogram[4] == 1
+
+
+def test_overflow_only_counts_in_inf():
+    registry = MetricsRegistry()
+    last = 2 ** (LATENCY_MIN_BITS + LATENCY_BUCKETS - 1)
+    registry.observe("fast_multiply", "karatsuba", 4096, 1024, 10)
+    registry.observe("fast_multiply", "karatsuba", 4096, 1024, last)
+    registry.observe("fast_multiply", "karatsuba", 4096, 1024, last + 1)
+
+    series = registry.snapshot()[0]
+    assert series["calls"] == 3
+    assert sum(series["latency_histogram"]) == 2
+
+    lines = buckets(registry)
+    assert len(lines) == LATENCY_BUCKETS + 1
+    assert lines[-2][1] == "2"  # última faixa finita: sem o estouro
+    assert 'le="+Inf"' in lines[-1][0] and lines[-1][1] == "3"
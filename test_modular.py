@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Testes dos contextos modulares (modular.py) contra `(a * b) % m` e `pow`.
+"""
+
+import random
+
+import pytest
+
+from main import KARATSUBA_CUTOFF_BITS
+from modular import BarrettContext, MontgomeryContext, modular_context
+
+
+def odd_modulus(rng, bits):
+    return rng.getrandbits(bits) | (1 << (bits - 1)) | 1
+
+
+def moduli():
+    rng = random.Random(0)
+    yield 3
+    yield 2**61 - 1
+    for bits in (KARATSUBA_CUTOFF_BITS - 1, KARATSUBA_CUTOFF_BITS, 3 * KARATSUBA_CUTOFF_BITS + 5):
+        yield odd_modulus(rng, bits)
+
+
+def operands(rng, m):
+    yield from [0, 1, m - 1, m, m + 1, -1, -m - 3, 2 * m * m + 5]
+    for _ in range(5):
+        yield rng.randrange(-m * m, m * m)
+
+
+@pytest.mark.parametrize("context_class", [BarrettContext, MontgomeryContext])
+@pytest.mark.parametrize("m", list(moduli()))
+def test_modmul_matches_operator(context_class, m):
+    ctx = context_class(m)
+    rng = random.Random(m)
+    values = list(operands(rng, m))
+    for a in values:
+        for b in values[::3]:
+            assert ctx.modmul(a, b) == (a * b) % m
+    assert ctx.modmul_many(values, values[::-1]) == [
+        (a * b) % m for a, b in zip(values, values[::-1])
+    ]
+
+
+@pytest.mark.parametrize("context_class", [BarrettContext, MontgomeryContext])
+@pytest.mark.parametrize("m", list(moduli()))
+def test_modpow_matches_pow(context_class, m):
+    ctx = context_class(m)
+    rng = random.Random(m + 1)
+    bases = [0, 1, -1, m - 1, rng.randrange(m)]
+    for exponent in (0, 1, 2, 15, 16, 17, rng.getrandbits(300)):
+        assert ctx.modpow_many(bases, exponent) == [pow(b, exponent, m) for b in bases]
+    with pytest.raises(ValueError):
+        ctx.modpow(2, -1)
+
+
+def test_barrett_even_and_small_moduli():
+    rng = random.Random(4)
+    for m in (2, 4, 10, 2**64, 2**KARATSUBA_CUTOFF_BITS, odd_modulus(rng, 5000) + 1):
+        ctx = modular_context(m)
+        assert isinstance(ctx, BarrettContext)
+        a, b = rng.randrange(-m * m, m * m), rng.randrange(m * m)
+        assert ctx.modmul(a, b) == (a * b) % m
+        assert ctx.modpow(a, 65537) == pow(a, 65537, m)
+
+
+def test_invalid_moduli():
+    with pytest.raises(ValueError):
+        BarrettContext(1)
+    with pytest.raises(ValueError):
+        MontgomeryContext(10)
+    assert isinstance(modular_context(7), MontgomeryContext)
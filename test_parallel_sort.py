@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Testes do merge sort paralelo (BigOComplex/parallel_sort.py) contra `np.sort`
+e `sorted`.
+"""
+
+import os
+import random
+import sys
+
+# Adicionar o diretório BigOComplex ao path
+sys.path.append(os.path.join(os.path.dirname(__file__), "BigOComplex"))
+
+import numpy as np
+import pytest
+
+from parallel_sort import PARALLEL_MIN_SIZE, co_rank, parallel_merge_sort, parallel_merge_sort_array
+
+
+@pytest.mark.parametrize("arr", [[], [5], [0, -1], [3, 3, 3]])
+def test_small_inputs_match_sorted(arr):
+    assert parallel_merge_sort(arr) == sorted(arr)
+
+
+@pytest.mark.parametrize("workers", [1, 2, 3])
+def test_int64_matches_np_sort(workers):
+    # Acima do limite paralelo e com tamanho que não é potência de dois
+    n = PARALLEL_MIN_SIZE * 3 + 17
+    values = np.random.default_rng(workers).integers(-(2**63), 2**63 - 1, n, dtype=np.int64)
+    result = parallel_merge_sort_array(values, workers)
+    assert result.dtype == values.dtype
+    assert np.array_equal(result, np.sort(values))
+
+
+def test_duplicates_and_floats():
+    rng = np.random.default_rng(5)
+    values = rng.integers(-3, 3, PARALLEL_MIN_SIZE + 1).astype(np.float64)
+    assert np.array_equal(parallel_merge_sort_array(values, 4), np.sort(values))
+
+
+def test_exact_min_size():
+    values = np.arange(PARALLEL_MIN_SIZE, 0, -1, dtype=np.int32)
+    assert np.array_equal(parallel_merge_sort_array(values, 2), np.sort(values))
+
+
+def test_object_arrays_fall_back():
+    values = [2**70, -1, 2**65, 0]
+    assert parallel_merge_sort(values) == sorted(values)
+
+
+def test_co_rank_splits_stable_merge():
+    rng = random.Random(0)
+    for _ in range(200):
+        a = np.array(sorted(rng.randint(0, 5) for _ in range(rng.randint(0, 12))))
+        b = np.array(sorted(rng.randint(0, 5) for _ in range(rng.randint(0, 12))))
+        # Intercalação estável de referência: empates saem de `a` primeiro
+        merged = sorted([(v, 0, i) for i, v in enumerate(a)] + [(v, 1, i) for i, v in enumerate(b)])
+        for k in range(len(a) + len(b) + 1):
+            i, j = co_rank(k, a, b)
+            assert i + j == k
+            assert i == sum(1 for _, source, _ in merged[:k] if source == 0)
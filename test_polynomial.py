@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Testes da multiplicação de polinômios (polynomial.py) contra `np.convolve`.
+"""
+
+import numpy as np
+import pytest
+
+from polynomial import CONVOLVE_CUTOFF, SCHOOLBOOK_CUTOFF, poly_karatsuba
+
+SIZES = [1, 2, SCHOOLBOOK_CUTOFF, CONVOLVE_CUTOFF, CONVOLVE_CUTOFF + 1, 1000, 2 * CONVOLVE_CUTOFF]
+
+
+def exact_convolve(p, q, modulus=None):
+    # Referência com inteiros do Python (sem overflow)
+    result = np.convolve(np.asarray(p, dtype=object), np.asarray(q, dtype=object))
+    return result if modulus is None else result % modulus
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_integer_coefficients_match_convolve(n):
+    rng = np.random.default_rng(n)
+    p = rng.integers(-1000, 1000, n)
+    q = rng.integers(-1000, 1000, n)
+    assert np.array_equal(poly_karatsuba(p, q), np.convolve(p, q))
+
+
+@pytest.mark.parametrize("n, m", [(1, 700), (700, 1), (1500, 513), (513, 4000), (37, 1029)])
+def test_unbalanced_lengths(n, m):
+    rng = np.random.default_rng(n * m)
+    p, q = rng.integers(-50, 50, n), rng.integers(-50, 50, m)
+    assert np.array_equal(poly_karatsuba(p, q), np.convolve(p, q))
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_modular_matches_exact(n):
+    modulus = 2**31 - 1
+    rng = np.random.default_rng(n + 1)
+    p = rng.integers(0, modulus, n)
+    q = rng.integers(0, modulus, n)
+    result = poly_karatsuba(p, q, modulus)
+    assert result.tolist() == exact_convolve(p, q, modulus).tolist()
+
+
+def test_modular_negative_coefficients():
+    p, q = [-1, -(2**40), 7], [3, -5]
+    assert poly_karatsuba(p, q, 97).tolist() == exact_convolve(p, q, 97).tolist()
+
+
+def test_float_coefficients():
+    rng = np.random.default_rng(2)
+    p, q = rng.standard_normal(1025), rng.standard_normal(600)
+    assert np.allclose(poly_karatsuba(p, q), np.convolve(p, q))
+
+
+def test_batches():
+    rng = np.random.default_rng(3)
+    p = rng.integers(-9, 9, (40, SCHOOLBOOK_CUTOFF))
+    q = rng.integers(-9, 9, (40, SCHOOLBOOK_CUTOFF))
+    expected = np.array([np.convolve(a, b) for a, b in zip(p, q)])
+    assert np.array_equal(poly_karatsuba(p, q), expected)
+    # Um único polinômio multiplicado por todo o lote
+    assert np.array_equal(
+        poly_karatsuba(p[0], q), np.array([np.convolve(p[0], b) for b in q])
+    )
+
+    modulus = 1_000_003
+    p = rng.integers(0, modulus, (3, 700))
+    q = rng.integers(0, modulus, (3, 700))
+    result = poly_karatsuba(p, q, modulus)
+    for row in range(3):
+        assert result[row].tolist() == exact_convolve(p[row], q[row], modulus).tolist()
+
+
+def test_empty_and_zero():
+    assert poly_karatsuba([], [1, 2]).shape == (0,)
+    assert poly_karatsuba([0, 0], [5, 6]).tolist() == [0, 0, 0]
+
+
+def test_errors():
+    with pytest.raises(OverflowError):
+        poly_karatsuba([2**40] * 4, [2**40] * 4)
+    with pytest.raises(ValueError):
+        poly_karatsuba([1], [1], modulus=1)
+    with pytest.raises(ValueError):
+        poly_karatsuba([1], [1], modulus=2**31 + 1)
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Testes do radix sort LSD (BigOComplex/radix_sort.py) contra `sorted` e
+`np.argsort(kind="stable")`.
+"""
+
+import os
+import random
+import sys
+
+# Adicionar o diretório BigOComplex ao path
+sys.path.append(os.path.join(os.path.dirname(__file__), "BigOComplex"))
+
+import numpy as np
+import pytest
+
+from radix_sort import radix_argsort, radix_sort, radix_sort_array
+
+DTYPES = [np.int8, np.int16, np.int32, np.int64, np.uint8, np.uint16, np.uint32, np.uint64]
+
+
+@pytest.mark.parametrize("arr", [[], [7], [0, 0, 0], [-1, 1, -(2**63), 2**63 - 1, 0]])
+def test_edge_cases_match_sorted(arr):
+    assert radix_sort(arr) == sorted(arr)
+
+
+@pytest.mark.parametrize("n", [2, 1000, 65_537])
+def test_random_lists_match_sorted(n):
+    rng = random.Random(n)
+    arr = [rng.randint(-n, n) for _ in range(n)]
+    assert radix_sort(arr) == sorted(arr)
+
+
+@pytest.mark.parametrize("dtype", DTYPES)
+def test_full_range_keeps_dtype(dtype):
+    info = np.iinfo(dtype)
+    keys = np.random.default_rng(0).integers(info.min, info.max, 10_001, dtype=dtype, endpoint=True)
+    result = radix_sort_array(keys)
+    assert result.dtype == keys.dtype
+    assert np.array_equal(result, np.sort(keys))
+    assert np.array_equal(radix_argsort(keys), np.argsort(keys, kind="stable"))
+
+
+@pytest.mark.parametrize("dtype", DTYPES)
+def test_single_element_keeps_dtype(dtype):
+    assert radix_sort_array(np.array([5], dtype=dtype)).dtype == dtype
+
+
+def test_rejects_floats():
+    with pytest.raises(TypeError):
+        radix_sort_array(np.array([1.5, 0.5]))
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Testes do cache de resultados de complexidade (BigOComplex/result_cache.py).
+"""
+
+import os
+import subprocess
+import sys
+
+# Adicionar o diretório BigOComplex ao path
+sys.path.append(os.path.join(os.path.dirname(__file__), "BigOComplex"))
+
+from result_cache import PROJECT_ROOT, ResultCache, function_digest
+
+# Nome de arquivo dentro do projeto, para que as funções compiladas abaixo
+# sejam tratadas como funções do projeto
+SAMPLE_PATH = os.path.join(PROJECT_ROOT, "sample_module.py")
+
+
+def load(source):
+    """
+    Compila `source` como um módulo do projeto e retorna suas variáveis.
+    """
+    namespace = {"__name__": "sample_module"}
+    exec(compile(source, SAMPLE_PATH, "exec"), namespace)
+    return namespace
+
+
+BASE = """
+CUTOFF = 32
+
+def helper(x):
+    return x * 2
+
+def target(arr, scale=3):
+    return [helper(v) * scale for v in arr[:CUTOFF]]
+"""
+
+
+def test_digest_is_stable():
+    assert function_digest(load(BASE)["target"]) == function_digest(load(BASE)["target"])
+
+
+def test_digest_changes_with_code_globals_defaults_and_callees():
+    base = function_digest(load(BASE)["target"])
+    variants = [
+        BASE.replace("CUTOFF = 32", "CUTOFF = 64"),  # global lido pela função
+        BASE.replace("scale=3", "scale=4"),  # valor padrão
+        BASE.replace("return x * 2", "return x * 3"),  # função chamada
+        BASE.replace("* scale for", "+ scale for"),  # o próprio código
+    ]
+    digests = {function_digest(load(source)["target"]) for source in variants}
+    assert base not in digests and len(digests) == len(variants)
+
+
+def test_digest_ignores_unrelated_functions():
+    source = BASE + "\ndef unrelated():\n    return 1\n"
+    assert function_digest(load(source)["target"]) == function_digest(load(BASE)["target"])
+
+
+def test_digest_is_stable_across_processes():
+    # Sem endereços de memória nem ordem de conjuntos no hash
+    script = (
+        "import sys; sys.path.insert(0, 'BigOComplex');"
+        "from result_cache import function_digest;"
+        "import functions; print(function_digest(functions.natural_merge_sort))"
+    )
+    outputs = {
+        subprocess.run(
+            [sys.executable, "-c", script], cwd=PROJECT_ROOT, capture_output=True,
+            text=True, check=True, env={**os.environ, "PYTHONHASHSEED": str(seed)},
+        ).stdout
+        for seed in (1, 2)
+    }
+    assert len(outputs) == 1
+
+
+def test_result_cache_hits_and_misses(tmp_path):
+    path = str(tmp_path / "cache.json")
+    target = load(BASE)["target"]
+    calls = []
+
+    def measure():
+        calls.append(1)
+        return "O(n)"
+
+    cache = ResultCache(path)
+    assert cache.measure(target, measure, "time", length=100) == ("O(n)", False)
+    assert cache.measure(target, measure, "time", length=100) == ("O(n)", True)
+    assert cache.measure(target, measure, "time", length=200) == ("O(n)", False)
+    assert cache.measure(target, measure, "space", length=100) == ("O(n)", False)
+
+    # Persistido em disco
+    assert ResultCache(path).measure(target, measure, "time", length=100)[1] is True
+    # Código alterado invalida o resultado
+    changed = load(BASE.replace("CUTOFF = 32", "CUTOFF = 33"))["target"]
+    assert ResultCache(path).measure(changed, measure, "time", length=100)[1] is False
+    # `force` mede novamente
+    assert ResultCache(path, force=True).measure(changed, measure, "time", length=100)[1] is False
+    assert len(calls) == 5
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Testes do índice de Eytzinger (BigOComplex/search_index.py) contra `bisect`.
+"""
+
+import bisect
+import os
+import random
+import sys
+
+# Adicionar o diretório BigOComplex ao path
+sys.path.append(os.path.join(os.path.dirname(__file__), "BigOComplex"))
+
+import numpy as np
+import pytest
+
+from search_index import EytzingerIndex
+
+
+def expected(arr, target):
+    i = bisect.bisect_left(arr, target)
+    return i if i < len(arr) and arr[i] == target else -1
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 7, 8, 1000, 1023, 1025])
+def test_matches_bisect(n):
+    rng = random.Random(n)
+    arr = sorted(rng.randint(-n, n) for _ in range(n))
+    targets = list(range(-n - 2, n + 3))
+    index = EytzingerIndex(arr)
+
+    assert index.search_many(targets).tolist() == [expected(arr, t) for t in targets]
+    assert index.lower_bound_many(targets).tolist() == [
+        bisect.bisect_left(arr, t) for t in targets
+    ]
+
+
+def test_scalar_empty_and_out_of_range_targets():
+    arr = [-5, -1, 0, 3, 3, 9]
+    index = EytzingerIndex(arr)
+
+    assert index.search_many(3) == 3
+    assert isinstance(index.search_many(np.int64(-5)), int)
+    assert index.search(9) == 5
+    assert index.search(4) == -1
+
+    result = index.search_many([])
+    assert result.shape == (0,)
+
+    assert index.search_many([-100, 100, -6, 10]).tolist() == [-1, -1, -1, -1]
+    assert EytzingerIndex([]).search_many(1) == -1
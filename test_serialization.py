@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Testes da serialização binária de inteiros (write_int / read_int / dumps_int /
+loads_int em main.py).
+"""
+
+import mmap
+import random
+from multiprocessing import shared_memory
+
+import pytest
+
+from main import INT_HEADER, INT_LIMB_BYTES, dumps_int, int_nbytes, loads_int, read_int, write_int
+
+
+def values():
+    rng = random.Random(0)
+    yield from [0, 1, -1, 255, 256, -256, 2**63 - 1, -(2**63), 2**64, -(2**64) - 1]
+    for bits in (7, 8, 63, 64, 65, 1000, 4096, 100_003):
+        v = rng.getrandbits(bits) | (1 << (bits - 1))
+        yield v
+        yield -v
+
+
+@pytest.mark.parametrize("value", list(values()), ids=lambda v: f"{v.bit_length()}bits")
+def test_round_trip(value):
+    data = dumps_int(value)
+    assert len(data) == int_nbytes(value)
+    assert (len(data) - INT_HEADER.size) % INT_LIMB_BYTES == 0
+    assert loads_int(data) == value
+    assert read_int(memoryview(data)) == (value, len(data))
+
+
+def test_consecutive_values_in_one_buffer():
+    items = list(values())
+    buffer = bytearray(sum(int_nbytes(v) for v in items))
+    offset = 0
+    for v in items:
+        offset = write_int(buffer, offset, v)
+    assert offset == len(buffer)
+
+    offset = 0
+    for v in items:
+        value, offset = read_int(buffer, offset)
+        assert value == v
+
+
+def test_shared_memory_and_mmap():
+    value = -random.Random(1).getrandbits(80_000)
+    shm = shared_memory.SharedMemory(create=True, size=int_nbytes(value))
+    try:
+        write_int(shm.buf, 0, value)
+        assert read_int(shm.buf)[0] == value
+    finally:
+        shm.close()
+        shm.unlink()
+
+    with mmap.mmap(-1, int_nbytes(value)) as m:
+        write_int(m, 0, value)
+        assert read_int(m)[0] == value